@@ -5,7 +5,7 @@ import os
 import pty
 import select
 import time
-from src.config.reset_times import update_reset_time, format_reset_for_display
+from src.config.reset_times import update_reset_times_batch, format_reset_for_display, load_reset_times
 from src.utils.timezone import get_user_timezone
 #endregion
 
@@ -213,18 +213,21 @@ def capture_limits() -> dict | None:
             # Store parsed reset times for future use
             try:
                 current_tz = get_user_timezone()
-                update_reset_time("session_reset", session_reset, current_tz)
-                update_reset_time("week_reset", week_reset, current_tz)
-                update_reset_time("sonnet_reset", sonnet_reset, current_tz)
+                update_reset_times_batch({
+                    "session_reset": session_reset,
+                    "week_reset": week_reset,
+                    "sonnet_reset": sonnet_reset,
+                }, current_tz)
             except Exception:
                 # Don't fail if storage fails - just use the parsed values
                 pass
 
             # Use stored reset times for display (fall back to parsed if not available)
             try:
-                session_reset_display = format_reset_for_display("session_reset")
-                week_reset_display = format_reset_for_display("week_reset")
-                sonnet_reset_display = format_reset_for_display("sonnet_reset")
+                stored = load_reset_times()
+                session_reset_display = format_reset_for_display("session_reset", stored)
+                week_reset_display = format_reset_for_display("week_reset", stored)
+                sonnet_reset_display = format_reset_for_display("sonnet_reset", stored)
 
                 # Only use stored values if they're valid (not "Not available")
                 if session_reset_display != "Not available":
@@ -4,14 +4,93 @@ Settings command - Interactive settings menu for Claude Goblin.
 Allows users to configure display preferences, colors, and other options.
 All settings are persisted to the database.
 """
+import hashlib
+import os
+import platform
+import socket
 import sys
+import time
 import tty
 import termios
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterator, Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from src.config.defaults import DEFAULT_COLORS, DEFAULT_INTERVALS, DEFAULT_PREFERENCES
+
+
+# Accepted answers for editor prompts (compared after .strip().lower())
+_TRUTHY = frozenset({'yes', 'y', 'true', '1', 'enable', 'enabled'})
+_FALSY = frozenset({'no', 'n', 'false', '0', 'disable', 'disabled'})
+_DEFAULTS = frozenset({'d', 'default'})
+_AUTO = frozenset({'auto', 'a', 'default', 'd'})
+
+# (divisor, suffix) indexed by size_bytes.bit_length() // 10, capped at GB
+_SIZE_UNITS = ((1, "B"), (1024, "KB"), (1024 ** 2, "MB"), (1024 ** 3, "GB"))
+
+# Fixed locations under ~/.claude shown or removed by the reset screens
+_CLAUDE_DIR = Path.home() / ".claude"
+_CLAUDE_PROJECTS = _CLAUDE_DIR / "projects"
+_GIST_TOKEN_FILE = _CLAUDE_DIR / "gist_token.txt"
+
+
+@dataclass(frozen=True)
+class _UserConfigSnapshot:
+    """
+    User config values shown by the Settings screen, read in one pass.
+
+    Attributes:
+        machine_name: Custom machine name, or hostname if not set
+        db_path: Custom database path, or None for auto-detect
+        last_backup_date: Last local backup date (YYYY-MM-DD), or None
+        backup_enabled: Whether automatic backups are enabled
+        backup_keep_monthly: Whether monthly backups are kept permanently
+        backup_retention_days: Number of days to keep backups
+    """
+
+    machine_name: str
+    db_path: Optional[str]
+    last_backup_date: Optional[str]
+    backup_enabled: bool
+    backup_keep_monthly: bool
+    backup_retention_days: int
+
+
+@lru_cache(maxsize=1)
+def _user_config_snapshot() -> _UserConfigSnapshot:
+    """
+    Load the user config file once and cache it until a setting changes.
+
+    Editors that write to the config file must call
+    _user_config_snapshot.cache_clear() so the next redraw sees the change.
+
+    Returns:
+        Snapshot of the config values displayed in Settings
+    """
+    from src.config.user_config import load_config
+
+    config = load_config()
+    machine_name = config.get("machine_name")
+    if not machine_name:
+        try:
+            machine_name = socket.gethostname()
+        except Exception:
+            machine_name = "unknown"
+
+    return _UserConfigSnapshot(
+        machine_name=machine_name,
+        db_path=config.get("db_path"),
+        last_backup_date=config.get("last_backup_date"),
+        backup_enabled=config.get("backup_enabled", True),
+        backup_keep_monthly=config.get("backup_keep_monthly", True),
+        backup_retention_days=config.get("backup_retention_days", 30),
+    )
+
 
 def run(console: Console) -> None:
     """
@@ -21,23 +100,25 @@ def run(console: Console) -> None:
         console: Rich console for rendering
     """
     from src.storage.snapshot_db import load_user_preferences, save_user_preference, DEFAULT_DB_PATH, get_default_db_path
-    from src.config.user_config import get_db_path as get_custom_db_path
-    import socket
+
+    # Config may have changed outside this session (e.g. auto backup)
+    _user_config_snapshot.cache_clear()
 
     try:
         while True:
             # Load current settings
             prefs = load_user_preferences()
+            user_config = _user_config_snapshot()
 
             # Get machine name
             machine_name = prefs.get('machine_name', '') or socket.gethostname()
 
             # Get database path (use custom if set, otherwise auto-detect)
-            custom_db = get_custom_db_path()
+            custom_db = user_config.db_path
             db_path = str(custom_db) if custom_db else str(get_default_db_path())
 
             # Display settings menu
-            _display_settings_menu(console, prefs, machine_name, db_path)
+            _display_settings_menu(console, prefs, machine_name, db_path, user_config)
 
             # Wait for user input
             console.print("\n[dim]Enter setting key to edit ([#ff8800]1-2, 8-9, a-n, e-f, o-p, r[/#ff8800]), [#ff8800]\\[x][/#ff8800] reset to defaults, or [#ff8800]ESC[/#ff8800] to return...[/dim]", end="")
@@ -111,6 +192,71 @@ def run(console: Console) -> None:
         return
 
 
+def _humanize_bytes(size_bytes: int) -> str:
+    """
+    Format a byte count as B/KB/MB/GB.
+
+    Args:
+        size_bytes: Size in bytes
+
+    Returns:
+        e.g. "512 B", "1.50 KB", "2.00 GB"
+    """
+    idx = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1) if size_bytes else 0
+    if idx == 0:
+        return f"{size_bytes} B"
+    divisor, suffix = _SIZE_UNITS[idx]
+    return f"{size_bytes / divisor:.2f} {suffix}"
+
+
+def _parse_int(value: str) -> Optional[int]:
+    """
+    Parse a whole number typed by the user (or read from preferences).
+
+    Surrounding whitespace and a leading '+' or '-' are accepted, matching int().
+
+    Args:
+        value: Text to parse
+
+    Returns:
+        The number, or None if value isn't a plain integer
+    """
+    value = str(value).strip()
+    digits = value[1:] if value[:1] in ('+', '-') else value
+    return int(value) if digits.isdecimal() else None
+
+
+def _confirm(prompt: str, *, strict: bool = False) -> bool:
+    """
+    Ask a yes/no question.
+
+    Args:
+        prompt: Text shown before the cursor
+        strict: Require the full word 'yes' (destructive actions); otherwise 'y' also counts
+
+    Returns:
+        True if the user confirmed
+    """
+    answer = input(prompt).strip().lower()
+    return answer == 'yes' if strict else answer in ('y', 'yes')
+
+
+def _wait_enter(console: Console) -> None:
+    """Show the return hint and wait for Enter."""
+    console.input("\n[dim]Enter를 눌러 돌아가기...[/dim]")
+
+
+def _print_block(console: Console, lines: list[str]) -> None:
+    """
+    Print several lines of markup with a single console.print() call.
+
+    Args:
+        console: Rich console for rendering
+        lines: Lines of Rich markup ("" for a blank line)
+    """
+    console.print("\n".join(lines))
+
+
 def _read_key() -> str:
     """
     Read a single key from stdin.
@@ -142,7 +288,13 @@ def _read_key() -> str:
         return input()
 
 
-def _display_settings_menu(console: Console, prefs: dict, machine_name: str, db_path: str) -> None:
+def _display_settings_menu(
+    console: Console,
+    prefs: dict,
+    machine_name: str,
+    db_path: str,
+    user_config: Optional[_UserConfigSnapshot] = None,
+) -> None:
     """
     Display the settings menu showing all current settings.
 
@@ -151,9 +303,12 @@ def _display_settings_menu(console: Console, prefs: dict, machine_name: str, db_
         prefs: Dictionary of user preferences
         machine_name: Current machine name
         db_path: Current database path
+        user_config: User config snapshot (loaded if not provided)
     """
+    if user_config is None:
+        user_config = _user_config_snapshot()
+
     # Clear screen without affecting scroll buffer
-    import sys
     sys.stdout.write("\033[3J")  # Clear scrollback buffer
     sys.stdout.write("\033[2J")  # Clear visible screen
     sys.stdout.write("\033[H")   # Move cursor to home
@@ -191,9 +346,7 @@ def _display_settings_menu(console: Console, prefs: dict, machine_name: str, db_
     status_table.add_row("Display Timezone", tz_display)
 
     # Machine name (editable with [g])
-    import socket
-    from src.config.user_config import get_machine_name as get_custom_machine_name
-    custom_name = get_custom_machine_name()
+    custom_name = user_config.machine_name
     if custom_name == socket.gethostname():
         machine_display = f"{machine_name} [dim](auto)[/dim]   [#ff8800]\\[g][/#ff8800]"
     else:
@@ -201,8 +354,7 @@ def _display_settings_menu(console: Console, prefs: dict, machine_name: str, db_
     status_table.add_row("Machine Name", machine_display)
 
     # Database path (editable with [h])
-    from src.config.user_config import get_db_path as get_custom_db_path
-    custom_db = get_custom_db_path()
+    custom_db = user_config.db_path
     if custom_db:
         if "OneDrive" in db_path or "CloudDocs" in db_path:
             db_display = f"{db_path}\n[green]✓ Cloud sync[/green]   [#ff8800]\\[h][/#ff8800]"
@@ -232,31 +384,18 @@ def _display_settings_menu(console: Console, prefs: dict, machine_name: str, db_
 
     # Database file size
     try:
-        from pathlib import Path
         db_file = Path(db_path)
         if db_file.exists():
-            size_bytes = db_file.stat().st_size
-            # Format size in human-readable format (KB, MB, GB)
-            if size_bytes < 1024:
-                size_str = f"{size_bytes} B"
-            elif size_bytes < 1024 * 1024:
-                size_str = f"{size_bytes / 1024:.2f} KB"
-            elif size_bytes < 1024 * 1024 * 1024:
-                size_str = f"{size_bytes / (1024 * 1024):.2f} MB"
-            else:
-                size_str = f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
-            status_table.add_row("Database Size", size_str)
+            status_table.add_row("Database Size", _humanize_bytes(db_file.stat().st_size))
         else:
             status_table.add_row("Database Size", "[dim]Not found[/dim]")
     except Exception:
         status_table.add_row("Database Size", "[dim]Unknown[/dim]")
 
     # Local backup information
-    from src.config.user_config import get_last_backup_date
     from src.utils.backup import list_backups, get_backup_directory
-    from pathlib import Path
 
-    last_backup = get_last_backup_date()
+    last_backup = user_config.last_backup_date
     try:
         backups = list_backups(Path(db_path))
         backup_count = len(backups)
@@ -304,7 +443,6 @@ def _display_settings_menu(console: Console, prefs: dict, machine_name: str, db_
     console.print()
 
     # Settings section (editable)
-    from src.config.defaults import DEFAULT_COLORS, DEFAULT_INTERVALS
 
     settings_table = Table(show_header=True, box=None, padding=(0, 2))
     settings_table.add_column("#", style="dim", justify="right", width=5)
@@ -340,19 +478,13 @@ def _display_settings_menu(console: Console, prefs: dict, machine_name: str, db_
     settings_table.add_row("[#ff8800][9][/#ff8800]", "File Watch Interval (sec)", watch_interval)
 
     # Backup settings
-    from src.config.user_config import (
-        get_backup_enabled,
-        get_backup_keep_monthly,
-        get_backup_retention_days,
-    )
-
-    backup_enabled = get_backup_enabled()
+    backup_enabled = user_config.backup_enabled
     settings_table.add_row("[#ff8800]\\[a][/#ff8800]", "Auto Backup", "Enabled" if backup_enabled else "Disabled")
 
-    keep_monthly = get_backup_keep_monthly()
+    keep_monthly = user_config.backup_keep_monthly
     settings_table.add_row("[#ff8800]\\[b][/#ff8800]", "Keep Monthly Backups", "Yes" if keep_monthly else "No")
 
-    retention_days = get_backup_retention_days()
+    retention_days = user_config.backup_retention_days
     settings_table.add_row("[#ff8800]\\[c][/#ff8800]", "Backup Retention (days)", str(retention_days))
 
     # Timezone setting
@@ -363,7 +495,6 @@ def _display_settings_menu(console: Console, prefs: dict, machine_name: str, db_
     settings_table.add_row("[#ff8800]\\[d][/#ff8800]", "Display Timezone", tz_value)
 
     # Exclude Haiku Messages
-    from src.config.defaults import DEFAULT_PREFERENCES
     exclude_haiku = prefs.get('exclude_haiku_messages', DEFAULT_PREFERENCES['exclude_haiku_messages'])
     exclude_haiku_display = "Enabled" if exclude_haiku == "1" else "Disabled"
     settings_table.add_row("[#ff8800]\\[j][/#ff8800]", "Exclude Haiku Messages", exclude_haiku_display)
@@ -440,7 +571,6 @@ def _edit_setting(console: Console, setting_num: int, prefs: dict, save_func) ->
         prefs: Current preferences dictionary
         save_func: Function to save preference
     """
-    from src.config.defaults import DEFAULT_COLORS, DEFAULT_INTERVALS
 
     setting_map = {
         1: ('color_solid', 'Solid Color', DEFAULT_COLORS['color_solid']),
@@ -502,13 +632,11 @@ def _edit_setting(console: Console, setting_num: int, prefs: dict, save_func) ->
         # Color input
         console.print("[dim]Enter hex color (e.g., #00A7E1), 'd' for default, or press Enter to keep current:[/dim]")
         try:
-            sys.stdout.write("> ")
-            sys.stdout.flush()
-            new_value = input().strip()
+            new_value = input("> ").strip()
 
             if new_value:
                 # Check for default reset
-                if new_value.lower() in ['d', 'default']:
+                if new_value.lower() in _DEFAULTS:
                     from src.storage.snapshot_db import delete_user_preference
                     delete_user_preference(key)
                     console.print(f"[green]✓ {name} reset to default: {default}[/green]")
@@ -529,13 +657,11 @@ def _edit_setting(console: Console, setting_num: int, prefs: dict, save_func) ->
         # Interval input (8, 9)
         console.print("[dim]Enter interval in seconds (minimum 10), 'd' for default, or press Enter to keep current:[/dim]")
         try:
-            sys.stdout.write("> ")
-            sys.stdout.flush()
-            new_value = input().strip()
+            new_value = input("> ").strip()
 
             if new_value:
                 # Check for default reset
-                if new_value.lower() in ['d', 'default']:
+                if new_value.lower() in _DEFAULTS:
                     from src.storage.snapshot_db import delete_user_preference
                     delete_user_preference(key)
                     console.print(f"[green]✓ {name} reset to default: {default} seconds[/green]")
@@ -614,17 +740,15 @@ def _edit_backup_setting(console: Console, setting_num: int) -> None:
         console.print("[dim]Enter 'yes' to enable, 'no' to disable, 'd' for default, or press Enter to keep current:[/dim]")
 
         try:
-            sys.stdout.write("> ")
-            sys.stdout.flush()
-            new_value = input().strip().lower()
+            new_value = input("> ").strip().lower()
 
-            if new_value in ['d', 'default']:
+            if new_value in _DEFAULTS:
                 set_backup_enabled(True)
                 console.print("[green]✓ Auto Backup reset to default: Enabled[/green]")
-            elif new_value in ['yes', 'y', 'true', '1']:
+            elif new_value in _TRUTHY:
                 set_backup_enabled(True)
                 console.print("[green]✓ Auto Backup enabled[/green]")
-            elif new_value in ['no', 'n', 'false', '0']:
+            elif new_value in _FALSY:
                 set_backup_enabled(False)
                 console.print("[green]✓ Auto Backup disabled[/green]")
         except (EOFError, KeyboardInterrupt):
@@ -640,17 +764,15 @@ def _edit_backup_setting(console: Console, setting_num: int) -> None:
         console.print("[dim]Enter 'yes', 'no', 'd' for default, or press Enter to keep current:[/dim]")
 
         try:
-            sys.stdout.write("> ")
-            sys.stdout.flush()
-            new_value = input().strip().lower()
+            new_value = input("> ").strip().lower()
 
-            if new_value in ['d', 'default']:
+            if new_value in _DEFAULTS:
                 set_backup_keep_monthly(True)
                 console.print("[green]✓ Keep Monthly Backups reset to default: Yes[/green]")
-            elif new_value in ['yes', 'y', 'true', '1']:
+            elif new_value in _TRUTHY:
                 set_backup_keep_monthly(True)
                 console.print("[green]✓ Monthly backups will be kept permanently[/green]")
-            elif new_value in ['no', 'n', 'false', '0']:
+            elif new_value in _FALSY:
                 set_backup_keep_monthly(False)
                 console.print("[green]✓ Monthly backups will be deleted after retention period[/green]")
         except (EOFError, KeyboardInterrupt):
@@ -665,12 +787,10 @@ def _edit_backup_setting(console: Console, setting_num: int) -> None:
         console.print("[dim]Enter number of days (minimum 1), 'd' for default, or press Enter to keep current:[/dim]")
 
         try:
-            sys.stdout.write("> ")
-            sys.stdout.flush()
-            new_value = input().strip()
+            new_value = input("> ").strip()
 
             if new_value:
-                if new_value.lower() in ['d', 'default']:
+                if new_value.lower() in _DEFAULTS:
                     set_backup_retention_days(30)
                     console.print("[green]✓ Backup retention reset to default: 30 days[/green]")
                 else:
@@ -686,6 +806,9 @@ def _edit_backup_setting(console: Console, setting_num: int) -> None:
         except (EOFError, KeyboardInterrupt):
             console.print("\n[yellow]Input cancelled[/yellow]")
 
+    # Config file may have changed
+    _user_config_snapshot.cache_clear()
+
     console.print("\n[dim]Press any key to continue...[/dim]")
     _read_key()
 
@@ -725,15 +848,13 @@ def _edit_timezone_setting(console: Console, prefs: dict, save_func) -> None:
     console.print()
 
     try:
-        sys.stdout.write("> ")
-        sys.stdout.flush()
-        choice = input().strip()
+        choice = input("> ").strip()
 
         if not choice:
             # Keep current
             return
 
-        if choice.lower() in ['d', 'default']:
+        if choice.lower() in _DEFAULTS:
             # Reset to default (Auto) by deleting from database
             from src.storage.snapshot_db import delete_user_preference
             delete_user_preference('timezone')
@@ -762,9 +883,7 @@ def _edit_timezone_setting(console: Console, prefs: dict, save_func) -> None:
             console.print()
             console.print("[dim]Enter number (1-{}) or custom IANA timezone name:[/dim]".format(len(common_tzs)))
 
-            sys.stdout.write("> ")
-            sys.stdout.flush()
-            tz_choice = input().strip()
+            tz_choice = input("> ").strip()
 
             if tz_choice.isdigit():
                 # Numeric selection
@@ -803,85 +922,101 @@ def _edit_color_range_setting(console: Console, setting_num: int, prefs: dict, s
         prefs: Current preferences dictionary
         save_func: Function to save preference
     """
-    from src.config.defaults import DEFAULT_COLORS
 
-    console.print()
+    # Resolve both bounds once - each branch validates against the other one
+    default_low = DEFAULT_COLORS.get('color_range_low', '60')
+    default_high = DEFAULT_COLORS.get('color_range_high', '85')
+    cur_low = prefs.get('color_range_low', default_low)
+    cur_high = prefs.get('color_range_high', default_high)
+    # A malformed stored bound falls back to its default
+    color_range_low = _parse_int(cur_low)
+    if color_range_low is None:
+        color_range_low = int(default_low)
+    color_range_high = _parse_int(cur_high)
+    if color_range_high is None:
+        color_range_high = int(default_high)
 
     if setting_num == 14:
         # Color Range Low
-        current = prefs.get('color_range_low', DEFAULT_COLORS.get('color_range_low', '60'))
-        default = DEFAULT_COLORS.get('color_range_low', '60')
-        console.print("[bold]Edit Color Range Low (%)[/bold]")
-        console.print(f"[dim]Current value: {current}%[/dim]")
-        console.print(f"[dim]Default value: {default}%[/dim]")
-        console.print("[dim]This sets the upper bound for 'Low' gradient (0-X%).[/dim]")
-        console.print("[dim]Enter percentage (1-99), 'd' for default, or press Enter to keep current:[/dim]")
+        current = cur_low
+        default = default_low
+        _print_block(console, [
+            "",
+            "[bold]Edit Color Range Low (%)[/bold]",
+            f"[dim]Current value: {current}%[/dim]",
+            f"[dim]Default value: {default}%[/dim]",
+            "[dim]This sets the upper bound for 'Low' gradient (0-X%).[/dim]",
+            "[dim]Enter percentage (1-99), 'd' for default, or press Enter to keep current:[/dim]",
+        ])
 
         try:
-            sys.stdout.write("> ")
-            sys.stdout.flush()
-            new_value = input().strip()
+            new_value = input("> ").strip()
 
             if new_value:
-                if new_value.lower() in ['d', 'default']:
+                percent = _parse_int(new_value)
+                if new_value.lower() in _DEFAULTS:
                     from src.storage.snapshot_db import delete_user_preference
                     delete_user_preference('color_range_low')
-                    console.print(f"[green]✓ Color Range Low reset to default: {default}%[/green]")
-                    console.print(f"[dim]  (Using value from src/config/defaults.py)[/dim]")
+                    _print_block(console, [
+                        f"[green]✓ Color Range Low reset to default: {default}%[/green]",
+                        "[dim]  (Using value from src/config/defaults.py)[/dim]",
+                    ])
+                elif percent is None:
+                    console.print("[red]✗ Invalid number. Enter a number or 'd' for default[/red]")
                 else:
-                    try:
-                        percent = int(new_value)
-                        color_range_high = int(prefs.get('color_range_high', DEFAULT_COLORS.get('color_range_high', '85')))
-                        if 1 <= percent <= 99 and percent < color_range_high:
-                            save_func('color_range_low', str(percent))
-                            console.print(f"[green]✓ Color Range Low set to {percent}%[/green]")
-                            console.print(f"[dim]  Gradient Low: 0-{percent}%[/dim]")
-                            console.print(f"[dim]  Gradient Mid: {percent}-{color_range_high}%[/dim]")
-                        elif percent >= color_range_high:
-                            console.print(f"[red]✗ Must be less than Color Range High ({color_range_high}%)[/red]")
-                        else:
-                            console.print("[red]✗ Percentage must be between 1 and 99[/red]")
-                    except ValueError:
-                        console.print("[red]✗ Invalid number. Enter a number or 'd' for default[/red]")
+                    if 1 <= percent <= 99 and percent < color_range_high:
+                        save_func('color_range_low', str(percent))
+                        console.print(Text.assemble(
+                            (f"✓ Color Range Low set to {percent}%\n", "green"),
+                            (f"  Gradient Low: 0-{percent}%\n", "dim"),
+                            (f"  Gradient Mid: {percent}-{color_range_high}%", "dim"),
+                        ))
+                    elif percent >= color_range_high:
+                        console.print(f"[red]✗ Must be less than Color Range High ({color_range_high}%)[/red]")
+                    else:
+                        console.print("[red]✗ Percentage must be between 1 and 99[/red]")
         except (EOFError, KeyboardInterrupt):
             console.print("\n[yellow]Input cancelled[/yellow]")
 
     elif setting_num == 15:
         # Color Range High
-        current = prefs.get('color_range_high', DEFAULT_COLORS.get('color_range_high', '85'))
-        default = DEFAULT_COLORS.get('color_range_high', '85')
-        console.print("[bold]Edit Color Range High (%)[/bold]")
-        console.print(f"[dim]Current value: {current}%[/dim]")
-        console.print(f"[dim]Default value: {default}%[/dim]")
-        console.print("[dim]This sets the upper bound for 'Mid' gradient (X-Y%).[/dim]")
-        console.print("[dim]Enter percentage (1-99), 'd' for default, or press Enter to keep current:[/dim]")
+        current = cur_high
+        default = default_high
+        _print_block(console, [
+            "",
+            "[bold]Edit Color Range High (%)[/bold]",
+            f"[dim]Current value: {current}%[/dim]",
+            f"[dim]Default value: {default}%[/dim]",
+            "[dim]This sets the upper bound for 'Mid' gradient (X-Y%).[/dim]",
+            "[dim]Enter percentage (1-99), 'd' for default, or press Enter to keep current:[/dim]",
+        ])
 
         try:
-            sys.stdout.write("> ")
-            sys.stdout.flush()
-            new_value = input().strip()
+            new_value = input("> ").strip()
 
             if new_value:
-                if new_value.lower() in ['d', 'default']:
+                percent = _parse_int(new_value)
+                if new_value.lower() in _DEFAULTS:
                     from src.storage.snapshot_db import delete_user_preference
                     delete_user_preference('color_range_high')
-                    console.print(f"[green]✓ Color Range High reset to default: {default}%[/green]")
-                    console.print(f"[dim]  (Using value from src/config/defaults.py)[/dim]")
+                    _print_block(console, [
+                        f"[green]✓ Color Range High reset to default: {default}%[/green]",
+                        "[dim]  (Using value from src/config/defaults.py)[/dim]",
+                    ])
+                elif percent is None:
+                    console.print("[red]✗ Invalid number. Enter a number or 'd' for default[/red]")
                 else:
-                    try:
-                        percent = int(new_value)
-                        color_range_low = int(prefs.get('color_range_low', DEFAULT_COLORS.get('color_range_low', '60')))
-                        if 1 <= percent <= 99 and percent > color_range_low:
-                            save_func('color_range_high', str(percent))
-                            console.print(f"[green]✓ Color Range High set to {percent}%[/green]")
-                            console.print(f"[dim]  Gradient Mid: {color_range_low}-{percent}%[/dim]")
-                            console.print(f"[dim]  Gradient High: {percent}-100%[/dim]")
-                        elif percent <= color_range_low:
-                            console.print(f"[red]✗ Must be greater than Color Range Low ({color_range_low}%)[/red]")
-                        else:
-                            console.print("[red]✗ Percentage must be between 1 and 99[/red]")
-                    except ValueError:
-                        console.print("[red]✗ Invalid number. Enter a number or 'd' for default[/red]")
+                    if 1 <= percent <= 99 and percent > color_range_low:
+                        save_func('color_range_high', str(percent))
+                        console.print(Text.assemble(
+                            (f"✓ Color Range High set to {percent}%\n", "green"),
+                            (f"  Gradient Mid: {color_range_low}-{percent}%\n", "dim"),
+                            (f"  Gradient High: {percent}-100%", "dim"),
+                        ))
+                    elif percent <= color_range_low:
+                        console.print(f"[red]✗ Must be greater than Color Range Low ({color_range_low}%)[/red]")
+                    else:
+                        console.print("[red]✗ Percentage must be between 1 and 99[/red]")
         except (EOFError, KeyboardInterrupt):
             console.print("\n[yellow]Input cancelled[/yellow]")
 
@@ -898,48 +1033,52 @@ def _edit_exclude_haiku_setting(console: Console, prefs: dict, save_func) -> Non
         prefs: Current preferences dictionary
         save_func: Function to save preference
     """
-    from src.config.defaults import DEFAULT_PREFERENCES
-
-    console.print()
-    console.print("[bold]Edit Exclude Haiku Messages[/bold]")
-    console.print()
 
     current = prefs.get('exclude_haiku_messages', DEFAULT_PREFERENCES['exclude_haiku_messages'])
     current_display = "Enabled" if current == "1" else "Disabled"
     default = DEFAULT_PREFERENCES['exclude_haiku_messages']
     default_display = "Enabled" if default == "1" else "Disabled"
 
-    console.print(f"[dim]Current value: {current_display}[/dim]")
-    console.print(f"[dim]Default value: {default_display}[/dim]")
-    console.print()
-    console.print("[dim]When enabled, Haiku model messages are excluded from output displays.[/dim]")
-    console.print("[dim]This affects statistics and visualizations across all views.[/dim]")
-    console.print()
-    console.print("[dim]Enter 'yes' to enable, 'no' to disable, 'd' for default, or press Enter to keep current:[/dim]")
+    _print_block(console, [
+        "",
+        "[bold]Edit Exclude Haiku Messages[/bold]",
+        "",
+        f"[dim]Current value: {current_display}[/dim]",
+        f"[dim]Default value: {default_display}[/dim]",
+        "",
+        "[dim]When enabled, Haiku model messages are excluded from output displays.[/dim]",
+        "[dim]This affects statistics and visualizations across all views.[/dim]",
+        "",
+        "[dim]Enter 'yes' to enable, 'no' to disable, 'd' for default, or press Enter to keep current:[/dim]",
+    ])
 
     try:
-        sys.stdout.write("> ")
-        sys.stdout.flush()
-        new_value = input().strip().lower()
+        new_value = input("> ").strip().lower()
 
         if not new_value:
             # Keep current
             return
 
-        if new_value in ['d', 'default']:
+        if new_value in _DEFAULTS:
             # Reset to default by deleting from database
             from src.storage.snapshot_db import delete_user_preference
             delete_user_preference('exclude_haiku_messages')
-            console.print(f"[green]✓ Exclude Haiku Messages reset to default: {default_display}[/green]")
-            console.print(f"[dim]  (Using value from src/config/defaults.py)[/dim]")
-        elif new_value in ['yes', 'y', 'true', '1', 'enable', 'enabled']:
+            _print_block(console, [
+                f"[green]✓ Exclude Haiku Messages reset to default: {default_display}[/green]",
+                "[dim]  (Using value from src/config/defaults.py)[/dim]",
+            ])
+        elif new_value in _TRUTHY:
             save_func('exclude_haiku_messages', '1')
-            console.print("[green]✓ Exclude Haiku Messages enabled[/green]")
-            console.print("[dim]  Haiku messages will be excluded from all displays[/dim]")
-        elif new_value in ['no', 'n', 'false', '0', 'disable', 'disabled']:
+            _print_block(console, [
+                "[green]✓ Exclude Haiku Messages enabled[/green]",
+                "[dim]  Haiku messages will be excluded from all displays[/dim]",
+            ])
+        elif new_value in _FALSY:
             save_func('exclude_haiku_messages', '0')
-            console.print("[green]✓ Exclude Haiku Messages disabled[/green]")
-            console.print("[dim]  Haiku messages will be included in displays[/dim]")
+            _print_block(console, [
+                "[green]✓ Exclude Haiku Messages disabled[/green]",
+                "[dim]  Haiku messages will be included in displays[/dim]",
+            ])
         else:
             console.print("[yellow]Invalid input. Please enter 'yes', 'no', or 'd'[/yellow]")
 
@@ -950,6 +1089,26 @@ def _edit_exclude_haiku_setting(console: Console, prefs: dict, save_func) -> Non
     _read_key()
 
 
+# Confirmation banner for _reset_to_defaults (static, so built once)
+_RESET_BANNER = """
+[bold yellow]Reset All Settings to Defaults[/bold yellow]
+
+[dim]This will reset the following settings to their default values:[/dim]
+[dim]  • Color settings (Solid, Unfilled)[/dim]
+[dim]  • Model Pricing (loaded from src/config/defaults.py)[/dim]
+[dim]  • Auto Refresh Interval (30 seconds)[/dim]
+[dim]  • File Watch Interval (60 seconds)[/dim]
+[dim]  • Auto Backup (Enabled)[/dim]
+[dim]  • Keep Monthly Backups (Yes)[/dim]
+[dim]  • Backup Retention (30 days)[/dim]
+[dim]  • Display Timezone (Auto)[/dim]
+
+[dim]After reset, default values from src/config/defaults.py will be used.[/dim]
+
+[yellow]Are you sure? This will delete all your custom settings.[/yellow]
+[dim]Type 'yes' to confirm or press Enter to cancel:[/dim]"""
+
+
 def _reset_to_defaults(console: Console, save_func) -> None:
     """
     Reset all settings to default values by deleting from database.
@@ -961,30 +1120,10 @@ def _reset_to_defaults(console: Console, save_func) -> None:
         console: Rich console for rendering
         save_func: Function to save preferences (unused, kept for signature compatibility)
     """
-    console.print()
-    console.print("[bold yellow]Reset All Settings to Defaults[/bold yellow]")
-    console.print()
-    console.print("[dim]This will reset the following settings to their default values:[/dim]")
-    console.print("[dim]  • Color settings (Solid, Unfilled)[/dim]")
-    console.print("[dim]  • Model Pricing (loaded from src/config/defaults.py)[/dim]")
-    console.print("[dim]  • Auto Refresh Interval (30 seconds)[/dim]")
-    console.print("[dim]  • File Watch Interval (60 seconds)[/dim]")
-    console.print("[dim]  • Auto Backup (Enabled)[/dim]")
-    console.print("[dim]  • Keep Monthly Backups (Yes)[/dim]")
-    console.print("[dim]  • Backup Retention (30 days)[/dim]")
-    console.print("[dim]  • Display Timezone (Auto)[/dim]")
-    console.print()
-    console.print("[dim]After reset, default values from src/config/defaults.py will be used.[/dim]")
-    console.print()
-    console.print("[yellow]Are you sure? This will delete all your custom settings.[/yellow]")
-    console.print("[dim]Type 'yes' to confirm or press Enter to cancel:[/dim]")
+    console.print(_RESET_BANNER)
 
     try:
-        sys.stdout.write("> ")
-        sys.stdout.flush()
-        confirmation = input().strip().lower()
-
-        if confirmation == 'yes':
+        if _confirm("> ", strict=True):
             # Delete all user preferences from database
             # This makes defaults.py values apply automatically
             from src.storage.snapshot_db import delete_user_preferences
@@ -1005,16 +1144,20 @@ def _reset_to_defaults(console: Console, save_func) -> None:
             from src.storage.snapshot_db import reset_pricing_to_defaults
             reset_pricing_to_defaults()
 
-            console.print()
-            console.print("[green]✓ All settings have been reset to defaults[/green]")
-            console.print("[green]  Defaults from src/config/defaults.py will now be used[/green]")
+            _print_block(console, [
+                "",
+                "[green]✓ All settings have been reset to defaults[/green]",
+                "[green]  Defaults from src/config/defaults.py will now be used[/green]",
+            ])
         else:
-            console.print()
-            console.print("[yellow]Reset cancelled[/yellow]")
+            _print_block(console, ["", "[yellow]Reset cancelled[/yellow]"])
 
     except (EOFError, KeyboardInterrupt):
         console.print("\n[yellow]Reset cancelled[/yellow]")
 
+    # Config file may have changed
+    _user_config_snapshot.cache_clear()
+
     console.print("\n[dim]Press any key to continue...[/dim]")
     _read_key()
 
@@ -1026,33 +1169,28 @@ def _edit_machine_name(console: Console) -> None:
     Args:
         console: Rich console for rendering
     """
-    import socket
     from src.config.user_config import get_machine_name, set_machine_name, clear_machine_name
 
-    console.print()
-    console.print("[bold]Edit Machine Name[/bold]")
-    console.print()
-
     current = get_machine_name()
     hostname = socket.gethostname()
-
-    if current == hostname:
-        console.print(f"[dim]Current: {current} (auto-detected)[/dim]")
-    else:
-        console.print(f"[dim]Current: {current} (custom)[/dim]")
-
-    console.print(f"[dim]System hostname: {hostname}[/dim]")
-    console.print()
-    console.print("[dim]Enter a custom name, 'auto' to use hostname, or press Enter to keep current:[/dim]")
-    console.print("[dim]Examples: Home-Desktop, Work-Laptop, Gaming-PC[/dim]")
+    source = "auto-detected" if current == hostname else "custom"
+
+    _print_block(console, [
+        "",
+        "[bold]Edit Machine Name[/bold]",
+        "",
+        f"[dim]Current: {current} ({source})[/dim]",
+        f"[dim]System hostname: {hostname}[/dim]",
+        "",
+        "[dim]Enter a custom name, 'auto' to use hostname, or press Enter to keep current:[/dim]",
+        "[dim]Examples: Home-Desktop, Work-Laptop, Gaming-PC[/dim]",
+    ])
 
     try:
-        sys.stdout.write("> ")
-        sys.stdout.flush()
-        new_value = input().strip()
+        new_value = input("> ").strip()
 
         if new_value:
-            if new_value.lower() in ['auto', 'a', 'default', 'd']:
+            if new_value.lower() in _AUTO:
                 clear_machine_name()
                 console.print(f"[green]✓ Machine name set to auto: {hostname}[/green]")
             else:
@@ -1061,10 +1199,44 @@ def _edit_machine_name(console: Console) -> None:
     except (EOFError, KeyboardInterrupt):
         console.print("\n[yellow]Input cancelled[/yellow]")
 
+    # Config file may have changed
+    _user_config_snapshot.cache_clear()
+    _invalidate_gist_cache()  # SyncManager captured the old machine name
+
     console.print("\n[dim]Press any key to continue...[/dim]")
     _read_key()
 
 
+@lru_cache(maxsize=1)
+def _detect_cloud_db_candidate() -> Optional[Path]:
+    """
+    Detect a OneDrive (WSL2) or iCloud (macOS) folder to suggest for the database.
+
+    Cached for the session so reopening the editor doesn't re-stat /mnt drives.
+
+    Returns:
+        Suggested database path inside the cloud folder, or None if not found
+    """
+    system = platform.system()
+    if system == "Linux" and "microsoft" in platform.release().lower():
+        # WSL2 - check for OneDrive
+        for drive in ("c", "d", "e"):
+            candidate = f"/mnt/{drive}/OneDrive"
+            if os.path.isdir(candidate):
+                return Path(candidate) / ".claude-goblin" / "usage_history.db"
+        username = os.getenv("USER")
+        if username:
+            candidate = f"/mnt/c/Users/{username}/OneDrive"
+            if os.path.isdir(candidate):
+                return Path(candidate) / ".claude-goblin" / "usage_history.db"
+    elif system == "Darwin":
+        # macOS - check for iCloud
+        icloud_base = Path.home() / "Library" / "Mobile Documents" / "com~apple~CloudDocs"
+        if os.path.isdir(icloud_base):
+            return icloud_base / ".claude-goblin" / "usage_history.db"
+    return None
+
+
 def _edit_database_path(console: Console) -> None:
     """
     Edit database path setting.
@@ -1072,117 +1244,110 @@ def _edit_database_path(console: Console) -> None:
     Args:
         console: Rich console for rendering
     """
-    from pathlib import Path
     from src.config.user_config import get_db_path, set_db_path, clear_db_path
     from src.storage.snapshot_db import DEFAULT_DB_PATH
-    import platform
-    import os
-
-    console.print()
-    console.print("[bold]Edit Database Path[/bold]")
-    console.print()
 
     current = get_db_path()
+    lines = ["", "[bold]Edit Database Path[/bold]", ""]
     if current:
-        console.print(f"[dim]Current: {current} (custom)[/dim]")
+        lines.append(f"[dim]Current: {current} (custom)[/dim]")
     else:
-        console.print(f"[dim]Current: {DEFAULT_DB_PATH} (auto-detected)[/dim]")
-
-    console.print()
-    console.print("[dim]Choose database storage location:[/dim]")
-    console.print()
-
-    # Detect OneDrive/iCloud
-    onedrive_path = None
-    if platform.system() == "Linux" and "microsoft" in platform.release().lower():
-        # WSL2 - check for OneDrive
-        username = os.getenv("USER")
-        for drive in ["c", "d", "e"]:
-            candidate = Path(f"/mnt/{drive}/OneDrive")
-            if candidate.exists():
-                onedrive_path = candidate / ".claude-goblin" / "usage_history.db"
-                break
-        if not onedrive_path and username:
-            candidate = Path(f"/mnt/c/Users/{username}/OneDrive")
-            if candidate.exists():
-                onedrive_path = candidate / ".claude-goblin" / "usage_history.db"
-    elif platform.system() == "Darwin":
-        # macOS - check for iCloud
-        icloud_base = Path.home() / "Library" / "Mobile Documents" / "com~apple~CloudDocs"
-        if icloud_base.exists():
-            onedrive_path = icloud_base / ".claude-goblin" / "usage_history.db"
-
-    # Display options
-    option_num = 1
+        lines.append(f"[dim]Current: {DEFAULT_DB_PATH} (auto-detected)[/dim]")
+    lines += ["", "[dim]Choose database storage location:[/dim]", ""]
+
+    onedrive_path = _detect_cloud_db_candidate()
+
+    local_path = _CLAUDE_DIR / "usage" / "usage_history.db"
+
+    def _use_cloud() -> None:
+        set_db_path(str(onedrive_path))
+        _print_block(console, [
+            "[green]✓ Database path set to OneDrive/iCloud[/green]",
+            "[green]  Multi-device sync enabled[/green]",
+            f"[dim]  Path: {onedrive_path}[/dim]",
+        ])
+
+    def _use_local() -> None:
+        set_db_path(str(local_path))
+        _print_block(console, [
+            "[green]✓ Database path set to local storage[/green]",
+            "[yellow]  Single device only (no cloud sync)[/yellow]",
+            f"[dim]  Path: {local_path}[/dim]",
+        ])
+
+    def _use_custom() -> None:
+        _print_block(console, [
+            "",
+            "[dim]Enter full path to database file:[/dim]",
+            "[dim]Example: /mnt/d/MyFolder/.claude-goblin/usage_history.db[/dim]",
+        ])
+        custom_path = input("> ").strip()
+
+        if custom_path:
+            try:
+                set_db_path(custom_path)
+                _print_block(console, [
+                    "[green]✓ Database path set to custom location[/green]",
+                    f"[dim]  Path: {custom_path}[/dim]",
+                    "",
+                    "[yellow]⚠ Important: You must restart the program to use the new database path.[/yellow]",
+                ])
+            except ValueError as e:
+                console.print(f"[red]✗ Error: {e}[/red]")
+
+    # Display options - numbers shift when no cloud folder is detected,
+    # so map each printed number to its handler while building the menu
+    options: dict[str, Callable[[], None]] = {}
     if onedrive_path:
-        console.print(f"  [green][{option_num}][/green] OneDrive/iCloud Sync (multi-device)")
-        console.print(f"      [dim]{onedrive_path}[/dim]")
-        console.print()
-        option_num += 1
-
-    local_path = Path.home() / ".claude" / "usage" / "usage_history.db"
-    console.print(f"  [yellow][{option_num}][/yellow] Local Storage (single device)")
-    console.print(f"      [dim]{local_path}[/dim]")
-    console.print()
-    option_num += 1
-
-    console.print(f"  [cyan][{option_num}][/cyan] Custom Path")
-    console.print()
-
-    console.print(f"  [dim][auto/a][/dim] Auto-detect (default)")
-    console.print(f"  [dim][Enter][/dim] Keep current")
-    console.print()
+        options[str(len(options) + 1)] = _use_cloud
+        lines += [
+            f"  [green][{len(options)}][/green] OneDrive/iCloud Sync (multi-device)",
+            f"      [dim]{onedrive_path}[/dim]",
+            "",
+        ]
+
+    options[str(len(options) + 1)] = _use_local
+    lines += [
+        f"  [yellow][{len(options)}][/yellow] Local Storage (single device)",
+        f"      [dim]{local_path}[/dim]",
+        "",
+    ]
+
+    options[str(len(options) + 1)] = _use_custom
+    lines += [
+        f"  [cyan][{len(options)}][/cyan] Custom Path",
+        "",
+        "  [dim][auto/a][/dim] Auto-detect (default)",
+        "  [dim][Enter][/dim] Keep current",
+        "",
+    ]
+    _print_block(console, lines)
 
     try:
-        sys.stdout.write("> ")
-        sys.stdout.flush()
-        choice = input().strip().lower()
+        choice = input("> ").strip().lower()
 
         if not choice:
             # Keep current
             return
 
-        if choice in ['auto', 'a', 'default', 'd']:
+        if choice in _AUTO:
             # Auto-detect
             clear_db_path()
-            console.print(f"[green]✓ Database path set to auto-detect[/green]")
-            console.print(f"[dim]  Will use: {DEFAULT_DB_PATH}[/dim]")
-        elif choice == '1' and onedrive_path:
-            # OneDrive/iCloud
-            set_db_path(str(onedrive_path))
-            console.print(f"[green]✓ Database path set to OneDrive/iCloud[/green]")
-            console.print(f"[green]  Multi-device sync enabled[/green]")
-            console.print(f"[dim]  Path: {onedrive_path}[/dim]")
-        elif choice == '2' if onedrive_path else choice == '1':
-            # Local storage
-            set_db_path(str(local_path))
-            console.print(f"[green]✓ Database path set to local storage[/green]")
-            console.print(f"[yellow]  Single device only (no cloud sync)[/yellow]")
-            console.print(f"[dim]  Path: {local_path}[/dim]")
-        elif choice == str(option_num - 1):
-            # Custom path
-            console.print()
-            console.print("[dim]Enter full path to database file:[/dim]")
-            console.print("[dim]Example: /mnt/d/MyFolder/.claude-goblin/usage_history.db[/dim]")
-            sys.stdout.write("> ")
-            sys.stdout.flush()
-            custom_path = input().strip()
-
-            if custom_path:
-                try:
-                    set_db_path(custom_path)
-                    console.print(f"[green]✓ Database path set to custom location[/green]")
-                    console.print(f"[dim]  Path: {custom_path}[/dim]")
-                    console.print()
-                    console.print("[yellow]⚠ Important: You must restart the program to use the new database path.[/yellow]")
-                except ValueError as e:
-                    console.print(f"[red]✗ Error: {e}[/red]")
+            _print_block(console, [
+                "[green]✓ Database path set to auto-detect[/green]",
+                f"[dim]  Will use: {DEFAULT_DB_PATH}[/dim]",
+            ])
+        elif choice in options:
+            options[choice]()
         else:
             console.print("[red]Invalid option[/red]")
 
     except (EOFError, KeyboardInterrupt):
         console.print("\n[yellow]Input cancelled[/yellow]")
 
+    # Config file may have changed
+    _user_config_snapshot.cache_clear()
+
     console.print("\n[dim]Press any key to continue...[/dim]")
     _read_key()
 
@@ -1231,17 +1396,14 @@ def _check_and_sync_data(console: Console) -> None:
         sync_status = check_data_sync_status()
 
     # Display detailed status
-    console.print(f"[cyan]Source Data:[/cyan]")
-    console.print(f"  Records: {sync_status['source_count']:,}")
+    lines = ["[cyan]Source Data:[/cyan]", f"  Records: {sync_status['source_count']:,}"]
     if sync_status['source_latest']:
-        console.print(f"  Latest: {sync_status['source_latest']}")
-    console.print()
-
-    console.print(f"[cyan]Database:[/cyan]")
-    console.print(f"  Records: {sync_status['db_count']:,}")
+        lines.append(f"  Latest: {sync_status['source_latest']}")
+    lines += ["", "[cyan]Database:[/cyan]", f"  Records: {sync_status['db_count']:,}"]
     if sync_status['db_latest']:
-        console.print(f"  Latest: {sync_status['db_latest']}")
-    console.print()
+        lines.append(f"  Latest: {sync_status['db_latest']}")
+    lines.append("")
+    _print_block(console, lines)
 
     # Show sync status
     if sync_status['is_synced']:
@@ -1265,16 +1427,35 @@ def _check_and_sync_data(console: Console) -> None:
                         console.print("[red]Error: No source files found[/red]")
                         return
 
-                    records = parse_all_jsonl_files(jsonl_files)
-
-                if not records:
+                    # Only read records newer than the DB (save_snapshot skips duplicates)
+                    since = sync_status.get('db_latest_ts')
+                    records = parse_all_jsonl_files(jsonl_files, since=since)
+
+                saved = 0
+                if records:
+                    with console.status(f"[bold white]Saving {len(records):,} records to database...", spinner="dots", spinner_style="white"):
+                        saved = save_snapshot(records)
+
+                # Gaps older than the DB's latest record need a full pass
+                full_pass = not since
+                if since and sync_status['db_count'] + saved < sync_status['source_count']:
+                    with console.status("[bold white]Reading all source files...", spinner="dots", spinner_style="white"):
+                        records = parse_all_jsonl_files(jsonl_files)
+                    full_pass = True
+                    if records:
+                        with console.status(f"[bold white]Saving {len(records):,} records to database...", spinner="dots", spinner_style="white"):
+                            saved += save_snapshot(records)
+
+                # Only a full parse coming back empty is an error; an empty
+                # delta just means there's nothing new
+                if full_pass and not records:
                     console.print("[red]Error: No records to sync[/red]")
                     return
 
-                with console.status(f"[bold white]Saving {len(records):,} records to database...", spinner="dots", spinner_style="white"):
-                    save_snapshot(records)
-
-                console.print(f"[green]✓ Successfully synced {len(records):,} records to database[/green]")
+                if saved:
+                    console.print(f"[green]✓ Successfully synced {saved:,} new records to database[/green]")
+                else:
+                    console.print("[green]✓ Database is already up to date (0 new records)[/green]")
 
             except Exception as e:
                 console.print(f"[red]Error during sync: {str(e)}[/red]")
@@ -1294,44 +1475,48 @@ def _edit_weekly_days_setting(console: Console, prefs: dict, save_func) -> None:
         prefs: Current preferences dictionary
         save_func: Function to save preference
     """
-    from src.config.defaults import DEFAULT_PREFERENCES
 
     current = prefs.get('weekly_recommended_days', DEFAULT_PREFERENCES['weekly_recommended_days'])
     default = DEFAULT_PREFERENCES['weekly_recommended_days']
-
-    console.print()
-    console.print(f"[bold]Edit Weekly Recommended Days[/bold]")
-    console.print(f"[dim]Current value: {current} days[/dim]")
-    console.print(f"[dim]Default value: {default} days[/dim]")
-    console.print()
-    console.print("[cyan]This setting controls how daily recommended usage is calculated:[/cyan]")
-    console.print(f"  • Daily target = (100% / {current} days) × elapsed days")
-    console.print(f"  • Example: On day 2, recommended usage = {(200 / int(current)):.1f}%")
-    console.print()
-    console.print("[dim]Enter days (1-7), 'd' for default, or press Enter to keep current:[/dim]")
+    # A malformed or zero stored value falls back to the default for the example
+    current_days = _parse_int(current) or int(default)
+
+    _print_block(console, [
+        "",
+        "[bold]Edit Weekly Recommended Days[/bold]",
+        f"[dim]Current value: {current} days[/dim]",
+        f"[dim]Default value: {default} days[/dim]",
+        "",
+        "[cyan]This setting controls how daily recommended usage is calculated:[/cyan]",
+        f"  • Daily target = (100% / {current} days) × elapsed days",
+        f"  • Example: On day 2, recommended usage = {(200 / current_days):.1f}%",
+        "",
+        "[dim]Enter days (1-7), 'd' for default, or press Enter to keep current:[/dim]",
+    ])
 
     try:
-        sys.stdout.write("> ")
-        sys.stdout.flush()
-        new_value = input().strip()
+        new_value = input("> ").strip()
 
         if new_value:
-            if new_value.lower() in ['d', 'default']:
+            days = _parse_int(new_value)
+            if new_value.lower() in _DEFAULTS:
                 from src.storage.snapshot_db import delete_user_preference
                 delete_user_preference('weekly_recommended_days')
-                console.print(f"[green]✓ Weekly Recommended Days reset to default: {default} days[/green]")
-                console.print(f"[dim]  (Using value from src/config/defaults.py)[/dim]")
+                _print_block(console, [
+                    f"[green]✓ Weekly Recommended Days reset to default: {default} days[/green]",
+                    "[dim]  (Using value from src/config/defaults.py)[/dim]",
+                ])
+            elif days is None:
+                console.print("[red]✗ Invalid number. Enter 1-7 or 'd' for default[/red]")
             else:
-                try:
-                    days = int(new_value)
-                    if 1 <= days <= 7:
-                        save_func('weekly_recommended_days', str(days))
-                        console.print(f"[green]✓ Weekly Recommended Days updated to {days} days[/green]")
-                        console.print(f"[dim]  Daily target = {(100 / days):.1f}% per day[/dim]")
-                    else:
-                        console.print("[red]✗ Days must be between 1 and 7[/red]")
-                except ValueError:
-                    console.print("[red]✗ Invalid number. Enter 1-7 or 'd' for default[/red]")
+                if 1 <= days <= 7:
+                    save_func('weekly_recommended_days', str(days))
+                    console.print(Text.assemble(
+                        (f"✓ Weekly Recommended Days updated to {days} days\n", "green"),
+                        (f"  Daily target = {(100 / days):.1f}% per day", "dim"),
+                    ))
+                else:
+                    console.print("[red]✗ Days must be between 1 and 7[/red]")
     except (EOFError, KeyboardInterrupt):
         console.print("\n[yellow]Input cancelled[/yellow]")
 
@@ -1339,6 +1524,10 @@ def _edit_weekly_days_setting(console: Console, prefs: dict, save_func) -> None:
     _read_key()
 
 
+# Cache for storage mode (TokenManager lookup hits keyring/disk on every Settings refresh)
+_storage_mode_cache = {"key": None, "value": None, "timestamp": 0}
+
+
 def _detect_storage_mode(db_path: str) -> str:
     """
     Detect the storage/sync mode being used.
@@ -1349,7 +1538,13 @@ def _detect_storage_mode(db_path: str) -> str:
     Returns:
         Formatted string indicating the storage mode with icon
     """
-    from pathlib import Path
+
+    # Check cache (30 second TTL)
+    cache_ttl = 30
+    now = time.time()
+
+    if _storage_mode_cache["key"] == db_path and (now - _storage_mode_cache["timestamp"]) < cache_ttl:
+        return _storage_mode_cache["value"]
 
     # Check for Git Gist setup
     gist_configured = False
@@ -1379,70 +1574,104 @@ def _detect_storage_mode(db_path: str) -> str:
     if gist_configured:
         modes.append("[cyan]+ Git Gist[/cyan]")
 
-    return " ".join(modes)
+    result = " ".join(modes)
 
+    # Update cache
+    _storage_mode_cache["key"] = db_path
+    _storage_mode_cache["value"] = result
+    _storage_mode_cache["timestamp"] = now
 
-# Cache for Gist status (to avoid slow API calls on every Settings refresh)
-_gist_status_cache = {"data": None, "timestamp": 0}
+    return result
+
+
+# Token fingerprint for the current minute, so redraws within it skip the
+# keyring read; _invalidate_gist_cache() drops it when the token changes
+_gist_fingerprint_cache = {"bucket": None, "value": ""}
 
 
 def _get_gist_backup_info() -> dict:
     """
     Get Git Gist backup information for display in Settings.
 
+    Results are cached per token for the current minute to avoid slow API
+    calls on every Settings refresh.
+
     Returns:
         Dictionary with Gist status (may have "error" key if not configured/failed)
     """
-    import time
-    from typing import Any, Optional
+    bucket = int(time.time() // 60)
+    if _gist_fingerprint_cache["bucket"] != bucket:
+        try:
+            from src.sync.token_manager import TokenManager
+            token = TokenManager().get_token()
+        except Exception:
+            token = None
 
-    # Check cache (60 second TTL)
-    cache_ttl = 60
-    now = time.time()
+        # Key the cache on a digest so the raw token isn't held by lru_cache
+        _gist_fingerprint_cache["value"] = hashlib.sha256(token.encode()).hexdigest() if token else ""
+        _gist_fingerprint_cache["bucket"] = bucket
 
-    if _gist_status_cache["data"] and (now - _gist_status_cache["timestamp"]) < cache_ttl:
-        return _gist_status_cache["data"]
+    return _get_gist_backup_info_cached(_gist_fingerprint_cache["value"], bucket)
 
-    # Fetch fresh data
-    try:
-        from src.sync.token_manager import TokenManager
-        from src.sync.sync_manager import SyncManager
 
-        # Check if token configured
-        token_manager = TokenManager()
-        if not token_manager.has_token():
-            result = {"error": "not_configured"}
-            _gist_status_cache["data"] = result
-            _gist_status_cache["timestamp"] = now
-            return result
+@lru_cache(maxsize=4)
+def _get_gist_backup_info_cached(token_fingerprint: str, bucket: int) -> dict:
+    """
+    Fetch Gist status for a token; `bucket` is the current minute, giving a 60 s TTL.
+
+    Args:
+        token_fingerprint: SHA-256 of the configured token ("" if none)
+        bucket: int(time.time() // 60)
 
+    Returns:
+        Dictionary with Gist status (may have "error" key if not configured/failed)
+    """
+    if not token_fingerprint:
+        return {"error": "not_configured"}
+
+    try:
         # Get Gist status
-        sync_manager = SyncManager()
-        status = sync_manager.status()
+        status = _get_sync_manager().status()
 
         if "last_gist_sync" in status:
-            result = {
+            return {
                 "last_sync": status["last_gist_sync"],
                 "total_records": status.get("total_records_in_gist", 0),
                 "gist_url": status.get("gist_url"),
                 "total_machines": status.get("manifest", {}).get("total_machines", 0),
                 "total_backups": status.get("manifest", {}).get("total_backups", 0),
             }
-        else:
-            result = {"error": "not_synced"}
-
-        # Update cache
-        _gist_status_cache["data"] = result
-        _gist_status_cache["timestamp"] = now
-
-        return result
+        return {"error": "not_synced"}
 
     except Exception as e:
         # Silently fail - don't break Settings if Gist unavailable
-        result = {"error": "failed", "message": str(e)}
-        _gist_status_cache["data"] = result
-        _gist_status_cache["timestamp"] = now
-        return result
+        return {"error": "failed", "message": str(e)}
+
+
+# SyncManager reused across Settings actions (it caches a GistClient per token)
+_sync_manager_cache = None
+
+
+def _get_sync_manager():
+    """
+    Get the session's SyncManager, creating it on first use.
+
+    Returns:
+        Shared SyncManager instance
+    """
+    global _sync_manager_cache
+    if _sync_manager_cache is None:
+        from src.sync.sync_manager import SyncManager
+        _sync_manager_cache = SyncManager()
+    return _sync_manager_cache
+
+
+def _invalidate_gist_cache() -> None:
+    """Drop cached Gist status and SyncManager so the next use picks up the current token."""
+    global _sync_manager_cache
+    _get_gist_backup_info_cached.cache_clear()
+    _gist_fingerprint_cache["bucket"] = None
+    _sync_manager_cache = None
 
 
 def _gist_setup(console: Console) -> None:
@@ -1458,7 +1687,6 @@ def _gist_setup(console: Console) -> None:
     try:
         from src.sync.token_manager import TokenManager
         from src.sync.gist_client import GistClient
-        from src.sync.sync_manager import SyncManager
 
         # Check if token already exists
         token_manager = TokenManager()
@@ -1481,8 +1709,7 @@ def _gist_setup(console: Console) -> None:
 
         if not token:
             console.print("[yellow]취소되었습니다.[/yellow]")
-            console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-            input()
+            _wait_enter(console)
             return
 
         # Validate token
@@ -1491,56 +1718,50 @@ def _gist_setup(console: Console) -> None:
             client = GistClient(token)
             if not client.test_token():
                 console.print(" [red]✗ 유효하지 않은 토큰[/red]")
-                console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-                input()
+                _wait_enter(console)
                 return
             console.print(" [green]✓ 유효함[/green]")
         except Exception as e:
             console.print(f" [red]✗ 오류: {e}[/red]")
-            console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-            input()
+            _wait_enter(console)
             return
 
         # Save token
         token_manager.set_token(token)
+        _storage_mode_cache["key"] = None  # Show "+ Git Gist" on next refresh
+        _invalidate_gist_cache()
         storage_location = token_manager.get_storage_location()
         console.print(f"[green]✓ 토큰 저장됨:[/green] {storage_location}\n")
 
         # Ask if user wants to do initial sync
         console.print("[bold]초기 동기화를 진행하시겠습니까? (y/N):[/bold]")
-        do_sync = input("> ").strip().lower()
-
-        if do_sync == 'y':
+        if _confirm("> "):
             try:
                 console.print("\n[dim]동기화 중...[/dim]")
-                sync_manager = SyncManager()
+                sync_manager = _get_sync_manager()
                 stats = sync_manager.push()
 
                 console.print(f"\n[green]✓ 동기화 성공![/green]")
                 console.print(f"  Gist ID: {stats['gist_id']}")
                 console.print(f"  레코드: {stats['exported_records']}")
 
-                # Show Gist URL
-                status = sync_manager.status()
-                if status.get("gist_url"):
-                    console.print(f"  URL: {status['gist_url']}")
+                # Show Gist URL (returned by push, no extra API call)
+                if stats.get("gist_url"):
+                    console.print(f"  URL: {stats['gist_url']}")
 
             except Exception as e:
                 console.print(f"\n[red]✗ 동기화 실패: {e}[/red]")
 
         console.print("\n[green]✓ Gist 설정 완료![/green]")
-        console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-        input()
+        _wait_enter(console)
 
     except ImportError:
         console.print("[red]✗ Gist 모듈을 불러올 수 없습니다.[/red]")
         console.print("[dim]Gist 기능이 설치되어 있는지 확인하세요.[/dim]")
-        console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-        input()
+        _wait_enter(console)
     except Exception as e:
         console.print(f"[red]✗ 오류 발생: {e}[/red]")
-        console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-        input()
+        _wait_enter(console)
 
 
 def _gist_sync_menu(console: Console) -> None:
@@ -1555,15 +1776,13 @@ def _gist_sync_menu(console: Console) -> None:
 
     try:
         from src.sync.token_manager import TokenManager
-        from src.sync.sync_manager import SyncManager
 
         # Check if token exists
         token_manager = TokenManager()
         if not token_manager.get_token():
             console.print("[yellow]⚠ GitHub token이 설정되지 않았습니다.[/yellow]")
             console.print("[dim]먼저 [e] Gist Setup을 실행하세요.[/dim]")
-            console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-            input()
+            _wait_enter(console)
             return
 
         # Show sync menu
@@ -1579,7 +1798,8 @@ def _gist_sync_menu(console: Console) -> None:
         if choice == '\x1b':  # ESC
             return
 
-        sync_manager = SyncManager()
+        if choice in ('1', '2', '3'):
+            sync_manager = _get_sync_manager()
 
         if choice == '1':  # Push
             console.print("1")
@@ -1620,17 +1840,14 @@ def _gist_sync_menu(console: Console) -> None:
         else:
             console.print("\n[yellow]잘못된 선택입니다.[/yellow]")
 
-        console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-        input()
+        _wait_enter(console)
 
     except ImportError:
         console.print("[red]✗ Gist 모듈을 불러올 수 없습니다.[/red]")
-        console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-        input()
+        _wait_enter(console)
     except Exception as e:
         console.print(f"[red]✗ 오류 발생: {e}[/red]")
-        console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-        input()
+        _wait_enter(console)
 
 
 def _show_database_info(console: Console) -> None:
@@ -1640,24 +1857,46 @@ def _show_database_info(console: Console) -> None:
     Args:
         console: Rich console for output
     """
-    console.print("\n")
-    console.print("[bold cyan]Database Information[/bold cyan]\n")
+    _print_block(console, ["\n", "[bold cyan]Database Information[/bold cyan]\n"])
 
     try:
         from src.storage.snapshot_db import get_database_stats, DEFAULT_DB_PATH
-        from pathlib import Path
 
         db_path = DEFAULT_DB_PATH
 
         if not db_path.exists():
-            console.print("[yellow]데이터베이스 파일이 존재하지 않습니다.[/yellow]")
-            console.print(f"[dim]경로: {db_path}[/dim]")
-            console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-            input()
+            _print_block(console, [
+                "[yellow]데이터베이스 파일이 존재하지 않습니다.[/yellow]",
+                f"[dim]경로: {db_path}[/dim]",
+            ])
+            _wait_enter(console)
             return
 
-        # Get database stats
-        stats = get_database_stats()
+        def _count_devices_and_projects() -> tuple[int, int]:
+            import sqlite3
+            # Read-only: skips write-lock bookkeeping and can't modify the DB
+            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=30.0)
+            try:
+                conn.execute("PRAGMA mmap_size=268435456")
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT COUNT(DISTINCT machine_name), COUNT(DISTINCT folder)
+                    FROM usage_records
+                """)
+                return cursor.fetchone()
+            finally:
+                conn.close()
+
+        # The stat and both DB reads are independent; overlap them since each
+        # may block on OneDrive/iCloud-backed storage
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            stat_future = executor.submit(db_path.stat)
+            stats_future = executor.submit(get_database_stats)
+            counts_future = executor.submit(_count_devices_and_projects)
+            size_bytes = stat_future.result().st_size
+            stats = stats_future.result()
+            device_count, project_count = counts_future.result()
 
         # Display info
         info_table = Table(show_header=False, box=None, padding=(0, 2))
@@ -1665,47 +1904,65 @@ def _show_database_info(console: Console) -> None:
         info_table.add_column("값", style="cyan")
 
         info_table.add_row("파일 경로", str(db_path))
-
-        # File size
-        size_bytes = db_path.stat().st_size
-        if size_bytes < 1024:
-            size_str = f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            size_str = f"{size_bytes / 1024:.2f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            size_str = f"{size_bytes / (1024 * 1024):.2f} MB"
-        else:
-            size_str = f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
-        info_table.add_row("파일 크기", size_str)
-
+        info_table.add_row("파일 크기", _humanize_bytes(size_bytes))
         info_table.add_row("총 레코드 수", f"{stats['total_records']:,}")
         info_table.add_row("총 일수", str(stats['total_days']))
         info_table.add_row("날짜 범위", f"{stats['oldest_date']} ~ {stats['newest_date']}")
-
-        # Get device count and project count
-        import sqlite3
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(DISTINCT machine_name) FROM usage_snapshots")
-        device_count = cursor.fetchone()[0]
         info_table.add_row("디바이스 수", str(device_count))
-
-        cursor.execute("SELECT COUNT(DISTINCT project_path) FROM usage_snapshots")
-        project_count = cursor.fetchone()[0]
         info_table.add_row("프로젝트 수", str(project_count))
 
-        conn.close()
-
         console.print(Panel(info_table, title="[bold]Database Statistics", border_style="cyan"))
-
-        console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-        input()
+        _wait_enter(console)
 
     except Exception as e:
         console.print(f"[red]✗ 오류 발생: {e}[/red]")
-        console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-        input()
+        _wait_enter(console)
+
+
+# (path substring, label) checked in order by _storage_mode_label
+_STORAGE_MODE_TABLE = (
+    ("OneDrive", "OneDrive Sync"),
+    ("CloudDocs", "iCloud Sync"),
+    ("iCloud", "iCloud Sync"),
+)
+
+
+@lru_cache(maxsize=8)
+def _storage_mode_label(db_path: str) -> str:
+    """
+    Name the sync provider a database path lives under, for the reset screens.
+
+    Args:
+        db_path: Path to the database file
+
+    Returns:
+        "OneDrive Sync", "iCloud Sync" or "Local"
+    """
+    return next((label for needle, label in _STORAGE_MODE_TABLE if needle in db_path), "Local")
+
+
+def _iter_backups(backup_dir: Path) -> Iterator[Path]:
+    """
+    Yield database backup files in a directory without building a list.
+
+    Matches *.db.bak and usage_history_backup_*.db. Names are filtered before
+    the dirent-backed is_file() check, since a stat can hydrate files on
+    OneDrive/iCloud.
+
+    Args:
+        backup_dir: Directory containing the database
+
+    Yields:
+        Path of each backup file
+    """
+    with os.scandir(backup_dir) as entries:
+        for e in entries:
+            name = e.name
+            is_backup = name.endswith(".db.bak") or (
+                name.startswith("usage_history_backup_") and name.endswith(".db")
+            )
+            if is_backup and e.is_file():
+                yield Path(e.path)
 
 
 def _reset_database(console: Console) -> None:
@@ -1715,119 +1972,166 @@ def _reset_database(console: Console) -> None:
     Args:
         console: Rich console for output
     """
-    from src.storage.snapshot_db import DEFAULT_DB_PATH, get_database_stats
+    import sqlite3
+    from src.storage.snapshot_db import DEFAULT_DB_PATH, clear_database, get_database_stats
     from src.config.user_config import get_db_path
-    from pathlib import Path
 
-    console.print("\n")
-    console.print("[bold yellow]⚠ Database Reset[/bold yellow]\n")
 
     # 현재 DB 경로 및 스토리지 모드
     custom_db_path = get_db_path()
     db_path = Path(custom_db_path) if custom_db_path else DEFAULT_DB_PATH
-    db_path_str = str(db_path)
-
-    if "OneDrive" in db_path_str:
-        storage_mode = "OneDrive Sync"
-    elif "CloudDocs" in db_path_str or "iCloud" in db_path_str:
-        storage_mode = "iCloud Sync"
-    else:
-        storage_mode = "Local"
-
-    console.print("[red]다음 데이터베이스가 삭제됩니다:[/red]")
-    console.print(f"  • 파일: [dim]{db_path}[/dim]")
-    console.print(f"  • 스토리지: [cyan]{storage_mode}[/cyan]")
-
-    # 현재 통계 표시
+    storage_mode = _storage_mode_label(str(db_path))
+
+    lines = [
+        "\n",
+        "[bold yellow]⚠ Database Reset[/bold yellow]\n",
+        "[red]다음 데이터베이스가 삭제됩니다:[/red]",
+        f"  • 파일: [dim]{db_path}[/dim]",
+        f"  • 스토리지: [cyan]{storage_mode}[/cyan]",
+    ]
+
+    # 현재 통계 표시 (삭제 직전 요약에도 재사용)
+    stats = None
     if db_path.exists():
         try:
             stats = get_database_stats()
-            console.print(f"  • 레코드: [yellow]{stats['total_records']:,}개[/yellow]")
-            console.print(f"  • 기간: [yellow]{stats['oldest_date']} ~ {stats['newest_date']}[/yellow]")
-            console.print(f"  • 일수: [yellow]{stats['total_days']}일[/yellow]")
-        except:
+            lines += [
+                f"  • 레코드: [yellow]{stats['total_records']:,}개[/yellow]",
+                f"  • 기간: [yellow]{stats['oldest_date']} ~ {stats['newest_date']}[/yellow]",
+                f"  • 일수: [yellow]{stats['total_days']}일[/yellow]",
+            ]
+        except (sqlite3.Error, OSError, KeyError, TypeError):
             pass
     else:
-        console.print("  [yellow](데이터베이스 파일이 없음)[/yellow]")
-
-    console.print()
-    console.print("[green]보존되는 항목:[/green]")
-    console.print(f"  • 모든 설정 파일")
-    console.print(f"  • Gist 토큰 및 Gist 클라우드 백업")
+        lines.append("  [yellow](데이터베이스 파일이 없음)[/yellow]")
 
     # Claude Code 원본 데이터
-    claude_projects = Path.home() / ".claude" / "projects"
-    console.print(f"  • Claude Code usage 원본 데이터")
-    console.print(f"    [dim]{claude_projects}/*.jsonl[/dim]")
-
-    console.print()
-    console.print("[cyan]재설정 후:[/cyan]")
-    console.print("  • JSONL 파일에서 데이터 자동 재구축")
-    console.print("  • 다음 실행 시 자동으로 재구축됨")
+    lines += [
+        "",
+        "[green]보존되는 항목:[/green]",
+        "  • 모든 설정 파일",
+        "  • Gist 토큰 및 Gist 클라우드 백업",
+        "  • Claude Code usage 원본 데이터",
+        f"    [dim]{_CLAUDE_PROJECTS}/*.jsonl[/dim]",
+        "",
+        "[cyan]재설정 후:[/cyan]",
+        "  • JSONL 파일에서 데이터 자동 재구축",
+        "  • 다음 실행 시 자동으로 재구축됨",
+    ]
     if storage_mode in ["OneDrive Sync", "iCloud Sync"]:
-        console.print(f"  • [yellow]주의:[/yellow] 다른 PC도 동일하게 재구축됩니다 ({storage_mode})")
-    console.print()
+        lines.append(f"  • [yellow]주의:[/yellow] 다른 PC도 동일하게 재구축됩니다 ({storage_mode})")
 
     # Confirmation
-    console.print("[bold]계속하려면 'yes'를 입력하세요 (취소: Enter):[/bold]")
-    confirmation = input("> ").strip().lower()
-
-    if confirmation != 'yes':
+    lines += ["", "[bold]계속하려면 'yes'를 입력하세요 (취소: Enter):[/bold]"]
+    _print_block(console, lines)
+    if not _confirm("> ", strict=True):
         console.print("[yellow]취소되었습니다.[/yellow]")
-        console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-        input()
+        _wait_enter(console)
         return
 
     # Reset database
     try:
-        from src.storage.snapshot_db import DEFAULT_DB_PATH
-        from pathlib import Path
-
         db_path = DEFAULT_DB_PATH
 
         if db_path.exists():
             # Show stats before deletion
             try:
-                from src.storage.snapshot_db import get_database_stats
-                stats = get_database_stats()
-                console.print(f"\n[dim]삭제될 데이터:[/dim]")
-                console.print(f"[dim]  레코드: {stats['total_records']:,}[/dim]")
-                console.print(f"[dim]  기간: {stats['oldest_date']} ~ {stats['newest_date']}[/dim]")
-            except:
+                if stats is None:
+                    stats = get_database_stats()
+                _print_block(console, [
+                    "\n[dim]삭제될 데이터:[/dim]",
+                    f"[dim]  레코드: {stats['total_records']:,}[/dim]",
+                    f"[dim]  기간: {stats['oldest_date']} ~ {stats['newest_date']}[/dim]",
+                ])
+            except (sqlite3.Error, OSError, KeyError, TypeError):
                 pass
 
-            db_path.unlink()
-            console.print(f"\n[green]✓ 데이터베이스 삭제됨[/green]")
-            console.print(f"[dim]  {db_path}[/dim]")
+            # Clear in place: cloud sync sees one modified file, not delete + re-create
+            clear_database(db_path)
+            _print_block(console, [
+                "\n[green]✓ 데이터베이스 초기화됨[/green]",
+                f"[dim]  {db_path}[/dim]",
+            ])
 
-            # Delete backups
+            # Delete backups (count first, then delete in one streamed pass)
             backup_dir = db_path.parent
-            backups = list(backup_dir.glob("*.db.bak")) + list(backup_dir.glob("usage_history_backup_*.db"))
-            if backups:
-                console.print(f"\n[cyan]백업 파일 {len(backups)}개 발견[/cyan]")
-                console.print("[bold]백업도 삭제하시겠습니까? (y/N):[/bold]")
-                delete_backups = input("> ").strip().lower()
-
-                if delete_backups == 'y':
-                    for backup in backups:
+            backup_count = sum(1 for _ in _iter_backups(backup_dir))
+            if backup_count:
+                _print_block(console, [
+                    f"\n[cyan]백업 파일 {backup_count}개 발견[/cyan]",
+                    "[bold]백업도 삭제하시겠습니까? (y/N):[/bold]",
+                ])
+                if _confirm("> "):
+                    deleted = 0
+                    for backup in _iter_backups(backup_dir):
                         backup.unlink()
-                    console.print(f"[green]✓ 백업 {len(backups)}개 삭제됨[/green]")
+                        deleted += 1
+                    console.print(f"[green]✓ 백업 {deleted}개 삭제됨[/green]")
                 else:
-                    console.print(f"[yellow]백업 {len(backups)}개 유지됨[/yellow]")
+                    console.print(f"[yellow]백업 {backup_count}개 유지됨[/yellow]")
 
         else:
             console.print("[yellow]데이터베이스 파일이 존재하지 않습니다.[/yellow]")
 
-        console.print("\n[bold green]✓ 재설정 완료![/bold green]")
-        console.print("[dim]다음 실행 시 JSONL 파일에서 데이터가 자동으로 재구축됩니다.[/dim]")
-
-        console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-        input()
+        _print_block(console, [
+            "\n[bold green]✓ 재설정 완료![/bold green]",
+            "[dim]다음 실행 시 JSONL 파일에서 데이터가 자동으로 재구축됩니다.[/dim]",
+        ])
+        _wait_enter(console)
 
     except Exception as e:
         console.print(f"\n[red]✗ 오류 발생: {e}[/red]")
-        console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-        input()
+        _wait_enter(console)
+
+
+def _remove_tree(root: Path) -> None:
+    """
+    Delete a directory tree, unlinking files in parallel.
+
+    On OneDrive/iCloud-synced folders each unlink waits on the sync provider,
+    so overlapping them is much faster than shutil.rmtree's sequential walk.
+
+    Args:
+        root: Directory to delete
+
+    Raises:
+        OSError: If any file or directory cannot be removed (raised after
+            everything else that can be removed has been)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Failures are collected rather than raised on the spot, so one locked
+    # file doesn't leave the rest of the tree behind
+    errors: list[OSError] = []
+    walk = list(os.walk(root, topdown=False, onerror=errors.append))
+    files = [os.path.join(dirpath, name) for dirpath, _, filenames in walk for name in filenames]
+
+    def unlink(path: str) -> Optional[OSError]:
+        try:
+            os.unlink(path)
+        except OSError as e:
+            return e
+        return None
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        errors.extend(e for e in executor.map(unlink, files) if e is not None)
+
+    # Bottom-up, so children are removed before their parents
+    for dirpath, dirnames, _ in walk:
+        for name in dirnames:
+            path = os.path.join(dirpath, name)
+            if os.path.islink(path):
+                error = unlink(path)
+                if error is not None:
+                    errors.append(error)
+    for dirpath, _, _ in walk:
+        try:
+            os.rmdir(dirpath)
+        except OSError as e:
+            errors.append(e)
+
+    if errors:
+        raise OSError(f"Could not remove {len(errors)} item(s) under {root}: {errors[0]}")
 
 
 def _program_reset(console: Console) -> None:
@@ -1840,135 +2144,120 @@ def _program_reset(console: Console) -> None:
     from src.config.user_config import APP_DATA_DIR, get_db_path
     from src.storage.snapshot_db import get_default_db_path
     from src.sync.token_manager import TokenManager
-    from pathlib import Path
 
-    console.print("\n")
-    console.print("[bold yellow]⚠ 프로그램 완전 재설정[/bold yellow]\n")
 
     # 현재 스토리지 모드 감지
     custom_db_path = get_db_path()
     db_path = Path(custom_db_path) if custom_db_path else get_default_db_path()
-    db_path_str = str(db_path)
-
-    if "OneDrive" in db_path_str:
-        storage_mode = "OneDrive Sync"
-    elif "CloudDocs" in db_path_str or "iCloud" in db_path_str:
-        storage_mode = "iCloud Sync"
-    else:
-        storage_mode = "Local"
+    storage_mode = _storage_mode_label(str(db_path))
 
     # 삭제될 항목 표시
-    console.print("[red]다음 항목이 삭제됩니다:[/red]")
+    lines = [
+        "\n",
+        "[bold yellow]⚠ 프로그램 완전 재설정[/bold yellow]\n",
+        "[red]다음 항목이 삭제됩니다:[/red]",
+    ]
 
     # 앱 데이터 폴더
     if APP_DATA_DIR.exists():
-        console.print(f"  • 설정 폴더: [dim]{APP_DATA_DIR}[/dim]")
+        lines.append(f"  • 설정 폴더: [dim]{APP_DATA_DIR}[/dim]")
         # 폴더 내 주요 파일 표시
         config_files = list(APP_DATA_DIR.glob("*.json"))
-        if config_files:
-            for cf in config_files[:3]:  # 최대 3개만
-                console.print(f"    - {cf.name}")
+        for cf in config_files[:3]:  # 최대 3개만
+            lines.append(f"    - {cf.name}")
     else:
-        console.print(f"  • 설정 폴더: [dim]{APP_DATA_DIR}[/dim] [yellow](없음)[/yellow]")
+        lines.append(f"  • 설정 폴더: [dim]{APP_DATA_DIR}[/dim] [yellow](없음)[/yellow]")
 
     # Gist 토큰 파일
-    gist_token_file = Path.home() / ".claude" / "gist_token.txt"
-    if gist_token_file.exists():
-        console.print(f"  • Gist 토큰 파일: [dim]{gist_token_file}[/dim]")
+    if _GIST_TOKEN_FILE.exists():
+        lines.append(f"  • Gist 토큰 파일: [dim]{_GIST_TOKEN_FILE}[/dim]")
 
     # 캐시 폴더
-    console.print("  • 모든 캐시 및 임시 파일")
-
-    console.print()
-    console.print("[green]보존되는 항목:[/green]")
-
-    # 데이터베이스 (스토리지 모드별 설명)
-    console.print(f"  • 데이터베이스 ([cyan]{storage_mode}[/cyan])")
-    console.print(f"    [dim]{db_path}[/dim]")
-
-    # Claude Code 원본 데이터
-    claude_projects = Path.home() / ".claude" / "projects"
-    console.print(f"  • Claude Code usage 원본 데이터")
-    console.print(f"    [dim]{claude_projects}/*.jsonl[/dim]")
+    lines.append("  • 모든 캐시 및 임시 파일")
+
+    # 데이터베이스 (스토리지 모드별 설명) 및 Claude Code 원본 데이터
+    lines += [
+        "",
+        "[green]보존되는 항목:[/green]",
+        f"  • 데이터베이스 ([cyan]{storage_mode}[/cyan])",
+        f"    [dim]{db_path}[/dim]",
+        "  • Claude Code usage 원본 데이터",
+        f"    [dim]{_CLAUDE_PROJECTS}/*.jsonl[/dim]",
+    ]
 
     # Git Gist 백업
+    token_manager = None
     try:
         token_manager = TokenManager()
         if token_manager.get_token():
-            console.print("  • GitHub Gist 클라우드 백업 (기존 Gist는 유지됨)")
-    except:
+            lines.append("  • GitHub Gist 클라우드 백업 (기존 Gist는 유지됨)")
+    except (OSError, RuntimeError):
         pass
 
     # 시스템 keyring 토큰
     try:
-        token_manager = TokenManager()
+        if token_manager is None:
+            token_manager = TokenManager()
         if TokenManager.is_keyring_available():
             token_location = token_manager.get_storage_location()
             if "keyring" in token_location.lower():
-                console.print(f"  • 시스템 keyring의 Gist 토큰")
-                console.print(f"    [dim]{token_location}[/dim]")
-    except:
+                lines += [
+                    "  • 시스템 keyring의 Gist 토큰",
+                    f"    [dim]{token_location}[/dim]",
+                ]
+    except (OSError, RuntimeError):
         pass
 
-    console.print()
-    console.print("[cyan]재설정 후:[/cyan]")
-    console.print("  • 프로그램이 종료됩니다")
-    console.print("  • 다음 실행 시 Setup wizard가 자동으로 시작됩니다")
+    lines += [
+        "",
+        "[cyan]재설정 후:[/cyan]",
+        "  • 프로그램이 종료됩니다",
+        "  • 다음 실행 시 Setup wizard가 자동으로 시작됩니다",
+    ]
     if storage_mode in ["OneDrive Sync", "iCloud Sync"]:
-        console.print(f"  • Setup wizard에서 [cyan]{storage_mode}[/cyan] 위치를 다시 선택할 수 있습니다")
-    console.print()
+        lines.append(f"  • Setup wizard에서 [cyan]{storage_mode}[/cyan] 위치를 다시 선택할 수 있습니다")
 
     # 확인 입력 받기
-    console.print("[bold]계속하려면 'yes'를 입력하세요 (취소: Enter)[/bold]")
-    confirmation = input("> ").strip().lower()
-
-    if confirmation != 'yes':
+    lines += ["", "[bold]계속하려면 'yes'를 입력하세요 (취소: Enter)[/bold]"]
+    _print_block(console, lines)
+    if not _confirm("> ", strict=True):
         console.print("[yellow]재설정이 취소되었습니다.[/yellow]")
-        console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-        input()
+        _wait_enter(console)
         return
 
     # 재설정 실행
     try:
-        from src.commands import reset
-        import shutil
-        from pathlib import Path
-        from src.config.user_config import APP_DATA_DIR
-
         console.print("\n[dim]재설정 중...[/dim]")
 
         deleted_items = []
 
         # 1. APP_DATA_DIR 삭제
         if APP_DATA_DIR.exists():
-            shutil.rmtree(APP_DATA_DIR)
+            _remove_tree(APP_DATA_DIR)
             deleted_items.append(str(APP_DATA_DIR))
 
         # 2. Gist 토큰 파일 삭제
-        gist_token_file = Path.home() / ".claude" / "gist_token.txt"
-        if gist_token_file.exists():
-            gist_token_file.unlink()
-            deleted_items.append(str(gist_token_file))
-
-        console.print(f"\n[bold green]✓ 재설정 완료![/bold green]")
-        console.print(f"[dim]총 {len(deleted_items)}개 항목 삭제됨[/dim]\n")
-
-        console.print("[cyan]프로그램을 다시 실행하면 Setup wizard가 시작됩니다:[/cyan]")
-        console.print("[bold cyan]  ccu[/bold cyan]\n")
-
-        console.print("[yellow]Ctrl+C를 눌러 프로그램을 종료하세요...[/yellow]")
+        if _GIST_TOKEN_FILE.exists():
+            _GIST_TOKEN_FILE.unlink()
+            deleted_items.append(str(_GIST_TOKEN_FILE))
+
+        _print_block(console, [
+            "\n[bold green]✓ 재설정 완료![/bold green]",
+            f"[dim]총 {len(deleted_items)}개 항목 삭제됨[/dim]\n",
+            "[cyan]프로그램을 다시 실행하면 Setup wizard가 시작됩니다:[/cyan]",
+            "[bold cyan]  ccu[/bold cyan]\n",
+            "[yellow]Ctrl+C를 눌러 프로그램을 종료하세요...[/yellow]",
+        ])
         try:
             while True:
                 input()  # Wait indefinitely until Ctrl+C
         except KeyboardInterrupt:
             console.print("\n[dim]프로그램을 종료합니다...[/dim]")
-            import sys
             sys.exit(0)
 
     except Exception as e:
         console.print(f"\n[red]✗ 재설정 중 오류 발생: {e}[/red]")
-        console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-        input()
+        _wait_enter(console)
 
 
 
@@ -1981,7 +2270,6 @@ def _edit_gist_auto_sync_setting(console: Console, prefs: dict, save_func) -> No
         prefs: Current preferences dictionary
         save_func: Function to save preference
     """
-    from src.config.defaults import DEFAULT_PREFERENCES
 
     current_value = prefs.get('gist_auto_sync', DEFAULT_PREFERENCES['gist_auto_sync'])
     current_enabled = (current_value == '1')
@@ -1997,8 +2285,7 @@ def _edit_gist_auto_sync_setting(console: Console, prefs: dict, save_func) -> No
 
     console.print(f"[green]✓ Gist Auto-Sync {'enabled' if new_value == '1' else 'disabled'}[/green]")
     console.print("[dim]Changes take effect when you exit settings[/dim]")
-    console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-    input()
+    _wait_enter(console)
 
 
 def _edit_gist_sync_interval_setting(console: Console, prefs: dict, save_func) -> None:
@@ -2010,7 +2297,6 @@ def _edit_gist_sync_interval_setting(console: Console, prefs: dict, save_func) -
         prefs: Current preferences dictionary
         save_func: Function to save preference
     """
-    from src.config.defaults import DEFAULT_PREFERENCES
 
     current_value = prefs.get('gist_sync_interval', DEFAULT_PREFERENCES['gist_sync_interval'])
     current_minutes = int(current_value) // 60
@@ -2023,13 +2309,11 @@ def _edit_gist_sync_interval_setting(console: Console, prefs: dict, save_func) -
     console.print("[dim]Enter interval in minutes (minimum 1), 'd' for default, or press Enter to keep current:[/dim]")
 
     try:
-        sys.stdout.write("> ")
-        sys.stdout.flush()
-        new_value = input().strip()
+        new_value = input("> ").strip()
 
         if new_value:
             # Check for default reset
-            if new_value.lower() in ['d', 'default']:
+            if new_value.lower() in _DEFAULTS:
                 from src.storage.snapshot_db import delete_user_preference
                 delete_user_preference('gist_sync_interval')
                 console.print(f"[green]✓ Sync interval reset to default: 10 minutes[/green]")
@@ -2048,8 +2332,7 @@ def _edit_gist_sync_interval_setting(console: Console, prefs: dict, save_func) -
     except (EOFError, KeyboardInterrupt):
         console.print("\n[yellow]Input cancelled[/yellow]")
 
-    console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-    input()
+    _wait_enter(console)
 
 
 def _edit_gist_sync_mode_setting(console: Console, prefs: dict, save_func) -> None:
@@ -2061,7 +2344,6 @@ def _edit_gist_sync_mode_setting(console: Console, prefs: dict, save_func) -> No
         prefs: Current preferences dictionary
         save_func: Function to save preference
     """
-    from src.config.defaults import DEFAULT_PREFERENCES
 
     current_value = prefs.get('gist_sync_mode', DEFAULT_PREFERENCES['gist_sync_mode'])
 
@@ -2077,13 +2359,11 @@ def _edit_gist_sync_mode_setting(console: Console, prefs: dict, save_func) -> No
     console.print("[dim]Enter mode number (1-3), 'd' for default, or press Enter to keep current:[/dim]")
 
     try:
-        sys.stdout.write("> ")
-        sys.stdout.flush()
-        new_value = input().strip()
+        new_value = input("> ").strip()
 
         if new_value:
             # Check for default reset
-            if new_value.lower() in ['d', 'default']:
+            if new_value.lower() in _DEFAULTS:
                 from src.storage.snapshot_db import delete_user_preference
                 delete_user_preference('gist_sync_mode')
                 console.print(f"[green]✓ Sync mode reset to default: bidirectional[/green]")
@@ -2102,6 +2382,5 @@ def _edit_gist_sync_mode_setting(console: Console, prefs: dict, save_func) -> No
     except (EOFError, KeyboardInterrupt):
         console.print("\n[yellow]Input cancelled[/yellow]")
 
-    console.print("\n[dim]Enter를 눌러 돌아가기...[/dim]")
-    input()
+    _wait_enter(console)
 
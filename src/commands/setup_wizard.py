@@ -5,13 +5,50 @@ Guides users through initial setup including:
 - Database storage location (OneDrive sync vs local-only)
 - Machine name configuration
 """
+import os
+import re
 import sys
 import tty
 import termios
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Iterator, Optional, TypeVar
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+
+
+_T = TypeVar("_T")
+
+def _is_wsl() -> bool:
+    """
+    Check whether we're running under WSL (via /proc/version, not platform.uname()).
+
+    Returns:
+        True on WSL, False otherwise
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        with open("/proc/version") as f:
+            return "microsoft" in f.read().lower()
+    except OSError:
+        return False
+
+
+_IS_WSL = _is_wsl()
+
+# Shapes of GitHub tokens: prefixed classic/OAuth/app tokens, fine-grained PATs,
+# and legacy 40-char hex tokens
+_TOKEN_RE = re.compile(r"^(gh[opusr]_[A-Za-z0-9]{36,}|github_pat_[A-Za-z0-9_]{22,}|[0-9a-f]{40})$")
+
+_LOCAL_DB_PATH = Path.home() / ".claude" / "usage" / "usage_history.db"
+
+# (name, description, path) for the storage options that are always shown;
+# "gist" is a marker for the Gist-backed flow
+_STATIC_STORAGE_OPTIONS = (
+    ("Local Storage", "Single device only (fastest, no sync)", _LOCAL_DB_PATH),
+    ("GitHub Gist ⭐ (Recommended)", "Multi-device • Version control • Backups • All platforms", "gist"),
+)
 
 
 def run_setup_wizard(console: Console) -> bool:
@@ -21,6 +58,8 @@ def run_setup_wizard(console: Console) -> bool:
     Returns:
         True if setup completed successfully, False if cancelled
     """
+    from rich.panel import Panel
+
     try:
         console.clear()
         console.print()
@@ -70,151 +109,167 @@ def _select_database_location(console: Console) -> Path | str | None:
     Returns:
         Path object, "auto" for auto-detect, or None if cancelled
     """
-    console.print("[bold]Step 1: Database Storage Location[/bold]")
-    console.print()
-    console.print("[dim]Choose where to store your usage data:[/dim]")
-    console.print()
+    # Local and Gist are always offered; a detected cloud folder goes between
+    # them and the custom path, which is always last
+    onedrive_available, onedrive_path = _detect_cloud_sync_path()
+    local_path = _LOCAL_DB_PATH
+    entries = list(_STATIC_STORAGE_OPTIONS)
+    if onedrive_available:
+        entries.append(("OneDrive/iCloud", "Multi-device sync (Windows/macOS only)", onedrive_path))
+    entries.append(("Custom Path", "Specify your own location", None))
+
+    option_paths = {str(i): path for i, (_, _, path) in enumerate(entries[:-1], start=1)}
+    custom_key = str(len(entries))
+
+    # Only the cloud/custom rows vary per run; the header and static rows come
+    # pre-parsed from _static_storage_menu()
+    menu_lines = []
+    first_key = len(_STATIC_STORAGE_OPTIONS) + 1
+    for key, entry in enumerate(entries[first_key - 1:], start=first_key):
+        menu_lines.extend(_storage_option_lines(key, *entry))
+    menu_lines.append("  [bold](ESC)[/bold] Cancel setup")
+    menu_lines.append("")
+    menu = "\n".join(menu_lines)
+
+    def accept_option(key: str) -> Optional[str]:
+        if key == '\x1b' or key in option_paths or key == custom_key:
+            return key
+        console.print(f"\n[red]Invalid option. Please select 1-{len(entries)} or ESC to cancel.[/red]\n")
+        console.print("[dim]Select an option:[/dim] ", end="")
+        return None
+
+    while True:
+        console.print(_static_storage_menu())
+        console.print(menu)
+
+        # Get user choice (Ctrl+C propagates to exit immediately)
+        console.print("[dim]Select an option:[/dim] ", end="")
+        key = _read_key_loop(accept_option)
+
+        if key == '\x1b':  # ESC
+            console.print("[yellow]Cancelled[/yellow]")
+            return None
 
-    # Detect available options
-    from src.storage.snapshot_db import get_default_db_path
-    import platform
-    import os
+        console.print(key)
 
-    options = []
-    option_paths = {}
+        if key == custom_key:
+            return _get_custom_path(console)
 
-    # Option 1: OneDrive (if available)
+        selected_path = option_paths[key]
+
+        # Handle GitHub Gist selection
+        if selected_path == "gist":
+            gist_result = _setup_gist_sync(console)
+            if gist_result is None:
+                # User cancelled Gist setup - return to storage selection
+                console.print("[yellow]Gist setup cancelled. Please select a different storage option.[/yellow]\n")
+                continue  # Redisplay the storage menu
+            # Return local path (Gist is for backup only)
+            return local_path
+
+        # If OneDrive was selected, ask for confirmation
+        if key == "3" and onedrive_available:
+            confirmed_path = _confirm_onedrive_path(console, selected_path)
+            if confirmed_path is None:
+                return None  # User cancelled
+            return confirmed_path
+
+        return selected_path
+
+
+def _storage_option_lines(key: int, name: str, desc: str, path: Path | str | None) -> list[str]:
+    """
+    Build the markup lines for one storage menu entry.
+
+    Returns:
+        Lines for the entry, ending with a blank separator line
+    """
+    lines = [f"  [bold]({key})[/bold] [cyan]{name}[/cyan]", f"      {desc}"]
+    if path:
+        lines.append(f"      {path}")
+    lines.append("")
+    return lines
+
+
+@lru_cache(maxsize=1)
+def _static_storage_menu():
+    """
+    Parse the fixed part of the storage menu once per process.
+
+    Built on first use rather than at import, since this module is imported
+    on every start just for should_run_setup_wizard().
+
+    Returns:
+        Rich Group with the header and the always-present options
+    """
+    from rich.console import Group
+    from rich.text import Text
+
+    lines = [
+        "[bold]Step 1: Database Storage Location[/bold]",
+        "",
+        "[dim]Choose where to store your usage data:[/dim]",
+        "",
+    ]
+    for key, entry in enumerate(_STATIC_STORAGE_OPTIONS, start=1):
+        lines.extend(_storage_option_lines(key, *entry))
+    return Group(*(Text.from_markup(line) for line in lines))
+
+
+@lru_cache(maxsize=1)
+def _detect_cloud_sync_path() -> tuple[bool, Optional[Path]]:
+    """
+    Detect a OneDrive (WSL2) or iCloud Drive (macOS) folder for the database.
+
+    Cached for the process so retries of the location menu don't re-stat
+    every candidate.
+
+    Returns:
+        (available, suggested database path or None)
+    """
     onedrive_available = False
     onedrive_path = None
 
-    if platform.system() == "Linux" and "microsoft" in platform.release().lower():
+    if _IS_WSL:
         # WSL2 - check for OneDrive (prioritize external drives)
         username = os.getenv("USER")
 
-        # Check external drives first (D:, E:, F:)
-        for drive in ["d", "e", "f"]:
+        # List mounted drives once; stats over WSL2's 9P mounts are slow
+        try:
+            with os.scandir("/mnt") as entries:
+                mounted = {e.name for e in entries}
+        except OSError:
+            mounted = set()
+
+        # Check external drives first (D:, E:, F:), then C: as fallback
+        for drive in ("d", "e", "f", "c"):
+            if drive not in mounted:
+                continue
             candidate = Path(f"/mnt/{drive}/OneDrive")
-            if candidate.exists():
+            if candidate.is_dir():
                 onedrive_path = candidate / ".claude-goblin" / "usage_history.db"
                 onedrive_available = True
                 break
 
-        # Check C: drive as fallback
-        if not onedrive_available:
-            candidate = Path("/mnt/c/OneDrive")
-            if candidate.exists():
-                onedrive_path = candidate / ".claude-goblin" / "usage_history.db"
-                onedrive_available = True
-
         # Check C:/Users/{username}/OneDrive as last resort
-        if not onedrive_available and username:
+        if not onedrive_available and username and "c" in mounted:
             candidate = Path(f"/mnt/c/Users/{username}/OneDrive")
             if candidate.exists():
                 onedrive_path = candidate / ".claude-goblin" / "usage_history.db"
                 onedrive_available = True
 
-    elif platform.system() == "Darwin":
+    elif sys.platform == "darwin":
         # macOS - check for iCloud Drive
         icloud_base = Path.home() / "Library" / "Mobile Documents" / "com~apple~CloudDocs"
         if icloud_base.exists():
             onedrive_path = icloud_base / ".claude-goblin" / "usage_history.db"
             onedrive_available = True
 
-    # Build options list
-    # Option 1: Local storage
-    local_path = Path.home() / ".claude" / "usage" / "usage_history.db"
-    options.append({
-        "key": "1",
-        "name": "Local Storage",
-        "desc": "Single device only (fastest, no sync)",
-        "path": local_path,
-        "color": "yellow"
-    })
-    option_paths["1"] = local_path
-
-    # Option 2: GitHub Gist (Recommended)
-    options.append({
-        "key": "2",
-        "name": "GitHub Gist ⭐ (Recommended)",
-        "desc": "Multi-device • Version control • Backups • All platforms",
-        "path": "gist",  # Special marker
-        "color": "green"
-    })
-    option_paths["2"] = "gist"
-
-    # Option 3: OneDrive/iCloud (if available)
-    if onedrive_available:
-        options.append({
-            "key": "3",
-            "name": "OneDrive/iCloud",
-            "desc": "Multi-device sync (Windows/macOS only)",
-            "path": onedrive_path,
-            "color": "cyan"
-        })
-        option_paths["3"] = onedrive_path
-
-    # Option 4/5: Custom path
-    custom_key = str(len(options) + 1)
-    options.append({
-        "key": custom_key,
-        "name": "Custom Path",
-        "desc": "Specify your own location",
-        "path": None,
-        "color": "dim"
-    })
-
-    # Display options
-    for opt in options:
-        console.print(f"  [bold]({opt['key']})[/bold] [cyan]{opt['name']}[/cyan]")
-        console.print(f"      {opt['desc']}")
-        if opt['path']:
-            console.print(f"      {opt['path']}")
-        console.print()
+    return onedrive_available, onedrive_path
 
-    console.print(f"  [bold](ESC)[/bold] Cancel setup")
-    console.print()
 
-    # Get user choice
-    while True:
-        try:
-            console.print("[dim]Select an option:[/dim] ", end="")
-            key = _read_key()
-
-            if key == '\x1b':  # ESC
-                console.print("[yellow]Cancelled[/yellow]")
-                return None
-
-            if key in option_paths:
-                console.print(key)
-                selected_path = option_paths[key]
-
-                # Handle GitHub Gist selection
-                if selected_path == "gist":
-                    gist_result = _setup_gist_sync(console)
-                    if gist_result is None:
-                        # User cancelled Gist setup - return to storage selection
-                        console.print("[yellow]Gist setup cancelled. Please select a different storage option.[/yellow]\n")
-                        return _select_database_location(console)  # Recursive call to restart selection
-                    # Return local path (Gist is for backup only)
-                    return local_path
-
-                # If OneDrive was selected, ask for confirmation
-                if key == "3" and onedrive_available:
-                    confirmed_path = _confirm_onedrive_path(console, selected_path)
-                    if confirmed_path is None:
-                        return None  # User cancelled
-                    return confirmed_path
-
-                return selected_path
-
-            if key == custom_key:
-                console.print(key)
-                return _get_custom_path(console)
-
-            console.print(f"\n[red]Invalid option. Please select 1-{len(options)} or ESC to cancel.[/red]\n")
-        except KeyboardInterrupt:
-            # Ctrl+C pressed - propagate to exit immediately
-            raise
+# Returned by _setup_gist_sync_once when the user asks to retry
+_RETRY = object()
 
 
 def _setup_gist_sync(console: Console) -> bool | None:
@@ -224,6 +279,20 @@ def _setup_gist_sync(console: Console) -> bool | None:
     Returns:
         True if setup successful, False if skipped, None if cancelled
     """
+    while True:
+        result = _setup_gist_sync_once(console)
+        if result is not _RETRY:
+            return result
+
+
+def _setup_gist_sync_once(console: Console) -> bool | None | object:
+    """
+    Run one pass of the Gist setup prompts.
+
+    Returns:
+        True if setup successful, False if skipped, None if cancelled,
+        or _RETRY if the user chose to retry after a failed initial backup
+    """
     console.print()
     console.print("[bold]GitHub Gist Sync Setup[/bold]")
     console.print()
@@ -247,28 +316,18 @@ def _setup_gist_sync(console: Console) -> bool | None:
     console.print("  [bold](ESC)[/bold] Cancel")
     console.print()
 
-    while True:
-        try:
-            console.print("[dim]Your choice:[/dim] ", end="")
-            key = _read_key()
-
-            if key == '\x1b':  # ESC
-                console.print("Cancelled")
-                return None
+    console.print("[dim]Your choice:[/dim] ", end="")
+    key = _read_key_loop(_choice_predicate(console, "yn\x1b", "Press 'y', 'n', or ESC."))
 
-            if key.lower() == 'n':
-                console.print(key)
-                console.print("[yellow]Skipping Gist setup - using local storage instead[/yellow]")
-                console.print("[dim]You can add Gist backup later with: ccu gist setup[/dim]")
-                return False  # Proceed with local storage
-
-            if key.lower() == 'y':
-                console.print(key)
-                break
+    if key == '\x1b':  # ESC
+        console.print("Cancelled")
+        return None
 
-            console.print(f"\n[red]Invalid choice. Press 'y', 'n', or ESC.[/red]\n")
-        except KeyboardInterrupt:
-            raise
+    console.print(key)
+    if key.lower() == 'n':
+        console.print("[yellow]Skipping Gist setup - using local storage instead[/yellow]")
+        console.print("[dim]You can add Gist backup later with: ccu gist setup[/dim]")
+        return False  # Proceed with local storage
 
     # Import Gist modules
     try:
@@ -306,8 +365,12 @@ def _setup_gist_sync(console: Console) -> bool | None:
         # Ctrl+C pressed - propagate to exit immediately
         raise
 
-    # Validate token
+    # Validate token (obviously malformed input is rejected without a network call)
     console.print("Validating token...", end="")
+    if not _TOKEN_RE.match(token):
+        console.print(" [red]✗ Invalid token format[/red]")
+        console.print("[yellow]Cannot proceed with Gist storage. Please select a different option.[/yellow]")
+        return None  # Return to storage selection
     try:
         client = GistClient(token)
         if not client.test_token():
@@ -342,7 +405,6 @@ def _setup_gist_sync(console: Console) -> bool | None:
     console.print(f"[dim]  Storage: {storage_location}[/dim]")
 
     # Show security information based on storage method
-    import platform
     if "keyring" in storage_location.lower():
         console.print("[green]  ✓ Encrypted by your system[/green]")
     else:
@@ -353,7 +415,7 @@ def _setup_gist_sync(console: Console) -> bool | None:
         console.print("[dim]  • This is secure for personal use on single-user systems[/dim]")
 
         # Platform-specific advice
-        if platform.system() == "Linux":
+        if sys.platform.startswith("linux"):
             console.print()
             console.print("[dim]  💡 For enhanced security (OS-level encryption), you can install Secret Service:[/dim]")
             console.print("[dim]     sudo apt install gnome-keyring libsecret-1-0[/dim]")
@@ -367,26 +429,19 @@ def _setup_gist_sync(console: Console) -> bool | None:
     console.print("  [bold](n)[/bold] No, do it later")
     console.print()
 
-    while True:
-        try:
-            console.print("[dim]Your choice:[/dim] ", end="")
-            key = _read_key()
-
-            if key.lower() == 'n':
-                console.print(key)
-                console.print("[yellow]Skipping initial backup[/yellow]")
-                console.print("[dim]Run 'ccu gist push' when ready[/dim]")
-                return True
-
-            if key.lower() == 'y':
-                console.print(key)
-                break
+    try:
+        console.print("[dim]Your choice:[/dim] ", end="")
+        key = _read_key_loop(_choice_predicate(console, "yn", "Press 'y' or 'n'."))
+    except KeyboardInterrupt:
+        # Token is already saved, just skip initial sync
+        console.print("\nSkipping initial backup")
+        return True
 
-            console.print(f"\n[red]Invalid choice. Press 'y' or 'n'.[/red]\n")
-        except KeyboardInterrupt:
-            # Token is already saved, just skip initial sync
-            console.print("\nSkipping initial backup")
-            return True
+    console.print(key)
+    if key.lower() == 'n':
+        console.print("[yellow]Skipping initial backup[/yellow]")
+        console.print("[dim]Run 'ccu gist push' when ready[/dim]")
+        return True
 
     # Perform initial sync
     try:
@@ -416,38 +471,33 @@ def _setup_gist_sync(console: Console) -> bool | None:
         console.print("  [bold](c)[/bold] Cancel Gist setup (choose different storage)")
         console.print()
 
-        while True:
-            try:
-                console.print("[dim]Your choice:[/dim] ", end="")
-                key = _read_key()
-
-                if key.lower() == 'r':
-                    console.print(key)
-                    console.print()
-                    # Retry - recursive call to sync section
-                    return _setup_gist_sync(console)
-
-                if key.lower() == 's':
-                    console.print(key)
-                    console.print("[yellow]Skipping initial backup. Token is saved.[/yellow]")
-                    console.print("[dim]Run 'ccu gist push' when ready[/dim]")
-                    return True
-
-                if key.lower() == 'c':
-                    console.print(key)
-                    console.print("[yellow]Cancelling Gist setup[/yellow]")
-                    # Delete saved token
-                    try:
-                        token_manager = TokenManager()
-                        token_manager.delete_token()
-                    except:
-                        pass
-                    return None  # Cancel - return to storage selection
-
-                console.print(f"\n[red]Invalid choice. Press 'r', 's', or 'c'.[/red]\n")
-            except KeyboardInterrupt:
-                console.print("\nCancelled")
-                return None
+        try:
+            console.print("[dim]Your choice:[/dim] ", end="")
+            key = _read_key_loop(_choice_predicate(console, "rsc", "Press 'r', 's', or 'c'."))
+        except KeyboardInterrupt:
+            console.print("\nCancelled")
+            return None
+
+        console.print(key)
+
+        if key.lower() == 'r':
+            console.print()
+            # Retry - run the Gist setup again
+            return _RETRY
+
+        if key.lower() == 's':
+            console.print("[yellow]Skipping initial backup. Token is saved.[/yellow]")
+            console.print("[dim]Run 'ccu gist push' when ready[/dim]")
+            return True
+
+        console.print("[yellow]Cancelling Gist setup[/yellow]")
+        # Delete saved token
+        try:
+            token_manager = TokenManager()
+            token_manager.delete_token()
+        except:
+            pass
+        return None  # Cancel - return to storage selection
 
 
 def _confirm_onedrive_path(console: Console, detected_path: Path) -> Path | None:
@@ -473,29 +523,21 @@ def _confirm_onedrive_path(console: Console, detected_path: Path) -> Path | None
     console.print("  [bold](ESC)[/bold] Cancel setup")
     console.print()
 
-    while True:
-        try:
-            console.print("[dim]Your choice:[/dim] ", end="")
-            key = _read_key()
+    # Ctrl+C propagates to exit immediately
+    console.print("[dim]Your choice:[/dim] ", end="")
+    key = _read_key_loop(_choice_predicate(console, "yn\x1b", "Press 'y', 'n', or ESC."))
 
-            if key == '\x1b':  # ESC
-                console.print("Cancelled")
-                return None
+    if key == '\x1b':  # ESC
+        console.print("Cancelled")
+        return None
 
-            if key.lower() == 'y':
-                console.print(key)
-                console.print("[green]✓ Using detected path[/green]")
-                return detected_path
+    console.print(key)
+    if key.lower() == 'y':
+        console.print("[green]✓ Using detected path[/green]")
+        return detected_path
 
-            if key.lower() == 'n':
-                console.print(key)
-                # Ask for custom OneDrive path
-                return _get_custom_onedrive_path(console)
-
-            console.print(f"\n[red]Invalid choice. Press 'y', 'n', or ESC.[/red]\n")
-        except KeyboardInterrupt:
-            # Ctrl+C pressed - propagate to exit immediately
-            raise
+    # Ask for custom OneDrive path
+    return _get_custom_onedrive_path(console)
 
 
 def _get_custom_onedrive_path(console: Console) -> Path | None:
@@ -522,24 +564,22 @@ def _get_custom_onedrive_path(console: Console) -> Path | None:
 
         onedrive_root = Path(path_str)
 
-        # Validate that it's a directory
-        if not onedrive_root.exists():
-            console.print(f"✗ Directory does not exist: {onedrive_root}")
-            console.print("Please check the path and try running setup wizard again.")
-            return None
-
-        if not onedrive_root.is_dir():
-            console.print(f"✗ Path is not a directory: {onedrive_root}")
-            return None
-
         # Construct full DB path
         db_path = onedrive_root / ".claude-goblin" / "usage_history.db"
 
-        # Try to create the directory
+        # Create the data directory without parents=True, so a single mkdir
+        # also validates that the OneDrive root exists and is a directory
         try:
-            db_path.parent.mkdir(parents=True, exist_ok=True)
+            db_path.parent.mkdir(exist_ok=True)
             console.print(f"✓ Using custom OneDrive path: {db_path}")
             return db_path
+        except FileNotFoundError:
+            console.print(f"✗ Directory does not exist: {onedrive_root}")
+            console.print("Please check the path and try running setup wizard again.")
+            return None
+        except (NotADirectoryError, FileExistsError):
+            console.print(f"✗ Path is not a directory: {onedrive_root}")
+            return None
         except (PermissionError, OSError) as e:
             console.print(f"✗ Cannot create directory: {e}")
             console.print("Please check permissions and try again.")
@@ -581,7 +621,7 @@ def _get_custom_path(console: Console) -> Path | None:
         except (PermissionError, OSError) as e:
             console.print(f"✗ Cannot create directory: {e}")
             console.print("Falling back to local storage...")
-            return Path.home() / ".claude" / "usage" / "usage_history.db"
+            return _LOCAL_DB_PATH
 
     except (EOFError, KeyboardInterrupt):
         console.print("\nCancelled")
@@ -595,52 +635,53 @@ def _configure_machine_name(console: Console) -> str | None:
     Returns:
         Machine name string (empty string for auto), or None if cancelled
     """
-    import socket
-
-    console.print()
-    console.print("Step 2: Machine Name (Optional)")
-    console.print()
-    console.print("Give this device a friendly name for multi-device tracking.")
-    console.print("Leave empty to use hostname.")
-    console.print()
-
-    hostname = socket.gethostname()
-    console.print(f"Current hostname: {hostname}")
-    console.print()
-    console.print("Examples: Home-Desktop, Work-Laptop, Gaming-PC")
+    hostname = _cached_hostname()
 
-    try:
-        sys.stdout.write("> ")
-        sys.stdout.flush()
-        name = input().strip()
-
-        # Validation: Detect if user accidentally pasted a GitHub token
-        if name.startswith("ghp_") or name.startswith("github_pat_"):
-            console.print()
-            console.print("[red]✗ Error: This looks like a GitHub token, not a machine name![/red]")
-            console.print("[yellow]GitHub tokens should only be entered during Gist setup, not here.[/yellow]")
-            console.print()
-            console.print("[dim]Press Enter to retry or Ctrl+C to cancel...[/dim]")
-            input()
-            return _configure_machine_name(console)  # Retry
-
-        if name:
-            console.print(f"✓ Machine name: {name}")
-            return name
-        else:
-            console.print(f"✓ Using hostname: {hostname}")
-            return ""
+    # Asked again if the input looks like a pasted GitHub token
+    while True:
+        console.print()
+        console.print("Step 2: Machine Name (Optional)")
+        console.print()
+        console.print("Give this device a friendly name for multi-device tracking.")
+        console.print("Leave empty to use hostname.")
+        console.print()
+        console.print(f"Current hostname: {hostname}")
+        console.print()
+        console.print("Examples: Home-Desktop, Work-Laptop, Gaming-PC")
 
-    except (EOFError, KeyboardInterrupt):
-        console.print("\nCancelled")
-        return None
+        try:
+            sys.stdout.write("> ")
+            sys.stdout.flush()
+            name = input().strip()
+
+            # Validation: Detect if user accidentally pasted a GitHub token
+            if name.startswith("ghp_") or name.startswith("github_pat_"):
+                console.print()
+                console.print("[red]✗ Error: This looks like a GitHub token, not a machine name![/red]")
+                console.print("[yellow]GitHub tokens should only be entered during Gist setup, not here.[/yellow]")
+                console.print()
+                console.print("[dim]Press Enter to retry or Ctrl+C to cancel...[/dim]")
+                input()
+                continue  # Ask again
+
+            if name:
+                console.print(f"✓ Machine name: {name}")
+                return name
+            else:
+                console.print(f"✓ Using hostname: {hostname}")
+                return ""
+
+        except (EOFError, KeyboardInterrupt):
+            console.print("\nCancelled")
+            return None
 
 
 def _show_setup_summary(console: Console, db_path: Path | str, machine_name: str) -> None:
     """
     Show setup summary and next steps.
     """
-    import socket
+    from rich.panel import Panel
+    from rich.table import Table
 
     console.print()
     console.print(Panel.fit(
@@ -668,8 +709,7 @@ def _show_setup_summary(console: Console, db_path: Path | str, machine_name: str
     if machine_name:
         table.add_row("Machine Name", machine_name)
     else:
-        hostname = socket.gethostname()
-        table.add_row("Machine Name", f"{hostname} [dim](auto)[/dim]")
+        table.add_row("Machine Name", f"{_cached_hostname()} [dim](auto)[/dim]")
 
     console.print(table)
     console.print()
@@ -687,6 +727,42 @@ def _show_setup_summary(console: Console, db_path: Path | str, machine_name: str
         raise
 
 
+@lru_cache(maxsize=1)
+def _cached_hostname() -> str:
+    """
+    Get this machine's hostname (looked up once per process).
+
+    Returns:
+        Hostname from socket.gethostname()
+    """
+    import socket
+    return socket.gethostname()
+
+
+@contextmanager
+def _raw_mode(raw: bool = True) -> Iterator[None]:
+    """
+    Switch stdin to unbuffered key input, restoring the terminal on exit.
+
+    Args:
+        raw: Full raw mode if True; otherwise cbreak mode, which keeps output
+            processing so messages printed while it is active render normally
+
+    Raises:
+        termios.error: If stdin is not a terminal
+    """
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        if raw:
+            tty.setraw(fd)
+        else:
+            tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
 def _read_key() -> str:
     """
     Read a single key from stdin.
@@ -695,22 +771,71 @@ def _read_key() -> str:
         The key pressed as a string
     """
     try:
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(sys.stdin.fileno())
+        with _raw_mode():
             key = sys.stdin.read(1)
+    except Exception:
+        # Fallback for non-Unix systems
+        return input()
 
-            # Handle Ctrl+C
-            if key == '\x03':
-                raise KeyboardInterrupt
+    # Handle Ctrl+C
+    if key == '\x03':
+        raise KeyboardInterrupt
+    return key
 
-            return key
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+def _read_key_loop(predicate: Callable[[str], Optional[_T]]) -> _T:
+    """
+    Read keys until the predicate accepts one.
+
+    The terminal is switched once for the whole loop instead of once per key,
+    so rejected keys don't cause a mode change (and flicker) each time.
+
+    Args:
+        predicate: Returns the parsed value for an accepted key, or None to keep
+            reading (it may print an error for the rejected key)
+
+    Returns:
+        The first non-None value returned by the predicate
+    """
+    try:
+        termios.tcgetattr(sys.stdin.fileno())
     except Exception:
         # Fallback for non-Unix systems
-        return input()
+        while True:
+            result = predicate(input())
+            if result is not None:
+                return result
+
+    with _raw_mode(raw=False):
+        while True:
+            key = sys.stdin.read(1)
+            if key == '\x03':  # Ctrl+C when ISIG is off
+                raise KeyboardInterrupt
+            result = predicate(key)
+            if result is not None:
+                return result
+
+
+def _choice_predicate(console: Console, choices: str, hint: str) -> Callable[[str], Optional[str]]:
+    """
+    Build a _read_key_loop predicate for a single-key menu.
+
+    Args:
+        console: Rich console for the invalid-choice message
+        choices: Accepted keys (letters match case-insensitively)
+        hint: Text shown after "Invalid choice." for rejected keys
+
+    Returns:
+        Predicate returning the key as typed, or None after re-prompting
+    """
+    def accept(key: str) -> Optional[str]:
+        if len(key) == 1 and key.lower() in choices:
+            return key
+        console.print(f"\n[red]Invalid choice. {hint}[/red]\n")
+        console.print("[dim]Your choice:[/dim] ", end="")
+        return None
+
+    return accept
 
 
 def should_run_setup_wizard() -> bool:
@@ -720,7 +845,11 @@ def should_run_setup_wizard() -> bool:
     Returns:
         True if this is first-time setup, False otherwise
     """
-    from src.config.user_config import CONFIG_PATH, LEGACY_CONFIG_PATHS, load_config
+    from src.config.user_config import CONFIG_PATH, LEGACY_CONFIG_PATHS, SETUP_DONE_MARKER, load_config
+
+    # Fast path for returning users: two stats instead of parsing the config
+    if SETUP_DONE_MARKER.exists() and CONFIG_PATH.exists():
+        return False
 
     # Run wizard if config file doesn't exist
     if not CONFIG_PATH.exists() and not any(path.exists() for path in LEGACY_CONFIG_PATHS):
@@ -729,15 +858,30 @@ def should_run_setup_wizard() -> bool:
     # Check if setup_completed flag exists
     try:
         config = load_config()
-        return not config.get("setup_completed", False)
     except:
         return True
 
+    if not config.get("setup_completed", False):
+        return True
+
+    # Set up before the marker existed - create it so later startups take the fast path
+    if CONFIG_PATH.exists():
+        try:
+            SETUP_DONE_MARKER.touch()
+        except OSError:
+            pass
+    return False
+
 
 def mark_setup_completed() -> None:
     """Mark setup wizard as completed."""
-    from src.config.user_config import load_config, save_config
+    from src.config.user_config import SETUP_DONE_MARKER, load_config, save_config
 
     config = load_config()
     config["setup_completed"] = True
     save_config(config)
+
+    try:
+        SETUP_DONE_MARKER.touch()
+    except OSError:
+        pass  # Marker is only an optimization; the config flag is authoritative
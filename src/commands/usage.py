@@ -1515,12 +1515,13 @@ def _display_dashboard(jsonl_files: list[Path], console: Console, skip_limits: b
             week_reset_str = limits_from_db["week_reset"]
         else:
             # Try stored reset time from reset_times.json first
-            from src.config.reset_times import format_reset_for_display, get_reset_datetime
+            from src.config.reset_times import format_reset_for_display, get_reset_datetime, load_reset_times
 
-            week_reset_dt = get_reset_datetime("week_reset")
+            stored_reset_times = load_reset_times()
+            week_reset_dt = get_reset_datetime("week_reset", stored_reset_times)
             if week_reset_dt:
                 # Use stored reset time
-                week_reset_str = format_reset_for_display("week_reset")
+                week_reset_str = format_reset_for_display("week_reset", stored_reset_times)
             else:
                 # Fallback: Try to use stored pattern
                 from src.storage.snapshot_db import load_user_preferences
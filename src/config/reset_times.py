@@ -1,15 +1,42 @@
 #region Imports
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from zoneinfo import ZoneInfo
 import json
+import os
+import re
 from pathlib import Path
 from src.config.user_config import get_app_data_dir
+
+try:
+    import orjson  # Optional; much faster JSON (de)serialization
+except ImportError:
+    orjson = None  # type: ignore
 #endregion
 
 
 #region Constants
 RESET_TIMES_FILE = "reset_times.json"
+RESET_TYPES = ("session_reset", "week_reset", "sonnet_reset")
+
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+_MONTH_ABBRS = {num: name for name, num in _MONTHS.items()}
+
+# Reset string patterns. _RESET_RE covers every dated form in one search:
+# "Oct 27, 9:59am", "10/27 9:59am", "Oct 27", "10/27"
+_TZ_RE = re.compile(r'\(([^)]*)\)')
+_RESET_RE = re.compile(
+    r'(?:\b(?P<mon>(?i:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec))\s+(?P<day>\d{1,2})|(?P<mon_num>\d{1,2})/(?P<day_num>\d{1,2}))'
+    r'(?:,?\s+(?P<hour>\d{1,2}):?(?P<minute>\d{0,2})(?P<ampm>am|pm))?'
+)
+_TIME_RE = re.compile(r'(\d{1,2}):?(\d{0,2})(am|pm)')  # "9:59am"
+
+# Last loaded file contents, keyed by (path, mtime_ns, size)
+_reset_times_cache: dict = {"key": None, "data": None}
 #endregion
 
 
@@ -52,46 +79,105 @@ def _get_reset_times_path() -> Path:
     return get_app_data_dir() / RESET_TIMES_FILE
 
 
+def _file_key(path: Path) -> Optional[tuple]:
+    """Identify the current version of a file, or None if it can't be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> dict:
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _copy_reset_times(data: dict) -> dict:
+    """Copy the reset times dict deep enough that callers can mutate entries."""
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in data.items()}
+
+
 def load_reset_times() -> dict:
     """
     Load stored reset times from disk.
 
+    The parsed file is cached until its mtime or size changes.
+
     Returns:
         Dictionary with reset time information
     """
     path = _get_reset_times_path()
 
-    if not path.exists():
+    file_key = _file_key(path)
+    if file_key is None:
         return get_default_reset_times()
 
+    if _reset_times_cache["key"] == file_key:
+        return _copy_reset_times(_reset_times_cache["data"])
+
     try:
-        with open(path, "r") as f:
-            data = json.load(f)
-            # Ensure all required fields exist
-            default = get_default_reset_times()
-            for key in default:
-                if key not in data:
-                    data[key] = default[key]
-            return data
-    except (json.JSONDecodeError, IOError):
+        data = _loads(path.read_bytes())
+        # Ensure all required fields exist
+        default = get_default_reset_times()
+        for key in default:
+            if key not in data:
+                data[key] = default[key]
+    except (ValueError, IOError):  # JSONDecodeError (json and orjson) is a ValueError
         return get_default_reset_times()
 
+    _reset_times_cache["key"] = file_key
+    _reset_times_cache["data"] = _copy_reset_times(data)
+    return data
+
 
 def save_reset_times(reset_times: dict) -> None:
     """
     Save reset times to disk.
 
+    The write is skipped when nothing but last_updated would change and the
+    file still holds what this process last loaded or wrote.
+
     Args:
         reset_times: Dictionary with reset time information
     """
     path = _get_reset_times_path()
+
+    cached = _reset_times_cache["data"]
+    if cached is not None and _reset_times_cache["key"] == _file_key(path):
+        if {**cached, "last_updated": None} == {**reset_times, "last_updated": None}:
+            return
+
     path.parent.mkdir(parents=True, exist_ok=True)
 
     # Update last_updated timestamp
     reset_times["last_updated"] = datetime.now().isoformat()
 
-    with open(path, "w") as f:
-        json.dump(reset_times, f, indent=2)
+    # Serialize up front so the file is written in one call, then swap it in
+    # atomically so a crash can't leave a truncated file behind. No fsync:
+    # the contents are re-derived from claude /usage on the next update.
+    payload = _dumps(reset_times)
+    _reset_times_cache["key"] = None
+    tmp_path = path.with_suffix(".json.tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    # What we just wrote is the file's content now; no need to re-read it
+    _reset_times_cache["data"] = _copy_reset_times(reset_times)
+    _reset_times_cache["key"] = _file_key(path)
 
 
 #endregion
@@ -116,8 +202,6 @@ def parse_reset_string(reset_str: str, current_tz: str = "UTC") -> dict:
     Returns:
         Dictionary with parsed date, time, timezone fields
     """
-    import re
-
     result = {
         "date": None,
         "time": None,
@@ -126,96 +210,54 @@ def parse_reset_string(reset_str: str, current_tz: str = "UTC") -> dict:
     }
 
     # Extract timezone from parentheses
-    tz_match = re.search(r'\((.*?)\)', reset_str)
+    tz_match = _TZ_RE.search(reset_str)
     if tz_match:
         result["timezone"] = tz_match.group(1)
 
     # Remove timezone part for easier parsing
     reset_no_tz = reset_str.split(' (')[0].strip()
 
-    # Try to parse full format: "Oct 27, 9:59am" or "Oct 27 9:59am"
-    date_match = re.search(r'([A-Za-z]+)\s+(\d+),?\s+(\d+):?(\d*)(am|pm)', reset_no_tz)
+    # Dated forms, with or without a time
+    date_match = _RESET_RE.search(reset_no_tz)
     if date_match:
-        month_name = date_match.group(1)
-        day = int(date_match.group(2))
-        hour = int(date_match.group(3))
-        minute = int(date_match.group(4)) if date_match.group(4) else 0
-        meridiem = date_match.group(5)
-
-        # Convert to 24-hour format
-        if meridiem == 'pm' and hour != 12:
-            hour += 12
-        elif meridiem == 'am' and hour == 12:
-            hour = 0
-
-        # Parse month name to number
-        try:
-            month_num = datetime.strptime(month_name, '%b').month
-            year = datetime.now().year
-            result["date"] = f"{year}-{month_num:02d}-{day:02d}"
-            result["time"] = f"{hour:02d}:{minute:02d}"
-            return result
-        except ValueError:
-            pass
-
-    # Try numeric date format: "10/27 9:59am"
-    date_match = re.search(r'(\d+)/(\d+)\s+(\d+):?(\d*)(am|pm)', reset_no_tz)
-    if date_match:
-        month_num = int(date_match.group(1))
-        day = int(date_match.group(2))
-        hour = int(date_match.group(3))
-        minute = int(date_match.group(4)) if date_match.group(4) else 0
-        meridiem = date_match.group(5)
-
-        # Convert to 24-hour format
-        if meridiem == 'pm' and hour != 12:
-            hour += 12
-        elif meridiem == 'am' and hour == 12:
-            hour = 0
-
-        year = datetime.now().year
-        result["date"] = f"{year}-{month_num:02d}-{day:02d}"
-        result["time"] = f"{hour:02d}:{minute:02d}"
-        return result
-
-    # Try date only: "Oct 27" or "10/27"
-    date_match = re.search(r'([A-Za-z]+)\s+(\d+)', reset_no_tz)
-    if date_match:
-        month_name = date_match.group(1)
-        day = int(date_match.group(2))
-        try:
-            month_num = datetime.strptime(month_name, '%b').month
-            year = datetime.now().year
-            result["date"] = f"{year}-{month_num:02d}-{day:02d}"
-            return result
-        except ValueError:
-            pass
-
-    date_match = re.search(r'(\d+)/(\d+)', reset_no_tz)
-    if date_match:
-        month_num = int(date_match.group(1))
-        day = int(date_match.group(2))
-        year = datetime.now().year
-        result["date"] = f"{year}-{month_num:02d}-{day:02d}"
+        if date_match["mon"]:
+            # The pattern only matches English abbreviations, so the lookup can't miss
+            month_num = _MONTHS[date_match["mon"].capitalize()]
+        else:
+            month_num = int(date_match["mon_num"])
+
+        day = int(date_match["day"] or date_match["day_num"])
+        result["date"] = f"{datetime.now().year}-{month_num:02d}-{day:02d}"
+        if date_match["ampm"]:
+            result["time"] = _to_24h(date_match["hour"], date_match["minute"], date_match["ampm"])
         return result
 
     # Try time only: "9:59am" or "12pm"
-    time_match = re.search(r'(\d+):?(\d*)(am|pm)', reset_no_tz)
+    time_match = _TIME_RE.search(reset_no_tz)
     if time_match:
-        hour = int(time_match.group(1))
-        minute = int(time_match.group(2)) if time_match.group(2) else 0
-        meridiem = time_match.group(3)
+        result["time"] = _to_24h(*time_match.groups())
 
-        # Convert to 24-hour format
-        if meridiem == 'pm' and hour != 12:
-            hour += 12
-        elif meridiem == 'am' and hour == 12:
-            hour = 0
+    return result
 
-        result["time"] = f"{hour:02d}:{minute:02d}"
-        return result
 
-    return result
+def _to_24h(hour: str, minute: str, meridiem: str) -> str:
+    """
+    Convert matched 12-hour clock fields to "HH:MM".
+
+    Args:
+        hour: Hour digits
+        minute: Minute digits (may be empty)
+        meridiem: "am" or "pm"
+
+    Returns:
+        24-hour time string
+    """
+    hour_num = int(hour)
+    if meridiem == 'pm' and hour_num != 12:
+        hour_num += 12
+    elif meridiem == 'am' and hour_num == 12:
+        hour_num = 0
+    return f"{hour_num:02d}:{int(minute) if minute else 0:02d}"
 
 
 def update_reset_time(reset_type: str, new_reset_str: str, current_tz: str = "UTC") -> None:
@@ -229,28 +271,47 @@ def update_reset_time(reset_type: str, new_reset_str: str, current_tz: str = "UT
         new_reset_str: New reset time string from claude /usage
         current_tz: Current timezone to use if not specified in string
     """
-    if reset_type not in ["session_reset", "week_reset", "sonnet_reset"]:
-        raise ValueError(f"Invalid reset_type: {reset_type}")
+    update_reset_times_batch({reset_type: new_reset_str}, current_tz)
+
+
+def update_reset_times_batch(updates: dict[str, str], current_tz: str = "UTC") -> None:
+    """
+    Update several reset times with one load and one save.
+
+    Only updates fields that are present in each new string (incremental update).
+
+    Args:
+        updates: Mapping of reset type ("session_reset", "week_reset",
+            "sonnet_reset") to the new reset time string from claude /usage
+        current_tz: Current timezone to use if not specified in a string
+
+    Raises:
+        ValueError: If any reset type is invalid (nothing is saved)
+    """
+    for reset_type in updates:
+        if reset_type not in RESET_TYPES:
+            raise ValueError(f"Invalid reset_type: {reset_type}")
 
     # Load existing reset times
     reset_times = load_reset_times()
 
-    # Parse new reset string
-    parsed = parse_reset_string(new_reset_str, current_tz)
+    for reset_type, new_reset_str in updates.items():
+        # Parse new reset string
+        parsed = parse_reset_string(new_reset_str, current_tz)
 
-    # Get existing data for this reset type
-    existing = reset_times[reset_type]
+        # Get existing data for this reset type
+        existing = reset_times[reset_type]
 
-    # Incremental update: only update fields that are present in new data
-    if parsed["date"]:
-        existing["date"] = parsed["date"]
-    if parsed["time"]:
-        existing["time"] = parsed["time"]
-    if parsed["timezone"]:
-        existing["timezone"] = parsed["timezone"]
+        # Incremental update: only update fields that are present in new data
+        if parsed["date"]:
+            existing["date"] = parsed["date"]
+        if parsed["time"]:
+            existing["time"] = parsed["time"]
+        if parsed["timezone"]:
+            existing["timezone"] = parsed["timezone"]
 
-    # Always update full_string
-    existing["full_string"] = parsed["full_string"]
+        # Always update full_string
+        existing["full_string"] = parsed["full_string"]
 
     # Save back
     save_reset_times(reset_times)
@@ -261,17 +322,25 @@ def update_reset_time(reset_type: str, new_reset_str: str, current_tz: str = "UT
 
 #region Query Functions
 
-def get_reset_datetime(reset_type: str) -> Optional[datetime]:
+@lru_cache(maxsize=32)
+def _zoneinfo(name: str) -> ZoneInfo:
+    """Resolve a timezone name, keeping the instance for the whole process."""
+    return ZoneInfo(name)
+
+
+def get_reset_datetime(reset_type: str, reset_times: Optional[dict] = None) -> Optional[datetime]:
     """
     Get the reset datetime as a timezone-aware datetime object.
 
     Args:
         reset_type: One of "session_reset", "week_reset", "sonnet_reset"
+        reset_times: Already loaded reset times (loaded from disk if None)
 
     Returns:
         Timezone-aware datetime object, or None if not enough info
     """
-    reset_times = load_reset_times()
+    if reset_times is None:
+        reset_times = load_reset_times()
     reset_info = reset_times.get(reset_type)
 
     if not reset_info or not reset_info.get("date") or not reset_info.get("time"):
@@ -283,20 +352,18 @@ def get_reset_datetime(reset_type: str) -> Optional[datetime]:
         time_str = reset_info["time"]
         tz_str = reset_info.get("timezone", "UTC")
 
-        # Create datetime
-        dt_str = f"{date_str} {time_str}"
-        dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M")
-
-        # Add timezone
-        tz = ZoneInfo(tz_str)
-        dt = dt.replace(tzinfo=tz)
-
-        return dt
+        # Both fields are written by parse_reset_string as "YYYY-MM-DD" and
+        # "HH:MM", so slice them instead of running strptime
+        return datetime(
+            int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+            int(time_str[0:2]), int(time_str[3:5]),
+            tzinfo=_zoneinfo(tz_str),
+        )
     except (ValueError, Exception):
         return None
 
 
-def get_week_start_datetime(reset_type: str) -> Optional[datetime]:
+def get_week_start_datetime(reset_type: str, reset_times: Optional[dict] = None) -> Optional[datetime]:
     """
     Get the start of the current week period.
 
@@ -305,6 +372,7 @@ def get_week_start_datetime(reset_type: str) -> Optional[datetime]:
 
     Args:
         reset_type: One of "week_reset", "sonnet_reset"
+        reset_times: Already loaded reset times (loaded from disk if None)
 
     Returns:
         Timezone-aware datetime object for week start, or None if not available
@@ -320,42 +388,33 @@ def get_week_start_datetime(reset_type: str) -> Optional[datetime]:
         If current time (Oct 27, 2pm) is BEFORE calculated week_start (Oct 27, 3pm),
         that means we're still in the previous week, so go back another 7 days.
     """
-    from datetime import timedelta
-
-    reset_dt = get_reset_datetime(reset_type)
+    reset_dt = get_reset_datetime(reset_type, reset_times)
     if not reset_dt:
         return None
 
     now = datetime.now(reset_dt.tzinfo)
 
-    # Calculate potential week_start (7 days before next reset)
-    week_start = reset_dt - timedelta(days=7)
-
-    # If we're before the calculated week_start, we're still in the previous week
-    # Go back another 7 days
-    while now < week_start:
-        week_start = week_start - timedelta(days=7)
-
-    # If we're past the next reset, we need to move forward
-    next_reset = week_start + timedelta(days=7)
-    while now >= next_reset:
-        week_start = next_reset
-        next_reset = week_start + timedelta(days=7)
+    # The week containing now starts a whole number of weeks from the stored
+    # reset (negative if the stored reset is still ahead). Floor division
+    # finds it directly instead of stepping week by week when the stored
+    # reset is stale.
+    week = timedelta(days=7)
+    return reset_dt + ((now - reset_dt) // week) * week
 
-    return week_start
 
-
-def format_reset_for_display(reset_type: str) -> str:
+def format_reset_for_display(reset_type: str, reset_times: Optional[dict] = None) -> str:
     """
     Format reset time for display in dashboard.
 
     Args:
         reset_type: One of "session_reset", "week_reset", "sonnet_reset"
+        reset_times: Already loaded reset times (loaded from disk if None)
 
     Returns:
         Formatted string like "Oct 27, 9:59am (Asia/Seoul)" or "Not available"
     """
-    reset_times = load_reset_times()
+    if reset_times is None:
+        reset_times = load_reset_times()
     reset_info = reset_times.get(reset_type)
 
     if not reset_info:
@@ -371,9 +430,9 @@ def format_reset_for_display(reset_type: str) -> str:
     if reset_info.get("date"):
         # Convert YYYY-MM-DD to "Oct 27"
         try:
-            dt = datetime.strptime(reset_info["date"], "%Y-%m-%d")
-            parts.append(dt.strftime("%b %d"))
-        except ValueError:
+            _, month, day = map(int, reset_info["date"].split("-"))
+            parts.append(f"{_MONTH_ABBRS[month]} {day:02d}")
+        except (ValueError, KeyError):
             pass
 
     if reset_info.get("time"):
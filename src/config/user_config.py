@@ -16,6 +16,7 @@ LEGACY_CONFIG_FILENAMES = [
 ]
 LEGACY_CONFIG_PATHS = [_BASE_DIR / name for name in LEGACY_CONFIG_FILENAMES]
 CONFIG_PATH = APP_DATA_DIR / _CONFIG_FILENAME
+SETUP_DONE_MARKER = APP_DATA_DIR / ".setup_done"  # Lets startup skip parsing the config
 #endregion
 
 
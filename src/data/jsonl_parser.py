@@ -49,12 +49,14 @@ def parse_jsonl_file(file_path: Path) -> Iterator[UsageRecord]:
                 continue
 
 
-def parse_all_jsonl_files(file_paths: list[Path]) -> list[UsageRecord]:
+def parse_all_jsonl_files(file_paths: list[Path], since: Optional[datetime] = None) -> list[UsageRecord]:
     """
     Parse multiple JSONL files and return all usage records.
 
     Args:
         file_paths: List of paths to JSONL files
+        since: Only return records at or after this time (timezone-aware).
+            Files not modified since then are skipped without being read.
 
     Returns:
         List of all UsageRecord objects found across all files
@@ -65,10 +67,23 @@ def parse_all_jsonl_files(file_paths: list[Path]) -> list[UsageRecord]:
     if not file_paths:
         raise ValueError("No JSONL files provided to parse")
 
+    cutoff = since.timestamp() if since else None
+
     records: list[UsageRecord] = []
     for file_path in file_paths:
+        if cutoff is not None:
+            # A file last written before the cutoff cannot contain newer records
+            try:
+                if file_path.stat().st_mtime < cutoff:
+                    continue
+            except OSError:
+                pass  # Let parse_jsonl_file report the problem
+
         try:
-            records.extend(parse_jsonl_file(file_path))
+            if since is None:
+                records.extend(parse_jsonl_file(file_path))
+            else:
+                records.extend(r for r in parse_jsonl_file(file_path) if r.timestamp >= since)
         except FileNotFoundError:
             print(f"Warning: File not found, skipping: {file_path}")
         except Exception as e:
@@ -6,7 +6,8 @@ Each migration must inherit from Migration and implement up() and down() methods
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 
 @dataclass
@@ -17,6 +18,34 @@ class MigrationResult:
     error: Optional[str] = None
 
 
+class MigrationContext:
+    """
+    Resources shared by all migrations of one run.
+
+    Created empty by the runner; the sync manager (and with it the token
+    lookup and Gist client) is built on first use, so runs that never touch
+    Gist pay nothing for it.
+    """
+
+    def __init__(self) -> None:
+        self._sync_manager: Any = None
+        self._has_token: Optional[bool] = None
+
+    @property
+    def sync_manager(self) -> Any:
+        """Get the shared SyncManager (its GistClient keeps its connection and caches)."""
+        if self._sync_manager is None:
+            from src.sync.sync_manager import SyncManager
+            self._sync_manager = SyncManager()
+        return self._sync_manager
+
+    def has_gist_token(self) -> bool:
+        """Check once per run whether a GitHub token is configured."""
+        if self._has_token is None:
+            self._has_token = self.sync_manager.token_manager.has_token()
+        return self._has_token
+
+
 class Migration(ABC):
     """
     Base class for all migrations.
@@ -34,6 +63,9 @@ class Migration(ABC):
     name: str = "Base Migration"
     description: str = "Base migration class"
 
+    # Set by the runner before up(); see get_context()
+    context: Optional[MigrationContext] = None
+
     @abstractmethod
     def up(self) -> MigrationResult:
         """
@@ -66,13 +98,25 @@ class Migration(ABC):
         """
         return True
 
+    def get_context(self) -> MigrationContext:
+        """
+        Get the shared migration context, creating one if run standalone.
+
+        Returns:
+            MigrationContext for this run
+        """
+        if self.context is None:
+            self.context = MigrationContext()
+        return self.context
+
     def __repr__(self) -> str:
         return f"Migration({self.version}: {self.name})"
 
 
+@lru_cache(maxsize=None)
 def parse_version(version_str: str) -> tuple[int, int, int]:
     """
-    Parse version string to tuple for comparison.
+    Parse version string to tuple for comparison (memoized; versions are a small fixed set).
 
     Args:
         version_str: Version like "1.7.5"
@@ -5,21 +5,41 @@ Automatically detects and runs pending migrations on startup.
 """
 
 import sqlite3
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 from rich.console import Console
 
-from src.migrations.base import Migration, MigrationResult, compare_versions
+from src.migrations.base import Migration, MigrationContext, MigrationResult, compare_versions, parse_version
 from src.storage.snapshot_db import get_storage_dir
 
 
 # Version metadata table name
 VERSION_TABLE = "ccu_version_info"
 
+_UPSERT_VERSION_SQL = f"""
+    INSERT OR REPLACE INTO {VERSION_TABLE} (key, value, updated_at)
+    VALUES ('app_version', ?, datetime('now'))
+"""
+
+_INSERT_HISTORY_SQL = """
+    INSERT INTO migration_history (version, name, success, message)
+    VALUES (?, ?, ?, ?)
+"""
+
+# Version databases whose tables were already created by this process
+_initialized_dbs: set[Path] = set()
 
+
+@lru_cache(maxsize=1)
 def get_version_db_path() -> Path:
-    """Get path to version tracking database."""
+    """
+    Get path to version tracking database.
+
+    Resolved (and its directory created) once per process; migrations run at
+    startup after the setup wizard has settled the storage location.
+    """
     storage_dir = get_storage_dir()
     storage_dir.mkdir(parents=True, exist_ok=True)
     return storage_dir / "version_info.db"
@@ -35,38 +55,50 @@ def init_version_db(db_path: Optional[Path] = None) -> None:
     if db_path is None:
         db_path = get_version_db_path()
 
+    if db_path in _initialized_dbs:
+        return
+
     conn = sqlite3.connect(db_path, timeout=30.0)
     try:
-        cursor = conn.cursor()
-
-        # Create version info table
-        cursor.execute(f"""
-            CREATE TABLE IF NOT EXISTS {VERSION_TABLE} (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL,
-                updated_at TEXT DEFAULT (datetime('now'))
-            )
-        """)
-
-        # Create migrations history table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS migration_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                version TEXT NOT NULL,
-                name TEXT NOT NULL,
-                applied_at TEXT DEFAULT (datetime('now')),
-                success INTEGER NOT NULL DEFAULT 1,
-                message TEXT
-            )
-        """)
-
+        _create_version_tables(conn.cursor())
         conn.commit()
     finally:
         conn.close()
 
-
+    _initialized_dbs.add(db_path)
+
+
+def _create_version_tables(cursor: sqlite3.Cursor) -> None:
+    """Create the version tracking tables if they don't exist yet."""
+    # Create version info table
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {VERSION_TABLE} (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            updated_at TEXT DEFAULT (datetime('now'))
+        )
+    """)
+
+    # Create migrations history table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS migration_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            version TEXT NOT NULL,
+            name TEXT NOT NULL,
+            applied_at TEXT DEFAULT (datetime('now')),
+            success INTEGER NOT NULL DEFAULT 1,
+            message TEXT
+        )
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_mh_version_success
+        ON migration_history(version, success)
+    """)
+
+
+@lru_cache(maxsize=1)
 def get_current_app_version() -> str:
-    """Get current application version from pyproject.toml."""
+    """Get current application version from pyproject.toml (resolved once per process)."""
     try:
         from importlib.metadata import version
         return version("claude-code-usage-analytics")
@@ -129,10 +161,7 @@ def set_stored_version(version: str, db_path: Optional[Path] = None) -> None:
     conn = sqlite3.connect(db_path, timeout=30.0)
     try:
         cursor = conn.cursor()
-        cursor.execute(f"""
-            INSERT OR REPLACE INTO {VERSION_TABLE} (key, value, updated_at)
-            VALUES ('app_version', ?, datetime('now'))
-        """, (version,))
+        cursor.execute(_UPSERT_VERSION_SQL, (version,))
         conn.commit()
     finally:
         conn.close()
@@ -163,10 +192,7 @@ def record_migration(
     conn = sqlite3.connect(db_path, timeout=30.0)
     try:
         cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO migration_history (version, name, success, message)
-            VALUES (?, ?, ?, ?)
-        """, (version, name, 1 if success else 0, message))
+        cursor.execute(_INSERT_HISTORY_SQL, (version, name, 1 if success else 0, message))
         conn.commit()
     finally:
         conn.close()
@@ -192,10 +218,10 @@ def is_migration_applied(version: str, db_path: Optional[Path] = None) -> bool:
     conn = sqlite3.connect(db_path, timeout=30.0)
     try:
         cursor = conn.cursor()
+        # Any successful run counts, so no ORDER BY is needed
         cursor.execute("""
-            SELECT success FROM migration_history
+            SELECT 1 FROM migration_history
             WHERE version = ? AND success = 1
-            ORDER BY applied_at DESC
             LIMIT 1
         """, (version,))
         row = cursor.fetchone()
@@ -206,6 +232,73 @@ def is_migration_applied(version: str, db_path: Optional[Path] = None) -> bool:
         conn.close()
 
 
+def _open_run_db(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """
+    Open the version database for a migration run, creating tables if needed.
+
+    Args:
+        db_path: Path to version database
+
+    Returns:
+        Open connection; the caller closes it
+    """
+    if db_path is None:
+        db_path = get_version_db_path()
+
+    conn = sqlite3.connect(db_path, timeout=30.0)
+    if db_path not in _initialized_dbs:
+        try:
+            _create_version_tables(conn.cursor())
+            conn.commit()
+        except Exception:
+            conn.close()
+            raise
+        _initialized_dbs.add(db_path)
+    return conn
+
+
+def _record_migration(conn: sqlite3.Connection, row: tuple) -> None:
+    """
+    Record one migration result and commit it right away.
+
+    Committing per migration means a crash or Ctrl-C later in the run can't
+    lose the record of migrations that already ran (and re-run them).
+
+    Args:
+        conn: Connection from _open_run_db()
+        row: (version, name, success, message) for migration_history
+    """
+    conn.execute(_INSERT_HISTORY_SQL, row)
+    conn.commit()
+
+
+def get_applied_migrations(db_path: Optional[Path] = None) -> set[str]:
+    """
+    Get versions of all successfully applied migrations in one query.
+
+    Args:
+        db_path: Path to version database
+
+    Returns:
+        Set of migration version strings
+    """
+    if db_path is None:
+        db_path = get_version_db_path()
+
+    if not db_path.exists():
+        return set()
+
+    conn = sqlite3.connect(db_path, timeout=30.0)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT DISTINCT version FROM migration_history WHERE success = 1")
+        return {row[0] for row in cursor.fetchall()}
+    except sqlite3.OperationalError:
+        return set()
+    finally:
+        conn.close()
+
+
 def get_pending_migrations() -> list[Migration]:
     """
     Get list of migrations that need to be run.
@@ -213,18 +306,19 @@ def get_pending_migrations() -> list[Migration]:
     Returns:
         List of Migration instances sorted by version
     """
-    # Import all migrations here
-    from src.migrations.versions import ALL_MIGRATIONS
+    from src.migrations.versions import get_all_migrations
+
+    applied = get_applied_migrations()
 
     pending = []
-    for migration_class in ALL_MIGRATIONS:
+    for migration_class in get_all_migrations():
         migration = migration_class()
-        if not is_migration_applied(migration.version):
+        if migration.version not in applied:
             if migration.check_required():
                 pending.append(migration)
 
     # Sort by version
-    pending.sort(key=lambda m: tuple(map(int, m.version.split("."))))
+    pending.sort(key=lambda m: parse_version(m.version))
     return pending
 
 
@@ -255,9 +349,6 @@ def run_migrations(console: Optional[Console] = None, silent: bool = False) -> d
     current_version = get_current_app_version()
     stored_version = get_stored_version()
 
-    # Initialize version DB
-    init_version_db()
-
     # Get pending migrations
     pending = get_pending_migrations()
 
@@ -279,9 +370,52 @@ def run_migrations(console: Optional[Console] = None, silent: bool = False) -> d
             console.print(f"[dim]First run of v{current_version}[/dim]")
         console.print()
 
-    # Run each migration
+    # Run each migration; each result is committed as soon as it's known,
+    # over one connection for the whole run
+    conn = _open_run_db()
+    try:
+        _run_pending(pending, conn, result, console, silent)
+
+        # All migrations ran: update stored version
+        conn.execute(_UPSERT_VERSION_SQL, (current_version,))
+        conn.commit()
+        result["version_updated"] = True
+    finally:
+        conn.close()
+
+    # Show summary
+    if not silent and console:
+        console.print()
+        if result["failed"] == 0:
+            console.print(f"[green]✓ {result['success']} migration(s) applied successfully[/green]")
+        else:
+            console.print(f"[yellow]⚠ {result['success']} succeeded, {result['failed']} failed[/yellow]")
+        console.print()
+
+    return result
+
+
+def _run_pending(
+    pending: list[Migration],
+    conn: sqlite3.Connection,
+    result: dict[str, Any],
+    console: Optional[Console],
+    silent: bool,
+) -> None:
+    """
+    Run pending migrations in order, recording each result as it completes.
+
+    Args:
+        pending: Migrations to run, sorted by version
+        conn: Connection from _open_run_db()
+        result: run_migrations() result dict, updated in place
+        console: Rich console for output (optional)
+        silent: If True, suppress all output
+    """
+    context = MigrationContext()
     for migration in pending:
         result["ran"] += 1
+        migration.context = context
 
         if not silent and console:
             console.print(f"  [cyan]→[/cyan] {migration.name}...", end="")
@@ -291,23 +425,18 @@ def run_migrations(console: Optional[Console] = None, silent: bool = False) -> d
 
             if migration_result.success:
                 result["success"] += 1
-                record_migration(
-                    migration.version,
-                    migration.name,
-                    True,
-                    migration_result.message
-                )
+                _record_migration(conn, (migration.version, migration.name, 1, migration_result.message))
                 if not silent and console:
                     console.print(" [green]✓[/green]")
                 result["messages"].append(f"✓ {migration.name}: {migration_result.message}")
             else:
                 result["failed"] += 1
-                record_migration(
+                _record_migration(conn, (
                     migration.version,
                     migration.name,
-                    False,
+                    0,
                     migration_result.error or migration_result.message
-                )
+                ))
                 if not silent and console:
                     console.print(f" [red]✗[/red] {migration_result.error}")
                 result["messages"].append(f"✗ {migration.name}: {migration_result.error}")
@@ -315,26 +444,11 @@ def run_migrations(console: Optional[Console] = None, silent: bool = False) -> d
         except Exception as e:
             result["failed"] += 1
             error_msg = str(e)
-            record_migration(migration.version, migration.name, False, error_msg)
+            _record_migration(conn, (migration.version, migration.name, 0, error_msg))
             if not silent and console:
                 console.print(f" [red]✗[/red] {error_msg}")
             result["messages"].append(f"✗ {migration.name}: {error_msg}")
 
-    # Update stored version
-    set_stored_version(current_version)
-    result["version_updated"] = True
-
-    # Show summary
-    if not silent and console:
-        console.print()
-        if result["failed"] == 0:
-            console.print(f"[green]✓ {result['success']} migration(s) applied successfully[/green]")
-        else:
-            console.print(f"[yellow]⚠ {result['success']} succeeded, {result['failed']} failed[/yellow]")
-        console.print()
-
-    return result
-
 
 def get_migration_status() -> dict[str, Any]:
     """
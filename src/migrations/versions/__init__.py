@@ -1,22 +1,34 @@
 """
 Migration versions registry.
 
-All migrations should be imported and added to ALL_MIGRATIONS list.
+All migrations should be registered in _MIGRATION_MODULES as "module:ClassName".
+Modules are imported on demand by get_all_migrations().
 Migrations are run in version order (sorted semantically).
 """
 
+import importlib
 from typing import Type
 
 from src.migrations.base import Migration
 
-# Import all migrations here
-from src.migrations.versions.v1_7_6_manifest_data_files import ManifestDataFilesMigration
-from src.migrations.versions.v1_7_7_sync_check import SyncCheckMigration
-from src.migrations.versions.v1_7_9_disable_backup import DisableBackupMigration
-
-# List of all migration classes (order doesn't matter, sorted by version automatically)
-ALL_MIGRATIONS: list[Type[Migration]] = [
-    ManifestDataFilesMigration,
-    SyncCheckMigration,
-    DisableBackupMigration,
+# All migration classes (order doesn't matter, sorted by version automatically)
+_MIGRATION_MODULES = [
+    "src.migrations.versions.v1_7_6_manifest_data_files:ManifestDataFilesMigration",
+    "src.migrations.versions.v1_7_7_sync_check:SyncCheckMigration",
+    "src.migrations.versions.v1_7_9_disable_backup:DisableBackupMigration",
 ]
+
+
+def get_all_migrations() -> list[Type[Migration]]:
+    """
+    Import and return all registered migration classes.
+
+    Returns:
+        List of Migration subclasses
+    """
+    migrations = []
+    for spec in _MIGRATION_MODULES:
+        module_name, class_name = spec.split(":")
+        module = importlib.import_module(module_name)
+        migrations.append(getattr(module, class_name))
+    return migrations
@@ -5,7 +5,10 @@ When upgrading to a new version, check if local data is out of sync
 with Gist and offer to pull missing data.
 """
 
+import os
 import sqlite3
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -14,6 +17,111 @@ from rich.console import Console
 from src.migrations.base import Migration, MigrationResult
 
 
+_MMAP_SIZE = 256 * 1024 * 1024  # bytes of each database to memory-map while counting
+_SQLITE_MAGIC = b"SQLite format 3\x00"
+# A size-based estimate only skips the exact count when it is far above the
+# Gist count. Row sizes differ between machines (folder/branch lengths,
+# indexes), so anything closer, including the whole 0.8-1.2x gray band
+# around the 10% tolerance, gets a real COUNT.
+_SKIP_COUNT_ESTIMATE_RATIO = 1.5
+
+
+def _used_bytes(db_path: Path) -> Optional[int]:
+    """
+    Get the bytes of a database file that hold live pages.
+
+    Reads only the 100-byte SQLite header, so free pages left behind by
+    deletes don't inflate size-based record estimates.
+
+    Args:
+        db_path: Path to a usage_history_*.db file
+
+    Returns:
+        File size minus freelist pages, or None if the file isn't a readable database
+    """
+    try:
+        with open(db_path, "rb") as f:
+            header = f.read(100)
+            size = os.fstat(f.fileno()).st_size
+    except OSError:
+        return None
+
+    if len(header) < 100 or not header.startswith(_SQLITE_MAGIC):
+        return None
+
+    page_size = int.from_bytes(header[16:18], "big")
+    if page_size == 1:
+        page_size = 65536
+    freelist_pages = int.from_bytes(header[36:40], "big")
+    return max(0, size - freelist_pages * page_size)
+
+
+def _fast_count(conn: sqlite3.Connection) -> int:
+    """
+    Get the (approximate) number of usage records in a machine database.
+
+    Uses the row count ANALYZE left in sqlite_stat1 when there is one, which
+    is good enough for the 10% tolerance check, and falls back to COUNT(*).
+
+    Args:
+        conn: Read-only connection to a usage_history_*.db file
+
+    Returns:
+        Number of rows in usage_records
+    """
+    try:
+        row = conn.execute(
+            "SELECT stat FROM sqlite_stat1 WHERE tbl = 'usage_records' LIMIT 1"
+        ).fetchone()
+        if row and row[0]:
+            return int(row[0].split()[0])
+    except (sqlite3.OperationalError, ValueError):
+        pass  # No statistics table, or an unexpected stat format
+
+    return conn.execute("SELECT COUNT(*) FROM usage_records").fetchone()[0]
+
+
+def _count_local_records(db_path: Path) -> int:
+    """
+    Count usage records in a machine database (read-only).
+
+    The database is opened with normal locking (no immutable=1): these files
+    live in cloud-synced folders and this machine's DB may be written
+    concurrently, so SQLite must still see locks and hot journals.
+
+    Args:
+        db_path: Path to a usage_history_*.db file
+
+    Returns:
+        Record count
+
+    Raises:
+        sqlite3.Error: If the database can't be read
+    """
+    uri = f"file:{db_path}?mode=ro"
+    with closing(sqlite3.connect(uri, uri=True, timeout=5.0)) as conn:
+        # Let a COUNT(*) fallback scan memory-mapped pages instead of
+        # issuing a read() per page
+        conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+        return _fast_count(conn)
+
+
+def _try_count_local_records(db_path: Path) -> tuple[Optional[int], Optional[str]]:
+    """
+    Count usage records, capturing the failure instead of raising.
+
+    Args:
+        db_path: Path to a usage_history_*.db file
+
+    Returns:
+        (record count, None) on success, (None, error message) on failure
+    """
+    try:
+        return _count_local_records(db_path), None
+    except Exception as e:
+        return None, str(e)
+
+
 class SyncCheckMigration(Migration):
     """
     Migration to check and fix data synchronization issues.
@@ -37,11 +145,8 @@ class SyncCheckMigration(Migration):
         Check sync status and pull missing data if needed.
         """
         try:
-            from src.sync.token_manager import TokenManager
-
             # Check if Gist sync is configured
-            token_manager = TokenManager()
-            if not token_manager.has_token():
+            if not self.get_context().has_gist_token():
                 return MigrationResult(
                     success=True,
                     message="Gist sync not configured, skipping sync check"
@@ -62,12 +167,11 @@ class SyncCheckMigration(Migration):
         """
         Check Gist manifest and sync missing data.
         """
-        from src.sync.sync_manager import SyncManager
         from src.config.user_config import get_machine_name
         from src.storage.snapshot_db import get_storage_dir
 
         console = Console()
-        sync_manager = SyncManager()
+        sync_manager = self.get_context().sync_manager
         current_machine = get_machine_name() or "Unknown"
         storage_dir = get_storage_dir()
 
@@ -84,30 +188,40 @@ class SyncCheckMigration(Migration):
 
             # Download manifest
             manifest = sync_manager._download_manifest()
-            machines = manifest.list_machines()
 
-            if not machines:
+            # Gist record counts per machine, in one pass over the manifest
+            # (get_machine() would rescan the list for every machine)
+            candidates = [
+                (machine["machine_name"], machine.get("total_records", 0))
+                for machine in manifest.data["machines"]
+            ]
+
+            if not candidates:
                 return MigrationResult(
                     success=True,
                     message="No machines in Gist manifest"
                 )
 
+            # One directory listing instead of an exists() check per machine
+            try:
+                with os.scandir(storage_dir) as entries:
+                    local_dbs = {
+                        entry.name: Path(entry.path) for entry in entries
+                        if entry.name.startswith("usage_history_") and entry.name.endswith(".db")
+                    }
+            except OSError:
+                local_dbs = {}
+
             # Check each machine's local data vs manifest
             machines_to_sync = []
+            to_count = []  # (machine_name, gist_records, local_db_path)
 
-            for machine_name in machines:
-                machine_info = manifest.get_machine(machine_name)
-                if not machine_info:
-                    continue
-
-                gist_records = machine_info.get("total_records", 0)
+            for machine_name, gist_records in candidates:
                 if gist_records == 0:
                     continue
 
-                # Check local database for this machine
-                local_db_path = storage_dir / f"usage_history_{machine_name}.db"
-
-                if not local_db_path.exists():
+                local_db_path = local_dbs.get(f"usage_history_{machine_name}.db")
+                if local_db_path is None:
                     # No local data for this machine
                     machines_to_sync.append({
                         "name": machine_name,
@@ -116,29 +230,71 @@ class SyncCheckMigration(Migration):
                         "missing": gist_records,
                     })
                 else:
-                    # Count local records
-                    try:
-                        conn = sqlite3.connect(f"file:{local_db_path}?mode=ro", uri=True, timeout=5.0)
-                        cursor = conn.cursor()
-                        cursor.execute("SELECT COUNT(*) FROM usage_records")
-                        local_records = cursor.fetchone()[0]
-                        conn.close()
-
-                        # If local has significantly fewer records, needs sync
-                        if local_records < gist_records * 0.9:  # 10% tolerance
-                            machines_to_sync.append({
-                                "name": machine_name,
-                                "local": local_records,
-                                "gist": gist_records,
-                                "missing": gist_records - local_records,
-                            })
-                    except Exception:
-                        pass
+                    to_count.append((machine_name, gist_records, local_db_path))
+
+            # Count local records. The smallest database is counted first to
+            # calibrate bytes per record; its fixed schema overhead biases the
+            # ratio high, so size-based estimates for the others err low. Only
+            # a database whose estimate is far above the Gist count is taken
+            # as in sync without being opened; all others are counted.
+            local_counts: dict[str, int] = {}
+            count_errors: dict[str, str] = {}
+
+            def record_count(machine_name: str, outcome: tuple[Optional[int], Optional[str]]) -> None:
+                count, error = outcome
+                if error is not None:
+                    count_errors[machine_name] = error
+                else:
+                    local_counts[machine_name] = count
+
+            if to_count:
+                used_bytes = {name: _used_bytes(path) for name, _, path in to_count}
+                to_count.sort(key=lambda task: used_bytes[task[0]] or 0)
+
+                first_name, _, first_path = to_count[0]
+                record_count(first_name, _try_count_local_records(first_path))
+                first_used = used_bytes[first_name]
+                first_count = local_counts.get(first_name)
+                bytes_per_record = first_used / first_count if first_used and first_count else None
+
+                remaining = [
+                    task for task in to_count[1:]
+                    if not (
+                        bytes_per_record and used_bytes[task[0]]
+                        and used_bytes[task[0]] / bytes_per_record >= task[1] * _SKIP_COUNT_ESTIMATE_RATIO
+                    )
+                ]
+
+                # Each machine has its own file, so the read-only counts run in parallel
+                if remaining:
+                    with ThreadPoolExecutor(max_workers=min(8, len(remaining))) as pool:
+                        outcomes = pool.map(lambda task: _try_count_local_records(task[2]), remaining)
+                        for task, outcome in zip(remaining, outcomes):
+                            record_count(task[0], outcome)
+
+                for machine_name, gist_records, _ in to_count:
+                    local_records = local_counts.get(machine_name)  # None: estimated in sync, or failed
+                    # If local has significantly fewer records, needs sync
+                    if local_records is not None and local_records < gist_records * 0.9:  # 10% tolerance
+                        machines_to_sync.append({
+                            "name": machine_name,
+                            "local": local_records,
+                            "gist": gist_records,
+                            "missing": gist_records - local_records,
+                        })
+
+            # A database that couldn't be counted isn't known to be in sync
+            for machine_name, error in count_errors.items():
+                console.print(f"[yellow]Warning: Could not count local records for {machine_name}: {error}[/yellow]")
+            unchecked_note = (
+                f" ({len(count_errors)} machine(s) could not be checked: {', '.join(sorted(count_errors))})"
+                if count_errors else ""
+            )
 
             if not machines_to_sync:
                 return MigrationResult(
                     success=True,
-                    message="All machines in sync"
+                    message=f"All checked machines in sync{unchecked_note}" if count_errors else "All machines in sync"
                 )
 
             # Show what needs syncing
@@ -154,12 +310,12 @@ class SyncCheckMigration(Migration):
             if stats.get("new_records", 0) > 0:
                 return MigrationResult(
                     success=True,
-                    message=f"Synced {stats['new_records']:,} records from {stats['machines_pulled']} machine(s)"
+                    message=f"Synced {stats['new_records']:,} records from {stats['machines_pulled']} machine(s)" + unchecked_note
                 )
             else:
                 return MigrationResult(
                     success=True,
-                    message="Sync check completed, no new records"
+                    message="Sync check completed, no new records" + unchecked_note
                 )
 
         except Exception as e:
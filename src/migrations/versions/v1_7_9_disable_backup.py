@@ -10,11 +10,18 @@ Changes:
 - Clear backup lists in manifest
 """
 
+import copy
+import re
+
 from rich.console import Console
 
 from src.migrations.base import Migration, MigrationResult
 
 
+# Backup filename format: usage_data_MACHINE_backup_YYYYMMDD.json
+_BACKUP_RE = re.compile(r"^usage_data_.+_backup_\d{8}\.json$")
+
+
 class DisableBackupMigration(Migration):
     """
     Migration to disable backup functionality and clean up existing backups.
@@ -26,6 +33,9 @@ class DisableBackupMigration(Migration):
     name = "Disable backup"
     description = "Clean up existing backup files from Gist and disable backup feature"
 
+    # Backup files deleted per Gist PATCH request
+    DELETE_BATCH_SIZE = 50
+
     def check_required(self) -> bool:
         """Always run this migration once."""
         return True
@@ -35,11 +45,8 @@ class DisableBackupMigration(Migration):
         Clean up existing backup files from Gist.
         """
         try:
-            from src.sync.token_manager import TokenManager
-
             # Check if Gist sync is configured
-            token_manager = TokenManager()
-            if not token_manager.has_token():
+            if not self.get_context().has_gist_token():
                 return MigrationResult(
                     success=True,
                     message="Gist sync not configured, skipping backup cleanup"
@@ -60,11 +67,10 @@ class DisableBackupMigration(Migration):
         """
         Delete all backup files from Gist and update manifest.
         """
-        from src.sync.sync_manager import SyncManager
         from src.sync.manifest import Manifest
 
         console = Console()
-        sync_manager = SyncManager()
+        sync_manager = self.get_context().sync_manager
         deleted_count = 0
 
         try:
@@ -78,15 +84,14 @@ class DisableBackupMigration(Migration):
                     )
                 sync_manager.gist_id = gist["id"]
 
-            # Get Gist files
-            gist = sync_manager.client.get_gist(sync_manager.gist_id)
-            files = gist.get("files", {})
+            # Get the Gist's file list. The file map is revalidated with its
+            # ETag, so after the sync check this is usually a bodyless 304.
+            # (The manifest's backup lists aren't used as the source: they can
+            # miss orphaned backups or name files that are already gone.)
+            files = sync_manager.client.get_file_metadata(sync_manager.gist_id)
 
-            # Find backup files (format: usage_data_MACHINE_backup_YYYYMMDD.json)
-            backup_files = [
-                filename for filename in files.keys()
-                if "_backup_" in filename and filename.endswith(".json")
-            ]
+            # Find backup files
+            backup_files = [filename for filename in files if _BACKUP_RE.match(filename)]
 
             if not backup_files:
                 return MigrationResult(
@@ -96,33 +101,58 @@ class DisableBackupMigration(Migration):
 
             console.print(f"\n[yellow]⚠ Found {len(backup_files)} backup file(s) to delete[/yellow]")
 
-            # Delete backup files
-            files_to_delete = {filename: None for filename in backup_files}
-            sync_manager.client.update_gist(sync_manager.gist_id, files_to_delete)
-            deleted_count = len(backup_files)
-
-            # Update manifest to clear backup lists and set retention to 0
+            # Read the manifest (from the cached Gist or its raw URL)
             try:
-                manifest = sync_manager._download_manifest()
-
-                # Clear all backup lists
-                for machine in manifest.data.get("machines", []):
-                    machine["backups"] = []
-
-                # Set backup retention to 0
-                manifest.data["backup_retention_days"] = 0
-
-                # Upload updated manifest
-                sync_manager.client.update_gist(
-                    sync_manager.gist_id,
-                    {Manifest.FILENAME: manifest.to_json()}
+                manifest = Manifest.from_json(
+                    sync_manager.client.get_file_content(sync_manager.gist_id, Manifest.FILENAME, cache=True)
                 )
             except Exception as e:
+                manifest = None
                 console.print(f"[yellow]Warning: Could not update manifest: {e}[/yellow]")
 
+            # Delete in bounded batches so one oversized or failed request
+            # doesn't lose the progress of the others; the manifest update
+            # rides along with the last batch. The fetched manifest itself is
+            # never modified, so a failed request can't drop its entries.
+            deleted: set[str] = set()
+            batches = [
+                backup_files[start:start + self.DELETE_BATCH_SIZE]
+                for start in range(0, len(backup_files), self.DELETE_BATCH_SIZE)
+            ]
+            for index, batch in enumerate(batches, start=1):
+                files_to_update = {filename: None for filename in batch}
+                is_last = index == len(batches)
+                if is_last and manifest is not None:
+                    all_deleted = len(deleted) + len(batch) == len(backup_files)
+                    files_to_update[Manifest.FILENAME] = self._cleared_manifest(
+                        manifest, deleted | set(batch), clear_all=all_deleted
+                    )
+
+                try:
+                    sync_manager.client.update_gist(sync_manager.gist_id, files_to_update)
+                    deleted.update(batch)
+                    if len(batches) > 1:
+                        console.print(f"  [dim]Deleted batch {index}/{len(batches)} ({len(deleted)} file(s))[/dim]")
+                except Exception as e:
+                    console.print(f"[yellow]Warning: Could not delete batch {index}/{len(batches)}: {e}[/yellow]")
+                    if is_last and manifest is not None and deleted:
+                        # Still record the batches that did go through
+                        try:
+                            sync_manager.client.update_gist(
+                                sync_manager.gist_id,
+                                {Manifest.FILENAME: self._cleared_manifest(manifest, deleted)}
+                            )
+                        except Exception as e:
+                            console.print(f"[yellow]Warning: Could not update manifest: {e}[/yellow]")
+
+            deleted_count = len(deleted)
+            message = f"Deleted {deleted_count} backup file(s) from Gist"
+            if deleted_count < len(backup_files):
+                message += f" ({len(backup_files) - deleted_count} could not be deleted)"
+
             return MigrationResult(
                 success=True,
-                message=f"Deleted {deleted_count} backup file(s) from Gist"
+                message=message
             )
 
         except Exception as e:
@@ -131,6 +161,31 @@ class DisableBackupMigration(Migration):
                 message=f"Backup cleanup error: {e}"
             )
 
+    @staticmethod
+    def _cleared_manifest(manifest, deleted: set[str], clear_all: bool = False) -> str:
+        """
+        Serialize a copy of the manifest with backups removed and retention set to 0.
+
+        Args:
+            manifest: Manifest read from the Gist (left unchanged)
+            deleted: Backup filenames that are (being) deleted
+            clear_all: Clear every machine's backup list, including stale
+                entries for files no longer in the Gist
+
+        Returns:
+            Manifest JSON
+        """
+        from src.sync.manifest import Manifest
+
+        cleared = Manifest(copy.deepcopy(manifest.data))
+        if clear_all:
+            for machine in cleared.data.get("machines", []):
+                machine["backups"] = []
+        else:
+            cleared.remove_backups(deleted)
+        cleared.set_backup_retention_days(0)
+        return cleared.to_json()
+
     def down(self) -> MigrationResult:
         """No rollback - backups are gone."""
         return MigrationResult(
@@ -1433,6 +1433,13 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
             ON usage_records(date, model)
         """)
 
+        # Composite index for machine + folder (covers the distinct device/project
+        # counts in Settings > Database Information with an index-only scan)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_usage_records_machine_folder
+            ON usage_records(machine_name, folder)
+        """)
+
         # Table for usage limits snapshots
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS limits_snapshots (
@@ -3284,6 +3291,41 @@ def delete_user_preferences(db_path: Path = DEFAULT_DB_PATH) -> None:
         conn.close()
 
 
+def clear_database(db_path: Path = DEFAULT_DB_PATH) -> None:
+    """
+    Drop every table in the database, compact the file and re-create the schema.
+
+    Used by Settings > Database Reset instead of deleting the .db file, so
+    OneDrive/iCloud sync one modified file rather than a delete followed by a
+    re-create. The result is an empty but fully initialized database, so
+    readers never see a file without tables.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Raises:
+        sqlite3.Error: If database operation fails
+    """
+    conn = sqlite3.connect(db_path, timeout=30.0)
+
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")
+        tables = [row[0] for row in cursor.fetchall()]
+
+        cursor.execute("BEGIN")
+        for table in tables:
+            cursor.execute(f'DROP TABLE IF EXISTS "{table}"')
+        conn.commit()
+
+        # VACUUM can't run inside a transaction
+        cursor.execute("VACUUM")
+    finally:
+        conn.close()
+
+    init_database(db_path)
+
+
 def load_all_devices_messages_by_hour(
     target_date: str,
     target_hour: int,
@@ -3985,6 +4027,7 @@ def check_data_sync_status() -> dict:
             'is_synced': bool,
             'source_latest': str or None,  # Latest timestamp from JSONL files
             'db_latest': str or None,      # Latest timestamp from DB
+            'db_latest_ts': datetime or None,  # db_latest parsed (timezone-aware)
             'source_count': int,           # Estimated record count from JSONL
             'db_count': int,               # Record count in DB
             'missing_records': int,        # Estimated missing records
@@ -3993,12 +4036,13 @@ def check_data_sync_status() -> dict:
     """
     from src.config.settings import get_claude_jsonl_files
     from src.data.jsonl_parser import parse_all_jsonl_files
-    from datetime import datetime
+    from datetime import datetime, timezone
 
     result = {
         'is_synced': False,
         'source_latest': None,
         'db_latest': None,
+        'db_latest_ts': None,
         'source_count': 0,
         'db_count': 0,
         'missing_records': 0,
@@ -4055,6 +4099,9 @@ def check_data_sync_status() -> dict:
             # Parse timestamps for comparison
             source_dt = datetime.fromisoformat(result['source_latest'].replace('Z', '+00:00'))
             db_dt = datetime.fromisoformat(result['db_latest'].replace('Z', '+00:00'))
+            if db_dt.tzinfo is None:
+                db_dt = db_dt.replace(tzinfo=timezone.utc)
+            result['db_latest_ts'] = db_dt
 
             # Allow 1 second tolerance for timestamp comparison
             time_diff = abs((source_dt - db_dt).total_seconds())
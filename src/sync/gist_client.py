@@ -2,9 +2,11 @@
 GitHub Gist API client for usage data synchronization.
 
 Uses GitHub REST API v3 for Gist operations.
-No external dependencies (uses requests library).
+Uses httpx (HTTP/2 when the h2 package is installed) if available,
+otherwise the requests library.
 """
 
+import importlib.util
 import json
 import time
 from typing import Any, Optional, TYPE_CHECKING
@@ -18,6 +20,18 @@ else:
     except ImportError:
         requests_module = None  # type: ignore
 
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore
+
+try:
+    import orjson  # Optional; much faster JSON serialization
+except ImportError:
+    orjson = None  # type: ignore
+
+_HTTP2_AVAILABLE = httpx is not None and importlib.util.find_spec("h2") is not None
+
 
 class GistClient:
     """
@@ -29,6 +43,12 @@ class GistClient:
     API_BASE = "https://api.github.com"
     MAX_RETRIES = 3
     RETRY_DELAY = 2  # seconds
+    CACHE_TTL = 60  # seconds to reuse Gist lookups
+    MAX_RATE_LIMIT_WAIT = 60  # seconds; longer waits fail instead of blocking the CLI
+    STREAM_CHUNK_SIZE = 64 * 1024  # bytes read at a time from streamed responses
+    MAX_RESPONSE_BYTES = 100 * 1024 * 1024  # largest streamed body accepted (a Gist's size limit)
+    MAX_CACHED_BODY_BYTES = 1024 * 1024  # larger raw bodies are never kept (the manifest is far smaller)
+    TIMEOUT = 30  # seconds (httpx only; its default of 5s is too short for large Gists)
 
     def __init__(self, token: str):
         """
@@ -38,10 +58,10 @@ class GistClient:
             token: GitHub Personal Access Token with 'gist' scope
 
         Raises:
-            ImportError: If requests library not installed
+            ImportError: If neither httpx nor requests is installed
             ValueError: If token is empty
         """
-        if requests_module is None:
+        if httpx is None and requests_module is None:
             raise ImportError(
                 "requests library required. Install with: pip install requests"
             )
@@ -50,12 +70,59 @@ class GistClient:
             raise ValueError("GitHub token is required")
 
         self.token = token
-        self.session = requests_module.Session()
-        self.session.headers.update({
+        headers = {
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json",
+            "Accept-Encoding": "gzip",
             "User-Agent": "claude-code-usage-analytics",
-        })
+        }
+        if httpx is not None:
+            # One pooled connection; HTTP/2 multiplexes concurrent calls over it
+            self.session = httpx.Client(
+                http2=_HTTP2_AVAILABLE,
+                headers=headers,
+                timeout=self.TIMEOUT,
+                follow_redirects=True,
+            )
+        else:
+            self.session = requests_module.Session()
+            self.session.headers.update(headers)
+
+        # Short-lived lookup caches: {key: (time.monotonic() when stored, gist)}
+        self._description_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._gist_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+        # Last Gist listing, revalidated with its ETag (a 304 has no body)
+        self._list_etag: Optional[str] = None
+        self._list_per_page: Optional[int] = None
+        self._gist_list: list[dict[str, Any]] = []
+        self._gist_index: dict[str, dict[str, Any]] = {}  # description -> first matching Gist
+
+        # File maps and raw file bodies, revalidated with their ETags. Only
+        # small bodies that callers ask to keep are cached (see get_file_content()).
+        self._file_meta: dict[str, tuple[Optional[str], dict[str, dict[str, Any]]]] = {}
+        self._raw_cache: dict[tuple[str, str], tuple[str, Optional[str], str]] = {}
+
+        # Rate limit state from the last API response (X-RateLimit-* headers)
+        self._rl_remaining: Optional[int] = None
+        self._rl_reset: float = 0.0  # epoch seconds
+
+    def _cache_get(self, cache: dict[str, tuple[float, dict[str, Any]]], key: str) -> Optional[dict[str, Any]]:
+        """Return a cached Gist if it is younger than CACHE_TTL, dropping expired ones."""
+        now = time.monotonic()
+        for stale in [k for k, (stored, _) in cache.items() if now - stored >= self.CACHE_TTL]:
+            del cache[stale]
+        entry = cache.get(key)
+        return entry[1] if entry is not None else None
+
+    def _invalidate_gist(self, gist_id: str) -> None:
+        """Drop cached data for a Gist that was changed or deleted."""
+        self._gist_cache.pop(gist_id, None)
+        self._file_meta.pop(gist_id, None)
+        self._list_etag = None
+        for description, (_, gist) in list(self._description_cache.items()):
+            if gist.get("id") == gist_id:
+                del self._description_cache[description]
 
     def create_gist(
         self,
@@ -102,8 +169,52 @@ class GistClient:
         Raises:
             RuntimeError: If Gist not found or API fails
         """
+        cached = self._cache_get(self._gist_cache, gist_id)
+        if cached is not None:
+            return cached
+
         response = self._request("GET", f"{self.API_BASE}/gists/{gist_id}")
-        return response.json()
+        gist = response.json()
+        self._remember_gist(gist_id, gist, response.headers.get("ETag"))
+        return gist
+
+    def _remember_gist(self, gist_id: str, gist: dict[str, Any], etag: Optional[str]) -> None:
+        """Cache a freshly fetched Gist and its file map."""
+        self._gist_cache[gist_id] = (time.monotonic(), gist)
+        self._file_meta[gist_id] = (etag, {
+            filename: {
+                "raw_url": file_data.get("raw_url"),
+                "size": file_data.get("size"),
+                "truncated": file_data.get("truncated", False),
+            }
+            for filename, file_data in gist.get("files", {}).items()
+        })
+
+    def get_file_metadata(self, gist_id: str) -> dict[str, dict[str, Any]]:
+        """
+        Get the file map of a Gist (filename -> raw_url, size, truncated).
+
+        A known map is revalidated with its ETag, so an unchanged Gist
+        costs a bodyless 304 instead of its full JSON.
+
+        Args:
+            gist_id: Gist ID
+
+        Returns:
+            Dictionary of {filename: {"raw_url", "size", "truncated"}}
+
+        Raises:
+            RuntimeError: If Gist not found or API fails
+        """
+        cached = self._file_meta.get(gist_id)
+        headers = {"If-None-Match": cached[0]} if cached and cached[0] else {}
+
+        response = self._request("GET", f"{self.API_BASE}/gists/{gist_id}", headers=headers)
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+
+        self._remember_gist(gist_id, response.json(), response.headers.get("ETag"))
+        return self._file_meta[gist_id][1]
 
     def update_gist(
         self,
@@ -140,6 +251,7 @@ class GistClient:
         if description is not None:
             payload["description"] = description
 
+        self._invalidate_gist(gist_id)
         response = self._request(
             "PATCH",
             f"{self.API_BASE}/gists/{gist_id}",
@@ -157,6 +269,7 @@ class GistClient:
         Raises:
             RuntimeError: If API request fails
         """
+        self._invalidate_gist(gist_id)
         self._request("DELETE", f"{self.API_BASE}/gists/{gist_id}")
 
     def list_gists(self, per_page: int = 100) -> list[dict[str, Any]]:
@@ -172,12 +285,27 @@ class GistClient:
         Raises:
             RuntimeError: If API request fails
         """
+        headers = {}
+        if self._list_etag and self._list_per_page == per_page:
+            headers["If-None-Match"] = self._list_etag
+
         response = self._request(
             "GET",
             f"{self.API_BASE}/gists",
-            params={"per_page": per_page}
+            params={"per_page": per_page},
+            headers=headers,
         )
-        return response.json()
+        if response.status_code == 304:
+            return list(self._gist_list)
+
+        gists = response.json()
+        self._list_etag = response.headers.get("ETag")
+        self._list_per_page = per_page
+        self._gist_list = gists
+        self._gist_index = {}
+        for gist in gists:
+            self._gist_index.setdefault(gist.get("description"), gist)
+        return list(gists)
 
     def find_gist_by_description(self, description: str) -> Optional[dict[str, Any]]:
         """
@@ -189,19 +317,81 @@ class GistClient:
         Returns:
             Gist data if found, None otherwise
         """
-        gists = self.list_gists()
-        for gist in gists:
-            if gist.get("description") == description:
-                return gist
-        return None
+        cached = self._cache_get(self._description_cache, description)
+        if cached is not None:
+            return cached
 
-    def get_file_content(self, gist_id: str, filename: str) -> str:
+        self.list_gists()
+        gist = self._gist_index.get(description)
+        if gist is not None:
+            self._description_cache[description] = (time.monotonic(), gist)
+        return gist
+
+    def get_file_content(self, gist_id: str, filename: str, cache: bool = False) -> str:
         """
         Get content of a specific file from Gist.
 
+        Uses a fresh cached Gist when there is one. Otherwise the file map
+        is revalidated and only the requested file is downloaded from its
+        raw URL. With cache=True a small body is kept and later downloads
+        are revalidated with its ETag; data files are not cached, so a pull
+        doesn't keep the whole Gist in memory.
+
         Args:
             gist_id: Gist ID
             filename: Filename
+            cache: Keep the body (if under MAX_CACHED_BODY_BYTES) for reuse
+
+        Returns:
+            File content as string
+
+        Raises:
+            RuntimeError: If file not found or API fails
+        """
+        cached = self._cache_get(self._gist_cache, gist_id)
+        if cached is not None:
+            return self.get_file_content_from(cached, filename)
+
+        files = self.get_file_metadata(gist_id)
+        if filename not in files:
+            raise RuntimeError(f"File '{filename}' not found in Gist")
+
+        # A 200 above refreshed the whole Gist, content included
+        cached = self._cache_get(self._gist_cache, gist_id)
+        raw_url = files[filename].get("raw_url")
+        if cached is not None or not raw_url:
+            return self.get_file_content_from(self.get_gist(gist_id), filename)
+
+        if not cache:
+            return self._read_text(self._request("GET", raw_url, stream=True))
+
+        key = (gist_id, filename)
+        raw_cached = self._raw_cache.get(key)
+        headers = {}
+        if raw_cached is not None and raw_cached[0] == raw_url and raw_cached[1]:
+            headers["If-None-Match"] = raw_cached[1]
+
+        response = self._request("GET", raw_url, headers=headers, stream=True)
+        if response.status_code == 304 and raw_cached is not None:
+            response.close()
+            return raw_cached[2]
+
+        text = self._read_text(response)
+        if len(text) <= self.MAX_CACHED_BODY_BYTES:
+            self._raw_cache[key] = (raw_url, response.headers.get("ETag"), text)
+        else:
+            self._raw_cache.pop(key, None)
+        return text
+
+    def get_file_content_from(self, gist: dict[str, Any], filename: str) -> str:
+        """
+        Get content of a file from already-fetched Gist data.
+
+        Only truncated files cost another request (to their raw URL).
+
+        Args:
+            gist: Gist data as returned by get_gist()
+            filename: Filename
 
         Returns:
             File content as string
@@ -209,7 +399,6 @@ class GistClient:
         Raises:
             RuntimeError: If file not found or API fails
         """
-        gist = self.get_gist(gist_id)
         files = gist.get("files", {})
 
         if filename not in files:
@@ -223,24 +412,69 @@ class GistClient:
         if is_truncated or not content:
             raw_url = file_data.get("raw_url")
             if raw_url:
-                response = self._request("GET", raw_url)
-                return response.text
+                return self._read_text(self._request("GET", raw_url, stream=True))
 
         return content or ""
 
+    def _read_text(self, response: Any) -> str:
+        """
+        Read a streamed response body in chunks and decode it.
+
+        Bodies over MAX_RESPONSE_BYTES are rejected, from Content-Length
+        up front when the server sends it, otherwise once reading passes it.
+
+        Args:
+            response: Response returned by _request(..., stream=True)
+
+        Returns:
+            Response body as text
+
+        Raises:
+            RuntimeError: If the body exceeds MAX_RESPONSE_BYTES
+        """
+        try:
+            declared = int(response.headers.get("Content-Length", 0))
+        except ValueError:
+            declared = 0
+        if declared > self.MAX_RESPONSE_BYTES:
+            response.close()
+            raise RuntimeError(
+                f"Response too large ({declared:,} bytes, limit {self.MAX_RESPONSE_BYTES:,})"
+            )
+
+        if httpx is not None:
+            chunks = response.iter_bytes(self.STREAM_CHUNK_SIZE)
+        else:
+            chunks = response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE)
+
+        body = bytearray()
+        try:
+            for chunk in chunks:
+                body += chunk
+                if len(body) > self.MAX_RESPONSE_BYTES:
+                    raise RuntimeError(
+                        f"Response too large (over {self.MAX_RESPONSE_BYTES:,} bytes)"
+                    )
+        finally:
+            response.close()
+        return body.decode(response.encoding or "utf-8", errors="replace")
+
     def _request(
         self,
         method: str,
         url: str,
+        stream: bool = False,
         **kwargs: Any
-    ) -> Any:  # returns requests.Response when available
+    ) -> Any:  # returns httpx.Response or requests.Response
         """
         Make HTTP request with retry logic.
 
         Args:
             method: HTTP method
             url: Request URL
-            **kwargs: Additional arguments for requests
+            stream: If True, don't read the body; the caller must read it
+                (see _read_text()) or close the response
+            **kwargs: Additional arguments for the HTTP client
 
         Returns:
             Response object
@@ -248,30 +482,88 @@ class GistClient:
         Raises:
             RuntimeError: If request fails after retries
         """
+        if orjson is not None and isinstance(kwargs.get("json"), dict):
+            # Serialize request bodies (e.g. large PATCH payloads) once, with orjson
+            body = orjson.dumps(kwargs.pop("json"))
+            kwargs["content" if httpx is not None else "data"] = body
+            kwargs["headers"] = {**kwargs.get("headers", {}), "Content-Type": "application/json"}
+
         for attempt in range(self.MAX_RETRIES):
+            self._wait_for_rate_limit()
             try:
-                response = self.session.request(method, url, **kwargs)
-
-                # Handle rate limiting
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", self.RETRY_DELAY))
-                    if attempt < self.MAX_RETRIES - 1:
-                        time.sleep(retry_after)
-                        continue
-
-                # Raise for HTTP errors
-                response.raise_for_status()
-                return response
-
+                if stream and httpx is not None:
+                    request = self.session.build_request(method, url, **kwargs)
+                    response = self.session.send(request, stream=True)
+                elif stream:
+                    response = self.session.request(method, url, stream=True, **kwargs)
+                else:
+                    response = self.session.request(method, url, **kwargs)
             except Exception as e:
+                # Connection errors and timeouts are worth retrying
                 if attempt < self.MAX_RETRIES - 1:
                     time.sleep(self.RETRY_DELAY * (attempt + 1))  # Exponential backoff
                     continue
-                else:
+                raise RuntimeError(f"GitHub API request failed: {e}") from e
+
+            self._update_rate_limit(response)
+
+            # Retry rate limiting and server errors; other 4xx fail immediately
+            if self._is_retryable(response) and attempt < self.MAX_RETRIES - 1:
+                response.close()
+                time.sleep(self._retry_delay(response, attempt))
+                continue
+
+            # Raise for HTTP errors (httpx would also raise on a 304)
+            if response.status_code >= 400:
+                try:
+                    response.raise_for_status()
+                except Exception as e:
+                    response.close()
                     raise RuntimeError(f"GitHub API request failed: {e}") from e
+            return response
 
         raise RuntimeError("Unexpected error in _request")
 
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep until the rate limit window resets if the last response used it up."""
+        if self._rl_remaining is None or self._rl_remaining > 0:
+            return
+        wait = self._rl_reset - time.time()
+        if 0 < wait <= self.MAX_RATE_LIMIT_WAIT:
+            time.sleep(wait)
+
+    def _update_rate_limit(self, response: Any) -> None:
+        """Record X-RateLimit-Remaining/Reset (raw file URLs do not send them)."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        try:
+            if remaining is not None:
+                self._rl_remaining = int(remaining)
+            if reset is not None:
+                self._rl_reset = float(reset)
+        except ValueError:
+            pass
+
+    def _is_retryable(self, response: Any) -> bool:
+        """Check if a response is a rate limit or server error worth retrying."""
+        status = response.status_code
+        if status == 429 or status >= 500:
+            return True
+        # GitHub reports an exhausted primary rate limit as 403
+        return status == 403 and self._rl_remaining == 0
+
+    def _retry_delay(self, response: Any, attempt: int) -> float:
+        """Seconds to wait before retrying: Retry-After, the rate limit reset, or backoff."""
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            pass
+        if self._rl_remaining == 0:
+            wait = self._rl_reset - time.time()
+            if 0 < wait <= self.MAX_RATE_LIMIT_WAIT:
+                return wait
+        return self.RETRY_DELAY * (attempt + 1)  # Exponential backoff
+
     def test_token(self) -> bool:
         """
         Test if token is valid.
@@ -280,7 +572,9 @@ class GistClient:
             True if token is valid
         """
         try:
-            response = self._request("GET", f"{self.API_BASE}/user")
+            # Only the status matters; don't download the profile body
+            response = self._request("GET", f"{self.API_BASE}/user", stream=True)
+            response.close()
             return response.status_code == 200
         except Exception:
             return False
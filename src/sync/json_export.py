@@ -5,15 +5,209 @@ This module NEVER modifies source databases in ~/.claude/.
 Exports are incremental and include statistics.
 """
 
+import gzip
 import json
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from src.config.user_config import get_machine_name
 from src.storage.snapshot_db import get_current_machine_db_path
 
+try:
+    import orjson  # Optional; much faster JSON serialization
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def _iter_usage_records(cursor: Any, since_date: Optional[str] = None) -> Iterator[dict[str, Any]]:
+    """
+    Yield usage records as export dicts, oldest first, one row at a time.
+
+    Args:
+        cursor: Database cursor (read-only connection)
+        since_date: Only include records on or after this date (YYYY-MM-DD)
+
+    Yields:
+        Record dictionaries
+    """
+    query = """
+        SELECT
+            session_id,
+            message_uuid,
+            timestamp,
+            model,
+            total_tokens,
+            input_tokens,
+            output_tokens,
+            cache_creation_tokens,
+            cache_read_tokens,
+            folder,
+            git_branch,
+            version,
+            date
+        FROM usage_records
+    """
+
+    params: tuple = ()
+    if since_date:
+        query += " WHERE date >= ?"
+        params = (since_date,)
+
+    query += " ORDER BY timestamp ASC"
+
+    cursor.execute(query, params)
+
+    for row in cursor:
+        yield {
+            "session_id": row[0],
+            "message_uuid": row[1],
+            "timestamp": row[2],
+            "model": row[3],
+            "total_tokens": row[4],
+            "input_tokens": row[5],
+            "output_tokens": row[6],
+            "cache_creation_tokens": row[7],
+            "cache_read_tokens": row[8],
+            "folder": row[9],
+            "git_branch": row[10],
+            "version": row[11],
+            "date": row[12],
+        }
+
+
+def _query_statistics(cursor: Any, since_date: Optional[str] = None) -> dict[str, Any]:
+    """
+    Compute export statistics (including total cost) in a single SQL query.
+
+    Args:
+        cursor: Database cursor (read-only connection)
+        since_date: Only include records on or after this date (YYYY-MM-DD)
+
+    Returns:
+        Statistics dictionary
+    """
+    params: tuple = (since_date,) if since_date else ()
+
+    # One pass for counts, token sums and cost; model_name is the pricing
+    # table's primary key, so the LEFT JOIN never duplicates records
+    stats_query = """
+        SELECT
+            COUNT(*) as total_records,
+            COUNT(DISTINCT ur.session_id) as total_sessions,
+            COALESCE(SUM(ur.total_tokens), 0) as total_tokens,
+            COALESCE(SUM(ur.input_tokens), 0) as input_tokens,
+            COALESCE(SUM(ur.output_tokens), 0) as output_tokens,
+            COALESCE(SUM(ur.cache_creation_tokens), 0) as cache_creation_tokens,
+            COALESCE(SUM(ur.cache_read_tokens), 0) as cache_read_tokens,
+            COALESCE(SUM(
+                (ur.input_tokens / 1000000.0) * COALESCE(mp.input_price_per_mtok, 0) +
+                (ur.output_tokens / 1000000.0) * COALESCE(mp.output_price_per_mtok, 0) +
+                (ur.cache_creation_tokens / 1000000.0) * COALESCE(mp.cache_write_price_per_mtok, 0) +
+                (ur.cache_read_tokens / 1000000.0) * COALESCE(mp.cache_read_price_per_mtok, 0)
+            ), 0.0) as total_cost
+        FROM usage_records ur
+        LEFT JOIN model_pricing mp ON ur.model = mp.model_name
+    """
+
+    if since_date:
+        stats_query += " WHERE ur.date >= ?"
+
+    cursor.execute(stats_query, params)
+    stats_row = cursor.fetchone()
+
+    return {
+        "total_records": stats_row[0],
+        "total_sessions": stats_row[1],
+        "total_tokens": stats_row[2],
+        "input_tokens": stats_row[3],
+        "output_tokens": stats_row[4],
+        "cache_creation_tokens": stats_row[5],
+        "cache_read_tokens": stats_row[6],
+        "total_cost": round(stats_row[7], 2),
+    }
+
+
+def _query_daily_snapshots(cursor: Any, since_date: Optional[str] = None) -> list[dict[str, Any]]:
+    """
+    Fetch daily_snapshots rows for full historical data sync.
+
+    Args:
+        cursor: Database cursor (read-only connection)
+        since_date: Only include snapshots on or after this date (YYYY-MM-DD)
+
+    Returns:
+        List of snapshot dictionaries, oldest first
+    """
+    snapshots_query = """
+        SELECT
+            date,
+            total_prompts,
+            total_responses,
+            total_sessions,
+            total_tokens,
+            input_tokens,
+            output_tokens,
+            cache_creation_tokens,
+            cache_read_tokens,
+            snapshot_timestamp
+        FROM daily_snapshots
+    """
+
+    snap_params: tuple = ()
+    if since_date:
+        snapshots_query += " WHERE date >= ?"
+        snap_params = (since_date,)
+
+    snapshots_query += " ORDER BY date ASC"
+
+    cursor.execute(snapshots_query, snap_params)
+
+    daily_snapshots = [
+        {
+            "date": row[0],
+            "total_prompts": row[1],
+            "total_responses": row[2],
+            "total_sessions": row[3],
+            "total_tokens": row[4],
+            "input_tokens": row[5],
+            "output_tokens": row[6],
+            "cache_creation_tokens": row[7],
+            "cache_read_tokens": row[8],
+            "snapshot_timestamp": row[9],
+        }
+        for row in cursor
+    ]
+    return daily_snapshots
+
+
+def iter_records(
+    db_path: Optional[Path] = None,
+    since_date: Optional[str] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Iterate over usage records without loading them all (READ-ONLY operation).
+
+    Args:
+        db_path: Path to database file (default: current machine DB)
+        since_date: Export only records after this date (YYYY-MM-DD)
+
+    Yields:
+        Record dictionaries, oldest first
+    """
+    if db_path is None:
+        db_path = get_current_machine_db_path()
+
+    if not db_path.exists():
+        return
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=30.0)
+    try:
+        yield from _iter_usage_records(conn.cursor(), since_date)
+    finally:
+        conn.close()
+
 
 def export_to_json(
     db_path: Optional[Path] = None,
@@ -66,52 +260,7 @@ def export_to_json(
     try:
         cursor = conn.cursor()
 
-        # Build query with optional date filter
-        query = """
-            SELECT
-                session_id,
-                message_uuid,
-                timestamp,
-                model,
-                total_tokens,
-                input_tokens,
-                output_tokens,
-                cache_creation_tokens,
-                cache_read_tokens,
-                folder,
-                git_branch,
-                version,
-                date
-            FROM usage_records
-        """
-
-        params: tuple = ()
-        if since_date:
-            query += " WHERE date >= ?"
-            params = (since_date,)
-
-        query += " ORDER BY timestamp ASC"
-
-        cursor.execute(query, params)
-
-        # Export records
-        records = []
-        for row in cursor:
-            records.append({
-                "session_id": row[0],
-                "message_uuid": row[1],
-                "timestamp": row[2],
-                "model": row[3],
-                "total_tokens": row[4],
-                "input_tokens": row[5],
-                "output_tokens": row[6],
-                "cache_creation_tokens": row[7],
-                "cache_read_tokens": row[8],
-                "folder": row[9],
-                "git_branch": row[10],
-                "version": row[11],
-                "date": row[12],
-            })
+        records = list(_iter_usage_records(cursor, since_date))
 
         # Get date range
         oldest_date = records[0]["date"] if records else None
@@ -129,93 +278,10 @@ def export_to_json(
 
         # Add statistics if requested
         if include_stats:
-            stats_query = """
-                SELECT
-                    COUNT(*) as total_records,
-                    COUNT(DISTINCT session_id) as total_sessions,
-                    COALESCE(SUM(total_tokens), 0) as total_tokens,
-                    COALESCE(SUM(input_tokens), 0) as input_tokens,
-                    COALESCE(SUM(output_tokens), 0) as output_tokens,
-                    COALESCE(SUM(cache_creation_tokens), 0) as cache_creation_tokens,
-                    COALESCE(SUM(cache_read_tokens), 0) as cache_read_tokens
-                FROM usage_records
-            """
-
-            if since_date:
-                stats_query += " WHERE date >= ?"
-
-            cursor.execute(stats_query, params)
-            stats_row = cursor.fetchone()
-
-            # Calculate total cost (join with model_pricing)
-            cost_query = """
-                SELECT COALESCE(SUM(
-                    (ur.input_tokens / 1000000.0) * COALESCE(mp.input_price_per_mtok, 0) +
-                    (ur.output_tokens / 1000000.0) * COALESCE(mp.output_price_per_mtok, 0) +
-                    (ur.cache_creation_tokens / 1000000.0) * COALESCE(mp.cache_write_price_per_mtok, 0) +
-                    (ur.cache_read_tokens / 1000000.0) * COALESCE(mp.cache_read_price_per_mtok, 0)
-                ), 0.0) as total_cost
-                FROM usage_records ur
-                LEFT JOIN model_pricing mp ON ur.model = mp.model_name
-            """
-
-            if since_date:
-                cost_query += " WHERE ur.date >= ?"
-
-            cursor.execute(cost_query, params)
-            cost_row = cursor.fetchone()
-
-            result["statistics"] = {
-                "total_records": stats_row[0],
-                "total_sessions": stats_row[1],
-                "total_tokens": stats_row[2],
-                "input_tokens": stats_row[3],
-                "output_tokens": stats_row[4],
-                "cache_creation_tokens": stats_row[5],
-                "cache_read_tokens": stats_row[6],
-                "total_cost": round(cost_row[0], 2),
-            }
+            result["statistics"] = _query_statistics(cursor, since_date)
 
         # Export daily_snapshots for full historical data sync
-        snapshots_query = """
-            SELECT
-                date,
-                total_prompts,
-                total_responses,
-                total_sessions,
-                total_tokens,
-                input_tokens,
-                output_tokens,
-                cache_creation_tokens,
-                cache_read_tokens,
-                snapshot_timestamp
-            FROM daily_snapshots
-        """
-
-        snap_params: tuple = ()
-        if since_date:
-            snapshots_query += " WHERE date >= ?"
-            snap_params = (since_date,)
-
-        snapshots_query += " ORDER BY date ASC"
-
-        cursor.execute(snapshots_query, snap_params)
-
-        daily_snapshots = []
-        for row in cursor:
-            daily_snapshots.append({
-                "date": row[0],
-                "total_prompts": row[1],
-                "total_responses": row[2],
-                "total_sessions": row[3],
-                "total_tokens": row[4],
-                "input_tokens": row[5],
-                "output_tokens": row[6],
-                "cache_creation_tokens": row[7],
-                "cache_read_tokens": row[8],
-                "snapshot_timestamp": row[9],
-            })
-
+        daily_snapshots = _query_daily_snapshots(cursor, since_date)
         if daily_snapshots:
             result["daily_snapshots"] = daily_snapshots
 
@@ -280,15 +346,35 @@ def export_to_json_chunked(
     try:
         cursor = conn.cursor()
 
-        # First, check total record count to estimate size
-        count_query = "SELECT COUNT(*) FROM usage_records"
-        params: tuple = ()
-        if since_date:
-            count_query += " WHERE date >= ?"
-            params = (since_date,)
-
-        cursor.execute(count_query, params)
-        total_count = cursor.fetchone()[0]
+        # Count records per month in one grouped pass: all records (split
+        # decisions use whole periods, keeping file names stable across
+        # incremental pushes) and those on or after since_date (what's exported).
+        # SQLite's date functions also supply each month's last day.
+        cursor.execute(
+            """
+            SELECT
+                substr(date, 1, 7) as year_month,
+                COUNT(*),
+                SUM(date >= ?),
+                date(substr(date, 1, 7) || '-01', '+1 month', '-1 day')
+            FROM usage_records
+            GROUP BY year_month
+            ORDER BY year_month
+            """,
+            (since_date or "",),
+        )
+        month_counts: dict[str, int] = {}
+        month_ends: dict[str, str] = {}
+        year_counts: dict[str, int] = {}
+        year_months = []
+        total_count = 0
+        for year_month, month_count, exported_count, month_end in cursor.fetchall():
+            month_counts[year_month] = month_count
+            month_ends[year_month] = month_end
+            year_counts[year_month[:4]] = year_counts.get(year_month[:4], 0) + month_count
+            if exported_count:
+                year_months.append(year_month)
+                total_count += exported_count
 
         estimated_size = total_count * ESTIMATED_BYTES_PER_RECORD
 
@@ -300,18 +386,6 @@ def export_to_json_chunked(
         # Calculate max records per file
         max_records_per_file = max_file_size // ESTIMATED_BYTES_PER_RECORD
 
-        # Get list of year-months in the data
-        period_query = """
-            SELECT DISTINCT substr(date, 1, 7) as year_month
-            FROM usage_records
-        """
-        if since_date:
-            period_query += " WHERE date >= ?"
-        period_query += " ORDER BY year_month"
-
-        cursor.execute(period_query, params)
-        year_months = [row[0] for row in cursor.fetchall()]
-
         if not year_months:
             return {"": export_to_json(db_path, since_date, include_stats=True)}
 
@@ -322,15 +396,7 @@ def export_to_json_chunked(
         export_date = datetime.now(timezone.utc).isoformat()
 
         for year in years:
-            # Count records for this year
-            count_year_query = """
-                SELECT COUNT(*) FROM usage_records
-                WHERE substr(date, 1, 4) = ?
-            """
-            cursor.execute(count_year_query, (year,))
-            year_count = cursor.fetchone()[0]
-
-            if year_count <= max_records_per_file:
+            if year_counts[year] <= max_records_per_file:
                 # Year fits in one file
                 year_data = _export_period(cursor, machine_name, export_date,
                                           f"{year}-01-01", f"{year}-12-31", since_date)
@@ -341,32 +407,12 @@ def export_to_json_chunked(
                 year_month_list = [ym for ym in year_months if ym.startswith(year)]
 
                 for year_month in year_month_list:
-                    y, m = year_month.split("-")
-
-                    # Count records for this month
-                    count_month_query = """
-                        SELECT COUNT(*) FROM usage_records
-                        WHERE substr(date, 1, 7) = ?
-                    """
-                    cursor.execute(count_month_query, (year_month,))
-                    month_count = cursor.fetchone()[0]
-
-                    # Get last day of month
-                    if m in ("01", "03", "05", "07", "08", "10", "12"):
-                        last_day = "31"
-                    elif m in ("04", "06", "09", "11"):
-                        last_day = "30"
-                    else:  # February
-                        yr = int(y)
-                        if yr % 4 == 0 and (yr % 100 != 0 or yr % 400 == 0):
-                            last_day = "29"
-                        else:
-                            last_day = "28"
-
-                    if month_count <= max_records_per_file:
+                    m = year_month[5:7]
+
+                    if month_counts[year_month] <= max_records_per_file:
                         # Month fits in one file
                         month_data = _export_period(cursor, machine_name, export_date,
-                                                   f"{year_month}-01", f"{year_month}-{last_day}",
+                                                   f"{year_month}-01", month_ends[year_month],
                                                    since_date)
                         if month_data:
                             result[f"_{year}_{m}"] = month_data
@@ -374,7 +420,7 @@ def export_to_json_chunked(
                         # Month is too large, split by chunk
                         chunks = _export_chunked_by_count(
                             cursor, machine_name, export_date,
-                            f"{year_month}-01", f"{year_month}-{last_day}",
+                            f"{year_month}-01", month_ends[year_month],
                             since_date, max_records_per_file
                         )
                         for chunk_num, chunk_data in enumerate(chunks, 1):
@@ -386,6 +432,67 @@ def export_to_json_chunked(
         conn.close()
 
 
+# Per-period queries, kept as constants so every month and chunk reuses the
+# connection's compiled statement instead of re-preparing the SQL
+_PERIOD_COUNT_SQL = "SELECT COUNT(*) FROM usage_records WHERE date >= ? AND date <= ?"
+
+_PERIOD_RECORDS_SQL = """
+    SELECT
+        session_id, message_uuid, timestamp, model,
+        total_tokens, input_tokens, output_tokens,
+        cache_creation_tokens, cache_read_tokens,
+        folder, git_branch, version, date
+    FROM usage_records
+    WHERE date >= ? AND date <= ?
+    ORDER BY timestamp ASC
+"""
+
+_PERIOD_STATS_SQL = """
+    SELECT
+        COUNT(*) as total_records,
+        COUNT(DISTINCT session_id) as total_sessions,
+        COALESCE(SUM(total_tokens), 0) as total_tokens,
+        COALESCE(SUM(input_tokens), 0) as input_tokens,
+        COALESCE(SUM(output_tokens), 0) as output_tokens
+    FROM usage_records
+    WHERE date >= ? AND date <= ?
+"""
+
+_PERIOD_SNAPSHOTS_SQL = """
+    SELECT
+        date, total_prompts, total_responses, total_sessions,
+        total_tokens, input_tokens, output_tokens,
+        cache_creation_tokens, cache_read_tokens, snapshot_timestamp
+    FROM daily_snapshots
+    WHERE date >= ? AND date <= ?
+    ORDER BY date ASC
+"""
+
+_CHUNK_PAGE_SQL = """
+    SELECT
+        session_id, message_uuid, timestamp, model,
+        total_tokens, input_tokens, output_tokens,
+        cache_creation_tokens, cache_read_tokens,
+        folder, git_branch, version, date, id
+    FROM usage_records
+    WHERE date >= ? AND date <= ? AND (timestamp, id) > (?, ?)
+    ORDER BY timestamp ASC, id ASC
+    LIMIT ?
+"""
+
+_CHUNK_STATS_SQL = """
+    SELECT
+        COUNT(*) as total_records,
+        COUNT(DISTINCT session_id) as total_sessions,
+        COALESCE(SUM(total_tokens), 0) as total_tokens,
+        COALESCE(SUM(input_tokens), 0) as input_tokens,
+        COALESCE(SUM(output_tokens), 0) as output_tokens
+    FROM usage_records
+    WHERE date >= ? AND date <= ?
+        AND (timestamp, id) > (?, ?) AND (timestamp, id) <= (?, ?)
+"""
+
+
 def _export_chunked_by_count(
     cursor: Any,
     machine_name: str,
@@ -414,56 +521,18 @@ def _export_chunked_by_count(
     if since_date and since_date > start_date:
         effective_start = since_date
 
-    # Fetch all records for the period
-    query = """
-        SELECT
-            session_id, message_uuid, timestamp, model,
-            total_tokens, input_tokens, output_tokens,
-            cache_creation_tokens, cache_read_tokens,
-            folder, git_branch, version, date
-        FROM usage_records
-        WHERE date >= ? AND date <= ?
-        ORDER BY timestamp ASC
-    """
-
-    cursor.execute(query, (effective_start, end_date))
+    # Count the period's records up front for the "n/total" chunk labels
+    cursor.execute(_PERIOD_COUNT_SQL, (effective_start, end_date))
+    total_records = cursor.fetchone()[0]
 
-    all_records = []
-    for row in cursor:
-        all_records.append({
-            "session_id": row[0],
-            "message_uuid": row[1],
-            "timestamp": row[2],
-            "model": row[3],
-            "total_tokens": row[4],
-            "input_tokens": row[5],
-            "output_tokens": row[6],
-            "cache_creation_tokens": row[7],
-            "cache_read_tokens": row[8],
-            "folder": row[9],
-            "git_branch": row[10],
-            "version": row[11],
-            "date": row[12],
-        })
-
-    if not all_records:
+    if not total_records:
         return []
 
     # Fetch daily_snapshots for the period (to include in first chunk only)
-    snapshots_query = """
-        SELECT
-            date, total_prompts, total_responses, total_sessions,
-            total_tokens, input_tokens, output_tokens,
-            cache_creation_tokens, cache_read_tokens, snapshot_timestamp
-        FROM daily_snapshots
-        WHERE date >= ? AND date <= ?
-        ORDER BY date ASC
-    """
-    cursor.execute(snapshots_query, (effective_start, end_date))
+    cursor.execute(_PERIOD_SNAPSHOTS_SQL, (effective_start, end_date))
 
-    daily_snapshots = []
-    for row in cursor:
-        daily_snapshots.append({
+    daily_snapshots = [
+        {
             "date": row[0],
             "total_prompts": row[1],
             "total_responses": row[2],
@@ -474,21 +543,45 @@ def _export_chunked_by_count(
             "cache_creation_tokens": row[7],
             "cache_read_tokens": row[8],
             "snapshot_timestamp": row[9],
-        })
+        }
+        for row in cursor
+    ]
 
-    # Split into chunks
+    # Page through the period with keyset pagination on (timestamp, id), so
+    # only one chunk of rows is fetched at a time, and let SQLite aggregate
+    # each chunk's statistics over the same key range
     chunks = []
-    total_chunks = (len(all_records) + max_records - 1) // max_records  # Ceiling division
+    total_chunks = (total_records + max_records - 1) // max_records  # Ceiling division
+    last_key: tuple[str, int] = ("", 0)  # Sorts before every real (timestamp, id)
 
-    for i in range(0, len(all_records), max_records):
-        chunk_records = all_records[i:i + max_records]
-        chunk_num = i // max_records + 1
+    for chunk_num in range(1, total_chunks + 1):
+        cursor.execute(_CHUNK_PAGE_SQL, (effective_start, end_date, *last_key, max_records))
+        rows = cursor.fetchall()
+        if not rows:
+            break
+
+        chunk_records = [
+            {
+                "session_id": row[0],
+                "message_uuid": row[1],
+                "timestamp": row[2],
+                "model": row[3],
+                "total_tokens": row[4],
+                "input_tokens": row[5],
+                "output_tokens": row[6],
+                "cache_creation_tokens": row[7],
+                "cache_read_tokens": row[8],
+                "folder": row[9],
+                "git_branch": row[10],
+                "version": row[11],
+                "date": row[12],
+            }
+            for row in rows
+        ]
 
-        # Calculate stats for this chunk
-        total_tokens = sum(r.get("total_tokens", 0) or 0 for r in chunk_records)
-        input_tokens = sum(r.get("input_tokens", 0) or 0 for r in chunk_records)
-        output_tokens = sum(r.get("output_tokens", 0) or 0 for r in chunk_records)
-        sessions = len(set(r["session_id"] for r in chunk_records))
+        first_key, last_key = last_key, (rows[-1][2], rows[-1][13])
+        cursor.execute(_CHUNK_STATS_SQL, (effective_start, end_date, *first_key, *last_key))
+        stats_row = cursor.fetchone()
 
         chunk_data = {
             "machine_name": machine_name,
@@ -496,16 +589,16 @@ def _export_chunked_by_count(
             "period": f"{start_date[:7]}",
             "chunk": f"{chunk_num}/{total_chunks}",
             "data_range": {
-                "oldest": chunk_records[0]["date"] if chunk_records else None,
-                "newest": chunk_records[-1]["date"] if chunk_records else None,
+                "oldest": chunk_records[0]["date"],
+                "newest": chunk_records[-1]["date"],
             },
             "records": chunk_records,
             "statistics": {
-                "total_records": len(chunk_records),
-                "total_sessions": sessions,
-                "total_tokens": total_tokens,
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens,
+                "total_records": stats_row[0],
+                "total_sessions": stats_row[1],
+                "total_tokens": stats_row[2],
+                "input_tokens": stats_row[3],
+                "output_tokens": stats_row[4],
             },
         }
 
@@ -545,23 +638,10 @@ def _export_period(
     if since_date and since_date > start_date:
         effective_start = since_date
 
-    # Build query
-    query = """
-        SELECT
-            session_id, message_uuid, timestamp, model,
-            total_tokens, input_tokens, output_tokens,
-            cache_creation_tokens, cache_read_tokens,
-            folder, git_branch, version, date
-        FROM usage_records
-        WHERE date >= ? AND date <= ?
-        ORDER BY timestamp ASC
-    """
-
-    cursor.execute(query, (effective_start, end_date))
+    cursor.execute(_PERIOD_RECORDS_SQL, (effective_start, end_date))
 
-    records = []
-    for row in cursor:
-        records.append({
+    records = [
+        {
             "session_id": row[0],
             "message_uuid": row[1],
             "timestamp": row[2],
@@ -575,23 +655,15 @@ def _export_period(
             "git_branch": row[10],
             "version": row[11],
             "date": row[12],
-        })
+        }
+        for row in cursor
+    ]
 
     if not records:
         return None
 
     # Get statistics
-    stats_query = """
-        SELECT
-            COUNT(*) as total_records,
-            COUNT(DISTINCT session_id) as total_sessions,
-            COALESCE(SUM(total_tokens), 0) as total_tokens,
-            COALESCE(SUM(input_tokens), 0) as input_tokens,
-            COALESCE(SUM(output_tokens), 0) as output_tokens
-        FROM usage_records
-        WHERE date >= ? AND date <= ?
-    """
-    cursor.execute(stats_query, (effective_start, end_date))
+    cursor.execute(_PERIOD_STATS_SQL, (effective_start, end_date))
     stats_row = cursor.fetchone()
 
     # Determine period label
@@ -619,20 +691,10 @@ def _export_period(
     }
 
     # Export daily_snapshots for this period
-    snapshots_query = """
-        SELECT
-            date, total_prompts, total_responses, total_sessions,
-            total_tokens, input_tokens, output_tokens,
-            cache_creation_tokens, cache_read_tokens, snapshot_timestamp
-        FROM daily_snapshots
-        WHERE date >= ? AND date <= ?
-        ORDER BY date ASC
-    """
-    cursor.execute(snapshots_query, (effective_start, end_date))
+    cursor.execute(_PERIOD_SNAPSHOTS_SQL, (effective_start, end_date))
 
-    daily_snapshots = []
-    for row in cursor:
-        daily_snapshots.append({
+    daily_snapshots = [
+        {
             "date": row[0],
             "total_prompts": row[1],
             "total_responses": row[2],
@@ -643,7 +705,9 @@ def _export_period(
             "cache_creation_tokens": row[7],
             "cache_read_tokens": row[8],
             "snapshot_timestamp": row[9],
-        })
+        }
+        for row in cursor
+    ]
 
     if daily_snapshots:
         result["daily_snapshots"] = daily_snapshots
@@ -651,30 +715,88 @@ def _export_period(
     return result
 
 
+def _dumps(obj: Any, pretty: bool) -> str:
+    """Serialize to JSON text (UTF-8, not ASCII-escaped), using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode("utf-8")
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _open_output(output_path: Path) -> Any:
+    """Open an export file for text writing, gzip-compressed if it ends in .gz."""
+    if output_path.suffix == ".gz":
+        return gzip.open(output_path, "wt", encoding="utf-8")
+    return output_path.open("w", encoding="utf-8")
+
+
 def save_json_export(
     output_path: Path,
     db_path: Optional[Path] = None,
     since_date: Optional[str] = None,
-    pretty: bool = True,
+    pretty: bool = False,
 ) -> None:
     """
     Export usage data to JSON file.
 
+    Records are streamed from the database to the file one at a time, so
+    memory use doesn't grow with the number of records.
+
     Args:
-        output_path: Path to output JSON file
+        output_path: Path to output JSON file (gzip-compressed if it ends in .gz)
         db_path: Path to database file (default: current machine DB)
         since_date: Export only records after this date
-        pretty: Pretty-print JSON (default: True)
+        pretty: Pretty-print JSON (default: False)
     """
-    data = export_to_json(db_path, since_date)
+    if db_path is None:
+        db_path = get_current_machine_db_path()
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with output_path.open("w", encoding="utf-8") as f:
-        if pretty:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        else:
-            json.dump(data, f, ensure_ascii=False)
+    if not db_path.exists():
+        with _open_output(output_path) as f:
+            f.write(_dumps(export_to_json(db_path, since_date), pretty))
+        return
+
+    header = {
+        "machine_name": get_machine_name() or "Unknown",
+        "export_date": datetime.now(timezone.utc).isoformat(),
+    }
+    newline, indent = ("\n", "  ") if pretty else ("", "")
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=30.0)
+    try:
+        cursor = conn.cursor()
+        oldest_date = newest_date = None
+
+        with _open_output(output_path) as f:
+            # Open the top-level object and the records array by hand
+            f.write(_dumps(header, pretty).rstrip()[:-1].rstrip())
+            f.write(f',{newline}{indent}"records": [')
+
+            for record in _iter_usage_records(cursor, since_date):
+                if oldest_date is None:
+                    oldest_date = record["date"]
+                else:
+                    f.write(",")
+                newest_date = record["date"]
+                record_json = _dumps(record, pretty).replace("\n", newline + indent * 2)
+                f.write(f"{newline}{indent * 2}{record_json}")
+
+            f.write(f"{newline}{indent}]" if oldest_date is not None else "]")
+
+            # The remaining members are written as one object minus its "{"
+            tail: dict[str, Any] = {
+                "data_range": {"oldest": oldest_date, "newest": newest_date},
+                "statistics": _query_statistics(cursor, since_date),
+            }
+            daily_snapshots = _query_daily_snapshots(cursor, since_date)
+            if daily_snapshots:
+                tail["daily_snapshots"] = daily_snapshots
+            f.write("," + _dumps(tail, pretty)[1:])
+    finally:
+        conn.close()
 
 
 def get_last_export_date(db_path: Optional[Path] = None) -> Optional[str]:
@@ -8,6 +8,11 @@ import json
 from datetime import datetime, timezone, timedelta
 from typing import Any, Optional
 
+try:
+    import orjson  # Optional; much faster JSON serialization
+except ImportError:
+    orjson = None  # type: ignore
+
 
 class Manifest:
     """
@@ -32,6 +37,14 @@ class Manifest:
             self.data = data
             self._validate()
 
+        # Bumped by every mutating method; to_json() reuses its output until then
+        self._revision = 0
+        self._json_cache: dict[bool, tuple[int, str]] = {}  # pretty -> (revision, JSON)
+
+    def _mark_changed(self) -> None:
+        """Invalidate the cached JSON after a change to self.data."""
+        self._revision += 1
+
     def _create_empty(self) -> dict[str, Any]:
         """Create empty manifest structure."""
         return {
@@ -97,6 +110,7 @@ class Manifest:
 
         self.data["machines"].append(entry)
         self.data["last_updated"] = datetime.now(timezone.utc).isoformat()
+        self._mark_changed()
 
     def get_data_files(self, machine_name: str) -> list[str]:
         """
@@ -156,6 +170,7 @@ class Manifest:
             machine["backups"].insert(0, backup_filename)  # Most recent first
 
         self.data["last_updated"] = datetime.now(timezone.utc).isoformat()
+        self._mark_changed()
 
     def get_old_backups(
         self,
@@ -211,6 +226,30 @@ class Manifest:
 
         machine["backups"] = [b for b in machine["backups"] if b != backup_filename]
         self.data["last_updated"] = datetime.now(timezone.utc).isoformat()
+        self._mark_changed()
+
+    def remove_backups(self, backup_filenames: set[str]) -> None:
+        """
+        Remove backups from every machine entry.
+
+        Args:
+            backup_filenames: Backup filenames to remove
+        """
+        for machine in self.data["machines"]:
+            if "backups" in machine:
+                machine["backups"] = [b for b in machine["backups"] if b not in backup_filenames]
+        self.data["last_updated"] = datetime.now(timezone.utc).isoformat()
+        self._mark_changed()
+
+    def set_backup_retention_days(self, days: int) -> None:
+        """
+        Set the backup retention period (0 disables backups).
+
+        Args:
+            days: Number of days to keep backups
+        """
+        self.data["backup_retention_days"] = days
+        self._mark_changed()
 
     def get_last_sync_date(self, machine_name: str) -> Optional[str]:
         """
@@ -251,16 +290,30 @@ class Manifest:
         """
         Convert manifest to JSON string.
 
+        The result is cached until the next mutating method call; code that
+        edits self.data directly must go through those methods instead.
+
         Args:
             pretty: Pretty-print JSON
 
         Returns:
             JSON string
         """
-        if pretty:
-            return json.dumps(self.data, indent=2, ensure_ascii=False)
+        cached = self._json_cache.get(pretty)
+        if cached is not None and cached[0] == self._revision:
+            return cached[1]
+
+        if orjson is not None:
+            # orjson always emits UTF-8, matching ensure_ascii=False
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            text = orjson.dumps(self.data, option=option).decode("utf-8")
+        elif pretty:
+            text = json.dumps(self.data, indent=2, ensure_ascii=False)
         else:
-            return json.dumps(self.data, ensure_ascii=False)
+            text = json.dumps(self.data, ensure_ascii=False)
+
+        self._json_cache[pretty] = (self._revision, text)
+        return text
 
     @classmethod
     def from_json(cls, json_str: str) -> "Manifest":
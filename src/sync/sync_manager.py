@@ -181,8 +181,9 @@ class SyncManager:
             )
 
         # 10. Upload manifest separately
-        self.client.update_gist(self.gist_id, {Manifest.FILENAME: manifest.to_json()})
+        updated_gist = self.client.update_gist(self.gist_id, {Manifest.FILENAME: manifest.to_json()})
         stats["manifest_updated"] = True
+        stats["gist_url"] = updated_gist.get("html_url")
         stats["files_uploaded"] = uploaded_count
 
         if files_to_delete:
@@ -361,7 +362,7 @@ class SyncManager:
             Manifest instance
         """
         try:
-            json_str = self.client.get_file_content(self.gist_id, Manifest.FILENAME)
+            json_str = self.client.get_file_content(self.gist_id, Manifest.FILENAME, cache=True)
             return Manifest.from_json(json_str)
         except Exception:
             # Manifest doesn't exist, create new one
@@ -5,6 +5,7 @@ Supports auto-detection of system timezone and manual timezone selection.
 All data is stored in UTC and converted to local timezone only for display.
 """
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from typing import Optional
 
@@ -196,10 +197,13 @@ def list_common_timezones() -> list[dict]:
     return [get_timezone_info(tz) for tz in common_tzs]
 
 
+@lru_cache(maxsize=256)
 def validate_timezone(tz_name: str) -> bool:
     """
     Check if a timezone name is valid.
 
+    Results are memoized since IANA names never change validity within a process.
+
     Args:
         tz_name: IANA timezone name to validate
 